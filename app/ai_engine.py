@@ -4,10 +4,12 @@ import re
 import json
 from groq import Groq
 from story_summarizer import StorySummarizer
+from save_format import find_save_path, is_save_file, read_save, read_save_header, save_epoch, write_save
 from integration.reality_data import RealityData
 import datetime
 import blessed
 import random
+from operator import itemgetter
 
 # Configuration
 GROQ_API_KEY = os.environ.get("GROQ_API_KEY")
@@ -75,8 +77,10 @@ class StoryEngine:
         self.reality_data = RealityData(debug=False)  # Force debug off for reality data
         self.summary_count = 0  # Track number of summaries performed
         self.save_id = None  # Current save identifier
+        self._has_saves = False  # Set once a save file has been seen; cleared when a corrupt save is moved aside
         self.term = blessed.Terminal()  # Add terminal for visual effects
         self.typewriter_active = False  # Flag to track if typewriter animation is currently playing
+        self.typewriter_tick = 0.02  # Default delay between typewriter characters, in seconds
         
         # Enhanced color scheme for better sci-fi aesthetics
         self.text_color = self.term.teal  # Main text color
@@ -101,10 +105,13 @@ class StoryEngine:
         # Bottom border
         print(self.term.move_xy(x, y+height-1) + "╚" + "═" * (width-2) + "╝")
     
-    def typewriter_effect(self, text, delay=0.02, style=None, glitch_chance=0.005, x=None, y=None):
+    def typewriter_effect(self, text, delay=None, style=None, glitch_chance=0.005, x=None, y=None):
         """Advanced typewriter effect with occasional glitches for sci-fi immersion"""
         self.typewriter_active = True  # Set the flag that typewriter is active
         
+        if delay is None:
+            delay = self.typewriter_tick
+        
         if style is None:
             style = self.text_color
         
@@ -257,14 +264,13 @@ class StoryEngine:
             
             # If format is correct and we have at least 3 choices, enhance with reality glitches
             if has_story and has_choices and choice_count >= 3:
-                # Extract the story part and enhance it with reality glitches
+                # Extract the story part and tidy its whitespace
                 story_match = re.search(r'Story:(.*?)(?:Choices:|$|\n\d+\.)', content, re.DOTALL)
                 if story_match:
                     story_text = story_match.group(1).strip()
-                    enhanced_story_text = self.reality_data.enhance_story(story_text)
                     
-                    # Replace the original story with the enhanced one
-                    content = content.replace(story_match.group(0), f"Story: {enhanced_story_text}")
+                    # Replace the original story with the tidied one
+                    content = content.replace(story_match.group(0), f"Story: {story_text}")
                 
                 return content
                 
@@ -297,14 +303,13 @@ DO NOT use placeholder text in brackets. Replace with actual content.
             
             retry_content = retry_response.choices[0].message.content
             
-            # Extract and enhance the story part if available
+            # Extract and tidy the story part if available
             story_match = re.search(r'Story:(.*?)(?:Choices:|$|\n\d+\.)', retry_content, re.DOTALL)
             if story_match:
                 story_text = story_match.group(1).strip()
-                enhanced_story_text = self.reality_data.enhance_story(story_text)
                 
-                # Replace the original story with the enhanced one
-                retry_content = retry_content.replace(story_match.group(0), f"Story: {enhanced_story_text}")
+                # Replace the original story with the tidied one
+                retry_content = retry_content.replace(story_match.group(0), f"Story: {story_text}")
             
             # If second attempt still lacks proper format, force it
             if "Story:" not in retry_content or "Choices:" not in retry_content:
@@ -313,12 +318,9 @@ DO NOT use placeholder text in brackets. Replace with actual content.
                 if not story_text.strip():
                     story_text = "The aliens look at you expectantly, their device flickering with an otherworldly glow."
                 
-                # Enhance the story with reality glitches
-                enhanced_story_text = self.reality_data.enhance_story(story_text)
-                
                 # Create forced format
                 forced_content = f"""
-Story: {enhanced_story_text.strip()}
+Story: {story_text.strip()}
 
 Choices:
 1. Try to communicate with the aliens
@@ -763,11 +765,10 @@ Choices:
         
         # List all json files in the save directory
         for filename in os.listdir(SAVE_DIR):
-            if filename.endswith('.json'):
+            if is_save_file(filename):
                 filepath = os.path.join(SAVE_DIR, filename)
                 try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        save_data = json.load(f)
+                    save_data = read_save_header(filepath)
                     
                     # Extract save metadata or use defaults
                     save_id = os.path.splitext(filename)[0]
@@ -779,6 +780,7 @@ Choices:
                         'id': save_id,
                         'filename': filename,
                         'timestamp': timestamp,
+                        'ts_epoch': save_epoch(save_data),
                         'title': title,
                         'summary': summary
                     })
@@ -787,7 +789,7 @@ Choices:
                         print(f"Error reading save file {filename}: {e}")
         
         # Sort by timestamp (newest first)
-        saves.sort(key=lambda x: x['timestamp'], reverse=True)
+        saves.sort(key=itemgetter('ts_epoch'), reverse=True)
         return saves
     
     def generate_save_id(self):
@@ -811,7 +813,7 @@ Choices:
             self.save_id = save_id
             
             # Determine save path
-            filepath = os.path.join(SAVE_DIR, f"{save_id}.json")
+            filepath = find_save_path(SAVE_DIR, save_id)
             
             # Ensure the directory exists
             os.makedirs(SAVE_DIR, exist_ok=True)
@@ -824,34 +826,33 @@ Choices:
             
             # Get current timestamp - ensure this is set for all saves
             current_timestamp = datetime.datetime.now().isoformat()
+            current_epoch = time.time()
             
             # Load existing save data if it exists
             if os.path.exists(filepath):
-                with open(filepath, 'r+', encoding='utf-8') as f:
-                    existing_state = json.load(f)
-                    last_saved_index = existing_state.get('last_saved_index', 0)
-                    
-                    # Prepare new messages to append
-                    new_messages = self.messages[last_saved_index:]
-                    
-                    # Update last saved index
-                    last_saved_index = len(self.messages)
-                    
-                    # Append new messages to the existing state
-                    existing_state['messages'].extend(new_messages)
-                    existing_state['last_saved_index'] = last_saved_index
-                    
-                    # IMPORTANT: Always update current_story and current_choices to reflect current game state
-                    existing_state['current_story'] = self.current_story
-                    existing_state['current_choices'] = self.current_choices
-                    existing_state['choices_preview'] = "\n\nCurrent choices:\n" + "\n".join([f"- {choice}" for choice in self.current_choices])
-                    
-                    # Always update timestamp when saving
-                    existing_state['timestamp'] = current_timestamp
-                    
-                    f.seek(0)
-                    json.dump(existing_state, f, ensure_ascii=False, indent=2)
-                    f.truncate()
+                existing_state = read_save(filepath)
+                last_saved_index = existing_state.get('last_saved_index', 0)
+                
+                # Prepare new messages to append
+                new_messages = self.messages[last_saved_index:]
+                
+                # Update last saved index
+                last_saved_index = len(self.messages)
+                
+                # Append new messages to the existing state
+                existing_state['messages'].extend(new_messages)
+                existing_state['last_saved_index'] = last_saved_index
+                
+                # IMPORTANT: Always update current_story and current_choices to reflect current game state
+                existing_state['current_story'] = self.current_story
+                existing_state['current_choices'] = self.current_choices
+                existing_state['choices_preview'] = "\n\nCurrent choices:\n" + "\n".join([f"- {choice}" for choice in self.current_choices])
+                
+                # Always update timestamp when saving
+                existing_state['timestamp'] = current_timestamp
+                existing_state['ts_epoch'] = current_epoch
+                
+                write_save(filepath, existing_state)
             else:
                 # If no existing file, create a new state
                 state = {
@@ -860,14 +861,15 @@ Choices:
                     "current_choices": self.current_choices,
                     "summary_count": self.summary_count,
                     "timestamp": current_timestamp,
+                    "ts_epoch": current_epoch,
                     "title": title or f"Reality Glitch - {datetime.datetime.now().strftime('%Y-%m-%d %H:%M')}",
                     "summary": "Cosmic horror adventure in progress...",
                     "choices_preview": "\n\nCurrent choices:\n" + "\n".join([f"- {choice}" for choice in self.current_choices]),
                     "save_id": save_id,
                     "last_saved_index": len(self.messages)
                 }
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(state, f, ensure_ascii=False, indent=2)
+                write_save(filepath, state)
+            self._has_saves = True
             
             # Print save location for reference
             if self.debug:
@@ -911,102 +913,97 @@ Choices:
                             return False
             
             # Determine file path from save_id
-            filepath = os.path.join(SAVE_DIR, f"{save_id}.json")
+            filepath = find_save_path(SAVE_DIR, save_id)
             
             if not os.path.exists(filepath):
                 print(f"\033[33mSave file does not exist: {os.path.abspath(filepath)}\033[0m")
                 return False
             
-            with open(filepath, 'r+', encoding='utf-8') as f:
-                state = json.load(f)
-                
-                # Check for legacy save format
-                if 'last_saved_index' not in state:
-                    # Assume all messages are new if last_saved_index is missing
-                    state['last_saved_index'] = len(state['messages'])
-                    f.seek(0)
-                    json.dump(state, f, ensure_ascii=False, indent=2)
-                    f.truncate()
-                    if self.debug:
-                        print("Updated legacy save format with last_saved_index.")
-                
-                # Validate the state has the required fields
-                required_fields = ["messages", "current_story", "current_choices"]
-                if not all(key in state for key in required_fields):
-                    print("\033[31mSave file is missing required fields\033[0m")
-                    return False
+            state = read_save(filepath)
+            
+            # Check for legacy save format
+            if 'last_saved_index' not in state:
+                # Assume all messages are new if last_saved_index is missing
+                state['last_saved_index'] = len(state['messages'])
+                write_save(filepath, state)
+                if self.debug:
+                    print("Updated legacy save format with last_saved_index.")
+            
+            # Validate the state has the required fields
+            required_fields = ["messages", "current_story", "current_choices"]
+            if not all(key in state for key in required_fields):
+                print("\033[31mSave file is missing required fields\033[0m")
+                return False
+            
+            # Apply the loaded state (keeping full history)
+            self.messages = state["messages"]
+            
+            # IMPORTANT: Verify that current_story and current_choices match the last message exchange
+            # If they don't match, reconstruct them from the message history
+            if len(self.messages) >= 2:
+                last_assistant_message = None
+                last_user_message = None
                 
-                # Apply the loaded state (keeping full history)
-                self.messages = state["messages"]
+                # Find the last assistant message with story and choices
+                for i in range(len(self.messages) - 1, 0, -1):
+                    msg = self.messages[i]
+                    if msg["role"] == "assistant" and "Story:" in msg["content"] and "Choices:" in msg["content"]:
+                        last_assistant_message = msg
+                        break
+                    elif msg["role"] == "user" and last_user_message is None:
+                        last_user_message = msg
                 
-                # IMPORTANT: Verify that current_story and current_choices match the last message exchange
-                # If they don't match, reconstruct them from the message history
-                if len(self.messages) >= 2:
-                    last_assistant_message = None
-                    last_user_message = None
+                # If we found a valid last message, extract story and choices from it
+                if last_assistant_message:
+                    # Parse the story and choices from the last assistant message
+                    extracted_story, extracted_choices = self.parse_response(last_assistant_message["content"])
                     
-                    # Find the last assistant message with story and choices
-                    for i in range(len(self.messages) - 1, 0, -1):
-                        msg = self.messages[i]
-                        if msg["role"] == "assistant" and "Story:" in msg["content"] and "Choices:" in msg["content"]:
-                            last_assistant_message = msg
-                            break
-                        elif msg["role"] == "user" and last_user_message is None:
-                            last_user_message = msg
+                    # Update the current state to match the last message
+                    self.current_story = extracted_story
+                    self.current_choices = extracted_choices
                     
-                    # If we found a valid last message, extract story and choices from it
-                    if last_assistant_message:
-                        # Parse the story and choices from the last assistant message
-                        extracted_story, extracted_choices = self.parse_response(last_assistant_message["content"])
+                    # Also update the state in the file for consistency, but don't change timestamp
+                    need_to_update = False
+                    if state.get('current_story') != extracted_story:
+                        state['current_story'] = extracted_story
+                        need_to_update = True
                         
-                        # Update the current state to match the last message
-                        self.current_story = extracted_story
-                        self.current_choices = extracted_choices
+                    if state.get('current_choices') != extracted_choices:
+                        state['current_choices'] = extracted_choices
+                        state['choices_preview'] = "\n\nCurrent choices:\n" + "\n".join([f"- {choice}" for choice in extracted_choices])
+                        need_to_update = True
                         
-                        # Also update the state in the file for consistency, but don't change timestamp
-                        need_to_update = False
-                        if state.get('current_story') != extracted_story:
-                            state['current_story'] = extracted_story
-                            need_to_update = True
-                            
-                        if state.get('current_choices') != extracted_choices:
-                            state['current_choices'] = extracted_choices
-                            state['choices_preview'] = "\n\nCurrent choices:\n" + "\n".join([f"- {choice}" for choice in extracted_choices])
-                            need_to_update = True
-                            
-                        # Only update the file if necessary, and don't touch the timestamp
-                        if need_to_update:
-                            f.seek(0)
-                            json.dump(state, f, ensure_ascii=False, indent=2)
-                            f.truncate()
-                    else:
-                        # If we couldn't extract from messages, use what's in the file
-                        self.current_story = state["current_story"]
-                        self.current_choices = state["current_choices"]
+                    # Only update the file if necessary, and don't touch the timestamp
+                    if need_to_update:
+                        write_save(filepath, state)
                 else:
-                    # Use the values from the file if not enough messages
+                    # If we couldn't extract from messages, use what's in the file
                     self.current_story = state["current_story"]
                     self.current_choices = state["current_choices"]
-                
-                # Load summary count if available (for backward compatibility)
-                if "summary_count" in state:
-                    self.summary_count = state["summary_count"]
-                else:
-                    # If no summary count, estimate based on message count
-                    self.summary_count = len(state["messages"]) // 10
-                
-                # Store the current save_id
-                self.save_id = save_id
-                
-                # Note: We no longer update the timestamp during load
-                # This was causing timestamps to change when loading, when they should
-                # only change when saving
-                
-                if self.debug:
-                    print(f"Successfully loaded story from: {os.path.abspath(filepath)}")
-                    print(f"Loaded {len(self.messages)} messages from save file")
-                
-                return True
+            else:
+                # Use the values from the file if not enough messages
+                self.current_story = state["current_story"]
+                self.current_choices = state["current_choices"]
+            
+            # Load summary count if available (for backward compatibility)
+            if "summary_count" in state:
+                self.summary_count = state["summary_count"]
+            else:
+                # If no summary count, estimate based on message count
+                self.summary_count = len(state["messages"]) // 10
+            
+            # Store the current save_id
+            self.save_id = save_id
+            
+            # Note: We no longer update the timestamp during load
+            # This was causing timestamps to change when loading, when they should
+            # only change when saving
+            
+            if self.debug:
+                print(f"Successfully loaded story from: {os.path.abspath(filepath)}")
+                print(f"Loaded {len(self.messages)} messages from save file")
+            
+            return True
         except Exception as e:
             print(f"\033[31mError loading story: {e}\033[0m")
             if 'filepath' in locals():
@@ -1015,14 +1012,19 @@ Choices:
             
     def has_saved_story(self):
         """Check if any saved stories exist"""
+        # F9/F10 ask on every press, so skip the directory scan once a save is known
+        if self._has_saves:
+            return True
+        
         # Ensure save directory exists
         os.makedirs(SAVE_DIR, exist_ok=True)
         
-        # Check if there are any .json files in the save directory
+        # Check if there are any save files in the save directory
         for filename in os.listdir(SAVE_DIR):
-            if filename.endswith('.json'):
+            if is_save_file(filename):
                 if self.debug:
                     print(f"Found save file: {filename}")
+                self._has_saves = True
                 return True
         
         # For backward compatibility, check the old default save file
@@ -1033,7 +1035,7 @@ Choices:
             # Copy old save to new location with a generated ID
             try:
                 save_id = self.generate_save_id()
-                new_path = os.path.join(SAVE_DIR, f"{save_id}.json")
+                new_path = find_save_path(SAVE_DIR, save_id)
                 
                 with open(old_default, 'r', encoding='utf-8') as f:
                     state = json.load(f)
@@ -1048,12 +1050,12 @@ Choices:
                 if 'save_id' not in state:
                     state['save_id'] = save_id
                 
-                with open(new_path, 'w', encoding='utf-8') as f:
-                    json.dump(state, f, ensure_ascii=False, indent=2)
+                write_save(new_path, state)
                 
                 if self.debug:
                     print(f"Migrated old save to: {os.path.abspath(new_path)}")
                 
+                self._has_saves = True
                 return True
             except Exception as e:
                 if self.debug:
@@ -1,5 +1,5 @@
 from db.db_utils import DatabaseConnection, update_last_sync_time
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
 class DatabaseOperations:
@@ -123,4 +123,57 @@ class DatabaseOperations:
         ORDER BY timestamp DESC
         LIMIT 1
         """
-        return self.db.fetch_one(query) 
\ No newline at end of file
+        return self.db.fetch_one(query)
+    
+    def get_latest_all(self) -> Optional[Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]], List[Dict[str, Any]], Optional[datetime]]]:
+        """
+        Get the latest Bitcoin, weather and stock market data and the last sync time in a single query.
+        
+        Each source is returned as JSON, so numbers come back as floats and
+        timestamps as ISO strings rather than Decimal and datetime values.
+        
+        Returns:
+            Tuple: (bitcoin, weather, stocks, last_sync) with the same rows as
+            get_latest_bitcoin_data, get_latest_weather_data and get_latest_stock_data
+            and the same time as get_last_sync_time, or None if the database
+            could not be read
+        """
+        query = """
+        WITH RankedData AS (
+            SELECT 
+                symbol, 
+                price, 
+                change, 
+                volume, 
+                timestamp,
+                ROW_NUMBER() OVER (PARTITION BY symbol ORDER BY timestamp DESC) as rn
+            FROM fmp_index_data
+            WHERE symbol IN ('^IXIC', '^RUT', '^NYA', '^SPX', '^DJI')
+        )
+        SELECT
+            (SELECT row_to_json(b) FROM (
+                SELECT price_usd, percent_change_1h, percent_change_24h, last_updated
+                FROM coinmarket_bitcoin_data
+                ORDER BY timestamp DESC
+                LIMIT 1
+            ) b) AS bitcoin,
+            (SELECT row_to_json(w) FROM (
+                SELECT location_name, region, country, latitude, longitude, location_time,
+                       temperature_c, wind_kph, wind_direction, humidity, feels_like_c, 
+                       uv_index, last_updated
+                FROM weather_data
+                ORDER BY timestamp DESC
+                LIMIT 1
+            ) w) AS weather,
+            (SELECT COALESCE(json_agg(s ORDER BY s.symbol), '[]'::json) FROM (
+                SELECT symbol, price, change, volume, timestamp
+                FROM RankedData
+                WHERE rn = 1
+            ) s) AS stocks,
+            (SELECT timestamp FROM last_sync ORDER BY id DESC LIMIT 1) AS last_sync
+        """
+        result = self.db.fetch_one(query)
+        # The query always returns a row, so no row means the read failed
+        if not result:
+            return None
+        return result.get('bitcoin'), result.get('weather'), result.get('stocks') or [], result.get('last_sync')
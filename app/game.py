@@ -1,10 +1,21 @@
 import sys
+import asyncio
 from datetime import datetime, timedelta
 import blessed
 import os
 import re
+import select
+from dataclasses import dataclass
 import time
 import random
+import functools
+import bisect
+
+try:
+    import termios
+except ImportError:  # Windows has no termios; fall back to msvcrt
+    termios = None
+    import msvcrt
 
 # Import refactored modules
 from ui import UIRenderer, MenuRenderer, AnimationManager
@@ -18,7 +29,88 @@ from integration.wrapper_weather import WeatherAPI
 from db.db_operations import DatabaseOperations
 from integration.sync_apis import SyncApis
 from ai_engine import StoryEngine, SAVE_DIR
-from integration.reality_data import RealityData
+
+# Prompt shown at the bottom of the data screens
+FOOTER = "Press any key to continue..."
+
+# Shown instead of an error while the startup sync is still running
+SYNCING_MSG = "Syncing cosmic fragments... Reality will stabilize shortly."
+
+# Glitch levels in increasing severity and the color attribute used for each
+GLITCH_LEVELS = ("STABLE", "MINOR", "MODERATE", "SEVERE")
+GLITCH_COLOR_ATTRS = ("text_color", "highlight", "warning", "error")
+
+# Boundaries between glitch levels: a value above the nth threshold is level n+1
+BTC_THRESHOLDS = (1, 3, 7)  # Absolute 1h Bitcoin change, in percent
+STOCK_THRESHOLDS = (0.5, 1.5, 3)  # Absolute average index change, in percent
+HOT_THRESHOLDS = (25, 30, 35)  # Temperature in °C
+COLD_THRESHOLDS = (-10, 0, 5)  # Temperature in °C; below the nth threshold is level 3-n
+
+@dataclass(frozen=True)
+class FragmentSpec:
+    """Describes one reality fragment screen (bitcoin, stocks, weather)."""
+    title: str  # Screen title
+    data_title: str  # Title of the data box
+    width: int  # Width of the data box
+    cache_key: str  # Key of the loaded data in the screen data cache
+    ttl: int  # Seconds the loaded data stays cached
+    loader: str  # DatabaseOperations method that loads the data
+    layout: str  # RealityGlitchGame method that lays out the data rows and glitch status
+    glitch_key: str  # Category in the reality glitches
+    fallback_event: str  # Cosmic message when there are no glitch events
+    error_msg: str  # Shown when the data can't be loaded
+
+BITCOIN_FRAGMENT = FragmentSpec(
+    title="BITCOIN REALITY FRAGMENT",
+    data_title="BITCOIN DATA",
+    width=40,
+    cache_key="bitcoin",
+    ttl=30,
+    loader="get_latest_bitcoin_data",
+    layout="_bitcoin_layout",
+    glitch_key="bitcoin",
+    fallback_event="The digital currency fluctuates in the cosmic void...",
+    error_msg="ERROR: Unable to fetch BTC data. Reality might be glitching...",
+)
+
+STOCKS_FRAGMENT = FragmentSpec(
+    title="STOCK MARKET REALITY FRAGMENT",
+    data_title="MARKET INDICES",
+    width=50,
+    cache_key="stocks",
+    ttl=60,
+    loader="get_latest_stock_data",
+    layout="_stocks_layout",
+    glitch_key="stocks",
+    fallback_event="The market indices pulse with cosmic energy...",
+    error_msg="ERROR: Unable to fetch stock market data. Reality might be glitching...",
+)
+
+WEATHER_FRAGMENT = FragmentSpec(
+    title="WEATHER REALITY FRAGMENT",
+    data_title="WEATHER DATA",
+    width=50,
+    cache_key="weather",
+    ttl=300,
+    loader="get_latest_weather_data",
+    layout="_weather_layout",
+    glitch_key="weather",
+    fallback_event="The weather patterns shift like cosmic tides...",
+    error_msg="ERROR: Unable to fetch weather data. Reality might be glitching...",
+)
+
+def _pick(items, fallback=None):
+    """Pick a random item from a sequence or set, or return fallback when there are none."""
+    return random.choice(tuple(items)) if items else fallback
+
+@functools.lru_cache(maxsize=128)
+def _format_ts(value):
+    """Format a stored timestamp for display, keeping the original if it can't be parsed."""
+    try:
+        dt = value if isinstance(value, datetime) else datetime.fromisoformat(str(value))
+        return dt.strftime("%d/%m/%Y %H:%M:%S")
+    except (ValueError, TypeError):
+        return value
 
 class RealityGlitchGame:        
     def __init__(self, debug=False):
@@ -34,7 +126,7 @@ class RealityGlitchGame:
         self.animation_manager = AnimationManager(self.term)
         
         # Initialize game state manager
-        self.game_state = GameState(story_engine=self.story_engine, debug=debug)
+        self.game_state = GameState(story_engine=self.story_engine, debug=debug, sync=False)
         
         # Initialize save manager
         self.save_manager = SaveManager(save_dir=SAVE_DIR, story_engine=self.story_engine)
@@ -57,11 +149,29 @@ class RealityGlitchGame:
         self.load_menu_active = False
         self.current_saves = []
         self.menu_selection = 0
-        self.reality_data = RealityData(debug=debug)
+        # Share the story engine's reality data so glitches are built once
+        self.reality_data = self.story_engine.reality_data
+        
+        # Terminal width of the frame being drawn and the cached footer sequence
+        self._tw = self.term.width
+        self._footer_size = None
+        self._footer_seq = ""
+        
+        # Cursor moves repeat on every visit to a screen, so cache the strings
+        self._move_xy = functools.lru_cache(maxsize=4096)(self.term.move_xy)
         self.db_ops = DatabaseOperations()
         
-        # Check if this is the first run and sync with APIs if needed
-        self.game_state.check_and_sync()
+        # Recently loaded screen data, keyed by name: (load time, value)
+        self._cache = {}
+        
+        # Sync with the APIs in the background so the intro animation hides the wait
+        self.game_state.start_background_sync(on_done=self._sync_done)
+    
+    def _sync_done(self):
+        """Drop data cached before the startup sync finished."""
+        self.invalidate()
+        # Rebuild the glitches from the synced data without blocking the UI
+        self.reality_data.refresh_in_background()
     
     def display_welcome(self):
         """Display the welcome message with clean terminal aesthetics."""
@@ -94,131 +204,13 @@ class RealityGlitchGame:
         # This method should delegate to the key handler to avoid duplicate logic
         self.key_handler.handle_story_choice(key)
     
-    def bitcoin(self):
-        """Check and display current Bitcoin price and changes with reality glitch indicators."""
-        # Clear screen
-        print(self.term.clear)
-        
-        # Title
-        title = "BITCOIN REALITY FRAGMENT"
-        title_x = (self.term.width - len(title)) // 2
-        print(self.term.move_xy(title_x, 2) + self.text_color + title + self.term.normal)
-        
-        btc_data = self.db_ops.get_latest_bitcoin_data()
-        if btc_data:
-            # Center the content
-            content_width = 40
-            x = (self.term.width - content_width) // 2
-            y = 4
-            
-            # Format timestamp
-            try:
-                if isinstance(btc_data["last_updated"], datetime):
-                    dt = btc_data["last_updated"]
-                else:
-                    dt = datetime.strptime(str(btc_data["last_updated"]), "%Y-%m-%d %H:%M:%S.%f")
-                formatted_time = dt.strftime("%d/%m/%Y %H:%M:%S")
-                last_updated = formatted_time
-            except (ValueError, TypeError) as e:
-                # Keep original timestamp if formatting fails
-                last_updated = btc_data["last_updated"]
-            
-            # Draw a box around the content
-            self.draw_box(x, y, content_width, 8, "BITCOIN DATA")
-            
-            # Display data with proper formatting
-            price = btc_data["price_usd"]
-            change_1h = btc_data["percent_change_1h"]
-            change_24h = btc_data["percent_change_24h"]
-            
-            # Determine color for price changes
-            change_1h_color = self.term.green if change_1h >= 0 else self.term.red
-            change_24h_color = self.term.green if change_24h >= 0 else self.term.red
-            
-            # Format the changes with + or - sign
-            change_1h_str = f"+{change_1h:.2f}%" if change_1h >= 0 else f"{change_1h:.2f}%"
-            change_24h_str = f"+{change_24h:.2f}%" if change_24h >= 0 else f"{change_24h:.2f}%"
-            
-            # Display the data
-            print(self.term.move_xy(x + 2, y + 2) + self.highlight + f"BTC Price: " + self.term.normal + f"${price:,.2f}")
-            print(self.term.move_xy(x + 2, y + 3) + self.highlight + f"1h Change: " + self.term.normal + change_1h_color + change_1h_str + self.term.normal)
-            print(self.term.move_xy(x + 2, y + 4) + self.highlight + f"24h Change: " + self.term.normal + change_24h_color + change_24h_str + self.term.normal)
-            print(self.term.move_xy(x + 2, y + 5) + self.highlight + f"Last Updated: " + self.term.normal + self.dim + last_updated + self.term.normal)
-            
-            # Get reality glitches for bitcoin
-            self.reality_data.refresh_data()
-            glitches = self.reality_data.get_reality_glitches()
-            bitcoin_glitches = glitches["bitcoin"]
-            
-            # Create a glitch status indicator
-            glitch_title = "REALITY GLITCH STATUS"
-            glitch_box_width = 60
-            glitch_box_x = (self.term.width - glitch_box_width) // 2
-            glitch_box_y = y + 10
-            
-            # Determine glitch intensity based on price change
-            glitch_level = "STABLE"
-            glitch_color = self.text_color
-            
-            if abs(change_1h) > 7:
-                glitch_level = "SEVERE"
-                glitch_color = self.error
-            elif abs(change_1h) > 3:
-                glitch_level = "MODERATE"
-                glitch_color = self.warning
-            elif abs(change_1h) > 1:
-                glitch_level = "MINOR"
-                glitch_color = self.highlight
-            
-            # Draw glitch status box
-            self.draw_box(glitch_box_x, glitch_box_y, glitch_box_width, 5, glitch_title)
-            
-            # Display glitch status
-            print(self.term.move_xy(glitch_box_x + 2, glitch_box_y + 2) + 
-                  self.highlight + f"Status: " + glitch_color + glitch_level + self.term.normal)
-            
-            # Display a random glitch descriptor if available
-            if bitcoin_glitches["descriptors"]:
-                descriptor = random.choice(bitcoin_glitches["descriptors"])
-                print(self.term.move_xy(glitch_box_x + 2, glitch_box_y + 3) + 
-                      self.highlight + f"Effect: " + glitch_color + descriptor.capitalize() + self.term.normal)
-            
-            # Add a cosmic message
-            if bitcoin_glitches["events"]:
-                cosmic_msg = random.choice(bitcoin_glitches["events"])
-            else:
-                cosmic_msg = "The digital currency fluctuates in the cosmic void..."
-            
-            msg_x = (self.term.width - len(cosmic_msg)) // 2
-            print(self.term.move_xy(msg_x, glitch_box_y + 7) + self.text_color + cosmic_msg + self.term.normal)
-            
-            # Show story impact note
-            impact_msg = "This data will influence your story experience..."
-            impact_x = (self.term.width - len(impact_msg)) // 2
-            print(self.term.move_xy(impact_x, glitch_box_y + 9) + self.dim + impact_msg + self.term.normal)
-        else:
-            # Error message
-            error_msg = "ERROR: Unable to fetch BTC data. Reality might be glitching..."
-            error_x = (self.term.width - len(error_msg)) // 2
-            print(self.term.move_xy(error_x, 5) + self.error + error_msg + self.term.normal)
-        
-        # Footer
-        footer = "Press any key to continue..."
-        footer_x = (self.term.width - len(footer)) // 2
-        print(self.term.move_xy(footer_x, self.term.height - 2) + self.dim + footer + self.term.normal)
-        
-        # Wait for key press
-        self.term.inkey()
-        
-        # Redraw the main menu
-        self.display_welcome()
-    
     def trigger_panic(self):
         """Trigger a panic event that causes multiple reality glitches."""
         self.animation_manager.trigger_panic_animation()
         
-        # Force a refresh of reality data in the story engine
-        self.story_engine.reality_data.refresh_data()
+        # Force a refresh of reality data (this also drops the glitch snapshot)
+        self.reality_data.refresh_data()
+        self.invalidate()
         
         # Redraw the appropriate screen
         if self.story_mode:
@@ -226,249 +218,83 @@ class RealityGlitchGame:
         else:
             self.display_welcome()
     
+    def bitcoin(self):
+        """Check and display current Bitcoin price and changes with reality glitch indicators."""
+        self._render_fragment(BITCOIN_FRAGMENT)
+    
     def stocks(self):
         """Check and display current stock market indices with reality glitch indicators."""
-        # Clear screen
-        print(self.term.clear)
-        
-        # Title
-        title = "STOCK MARKET REALITY FRAGMENT"
-        title_x = (self.term.width - len(title)) // 2
-        print(self.term.move_xy(title_x, 2) + self.text_color + title + self.term.normal)
-        
-        indices_data = self.db_ops.get_latest_stock_data()
-        if indices_data:
-            # Center the content
-            content_width = 50
-            x = (self.term.width - content_width) // 2
-            y = 4
-            
-            # Format timestamp
-            try:
-                if isinstance(indices_data[0]["timestamp"], datetime):
-                    dt = indices_data[0]["timestamp"]
-                else:
-                    dt = datetime.strptime(str(indices_data[0]["timestamp"]), "%Y-%m-%d %H:%M:%S.%f")
-                formatted_time = dt.strftime("%d/%m/%Y %H:%M:%S")
-                last_updated = formatted_time
-            except (ValueError, TypeError) as e:
-                # Keep original timestamp if formatting fails
-                last_updated = indices_data[0]["timestamp"]
-            
-            # Draw a box around the content
-            self.draw_box(x, y, content_width, len(indices_data) * 2 + 3, "MARKET INDICES")
-            
-            # Display last updated time
-            print(self.term.move_xy(x + 2, y + 2) + self.highlight + f"Last Updated: " + self.term.normal + self.dim + last_updated + self.term.normal)
-            
-            # Track avg market change for glitch intensity
-            total_change_pct = 0
-            count = 0
-            
-            # Display each index
-            for i, index in enumerate(indices_data):
-                symbol = index["symbol"]
-                price = index["price"]
-                change = index["change"]
-                
-                # Calculate percentage of change relative to price
-                percentage = (change / price) * 100 if price else 0
-                total_change_pct += percentage
-                count += 1
-                
-                percentage_str = f"+{percentage:.2f}%" if percentage >= 0 else f"{percentage:.2f}%"
-                
-                # Determine color for price changes
-                change_color = self.term.green if percentage >= 0 else self.term.red
-                
-                # Display the index data
-                print(self.term.move_xy(x + 2, y + 3 + i * 2) + self.highlight + f"{symbol}: " + self.term.normal + f"${price:,.2f}")
-                print(self.term.move_xy(x + 2, y + 4 + i * 2) + self.highlight + f"Change: " + self.term.normal + change_color + percentage_str + self.term.normal)
-            
-            # Get reality glitches for stocks
-            self.reality_data.refresh_data()
-            glitches = self.reality_data.get_reality_glitches()
-            stock_glitches = glitches["stocks"]
-            
-            # Calculate average market change
-            avg_change = total_change_pct / count if count > 0 else 0
-            
-            # Create a glitch status indicator
-            glitch_title = "REALITY GLITCH STATUS"
-            glitch_box_width = 60
-            glitch_box_x = (self.term.width - glitch_box_width) // 2
-            glitch_box_y = y + len(indices_data) * 2 + 5
-            
-            # Determine glitch level based on average market change and volatility
-            glitch_level = "STABLE"
-            glitch_color = self.text_color
-            
-            if abs(avg_change) > 3:
-                glitch_level = "SEVERE"
-                glitch_color = self.error
-            elif abs(avg_change) > 1.5:
-                glitch_level = "MODERATE"
-                glitch_color = self.warning
-            elif abs(avg_change) > 0.5:
-                glitch_level = "MINOR"
-                glitch_color = self.highlight
-            
-            # Add volatility indicator
-            volatility_text = stock_glitches["volatility"].upper()
-            
-            # Draw glitch status box
-            self.draw_box(glitch_box_x, glitch_box_y, glitch_box_width, 6, glitch_title)
-            
-            # Display glitch status
-            print(self.term.move_xy(glitch_box_x + 2, glitch_box_y + 2) + 
-                  self.highlight + f"Status: " + glitch_color + glitch_level + self.term.normal)
-            
-            # Display market direction
-            direction_text = stock_glitches["market_direction"].replace("_", " ").upper()
-            print(self.term.move_xy(glitch_box_x + 2, glitch_box_y + 3) + 
-                  self.highlight + f"Market Direction: " + glitch_color + direction_text + self.term.normal)
-            
-            # Display volatility
-            print(self.term.move_xy(glitch_box_x + 2, glitch_box_y + 4) + 
-                  self.highlight + f"Volatility: " + glitch_color + volatility_text + self.term.normal)
-            
-            # Add a cosmic message
-            if stock_glitches["events"]:
-                cosmic_msg = random.choice(stock_glitches["events"])
-            else:
-                cosmic_msg = "The market indices pulse with cosmic energy..."
-            
-            msg_x = (self.term.width - len(cosmic_msg)) // 2
-            print(self.term.move_xy(msg_x, glitch_box_y + 8) + self.text_color + cosmic_msg + self.term.normal)
-            
-            # Show story impact note
-            impact_msg = "This data will influence your story experience..."
-            impact_x = (self.term.width - len(impact_msg)) // 2
-            print(self.term.move_xy(impact_x, glitch_box_y + 10) + self.dim + impact_msg + self.term.normal)
-        else:
-            # Error message
-            error_msg = "ERROR: Unable to fetch stock market data. Reality might be glitching..."
-            error_x = (self.term.width - len(error_msg)) // 2
-            print(self.term.move_xy(error_x, 5) + self.error + error_msg + self.term.normal)
-        
-        # Footer
-        footer = "Press any key to continue..."
-        footer_x = (self.term.width - len(footer)) // 2
-        print(self.term.move_xy(footer_x, self.term.height - 2) + self.dim + footer + self.term.normal)
-        
-        # Wait for key press
-        self.term.inkey()
-        
-        # Redraw the main menu
-        self.display_welcome()
+        self._render_fragment(STOCKS_FRAGMENT)
     
     def weather(self):
         """Check and display current weather data with reality glitch indicators."""
-        # Clear screen
-        print(self.term.clear)
+        self._render_fragment(WEATHER_FRAGMENT)
+    
+    def _render_fragment(self, spec):
+        """Display one reality fragment screen and wait for a key.
+        
+        Args:
+            spec: FragmentSpec describing the screen
+        """
+        # Build the whole screen in one buffer, starting with a clear,
+        # and cache the terminal width for this frame
+        buf = [self.term.clear]
+        self._tw = self.term.width
+        normal = self.term.normal
         
         # Title
-        title = "WEATHER REALITY FRAGMENT"
-        title_x = (self.term.width - len(title)) // 2
-        print(self.term.move_xy(title_x, 2) + self.text_color + title + self.term.normal)
-        
-        weather_data = self.db_ops.get_latest_weather_data()
-        if weather_data:
-            # Center the content
-            content_width = 50
-            x = (self.term.width - content_width) // 2
+        buf.append(self._center(spec.title, 2) + self.text_color + spec.title + normal)
+        
+        data = self._cached(spec.cache_key, spec.ttl, getattr(self.db_ops, spec.loader))
+        if data:
+            # Bind values shared by every line of the display
+            move_xy = self._move_xy
+            highlight = self.highlight
+            
+            # Lay out the data rows and the glitch status for this screen
+            glitches = self.reality_data.get_snapshot()[spec.glitch_key]
+            rows, level, status_rows = getattr(self, spec.layout)(data, glitches)
+            glitch_level, glitch_color = self._glitch_status(level)
+            status_rows = [("Status: ", glitch_level)] + status_rows
+            
+            # Draw a centered box around the data
+            x = (self._tw - spec.width) // 2
             y = 4
+            box_height = len(rows) + 3
+            buf.append(self.ui_renderer.draw_box(x, y, spec.width, box_height, spec.data_title))
+            for i, (label, value, style) in enumerate(rows):
+                buf.append(move_xy(x + 2, y + 2 + i) + highlight + label + normal + style + value + normal)
             
-            # Format timestamp
-            try:
-                if isinstance(weather_data['last_updated'], datetime):
-                    dt = weather_data['last_updated']
-                else:
-                    dt = datetime.strptime(str(weather_data['last_updated']), "%Y-%m-%d %H:%M:%S.%f")
-                formatted_time = dt.strftime("%d/%m/%Y %H:%M:%S")
-                last_updated = formatted_time
-            except (ValueError, TypeError) as e:
-                # Keep original timestamp if formatting fails
-                last_updated = weather_data['last_updated']
-            
-            # Draw a box around the content
-            self.draw_box(x, y, content_width, 9, "WEATHER DATA")
-            
-            # Display the data
-            print(self.term.move_xy(x + 2, y + 2) + self.highlight + f"Location: " + self.term.normal + f"{weather_data['location_name']}, {weather_data['region']}, {weather_data['country']}")
-            print(self.term.move_xy(x + 2, y + 3) + self.highlight + f"Temperature: " + self.term.normal + f"{weather_data['temperature_c']}°C (feels like {weather_data['feels_like_c']}°C)")
-            print(self.term.move_xy(x + 2, y + 4) + self.highlight + f"Wind: " + self.term.normal + f"{weather_data['wind_kph']} km/h {weather_data['wind_direction']}")
-            print(self.term.move_xy(x + 2, y + 5) + self.highlight + f"Humidity: " + self.term.normal + f"{weather_data['humidity']}%")
-            print(self.term.move_xy(x + 2, y + 6) + self.highlight + f"UV Index: " + self.term.normal + f"{weather_data['uv_index']}")
-            print(self.term.move_xy(x + 2, y + 7) + self.highlight + f"Last Updated: " + self.term.normal + self.dim + last_updated + self.term.normal)
-            
-            # Get reality glitches for weather
-            self.reality_data.refresh_data()
-            glitches = self.reality_data.get_reality_glitches()
-            weather_glitches = glitches["weather"]
-            
-            # Create a glitch status indicator
-            glitch_title = "REALITY GLITCH STATUS"
+            # Draw the glitch status box below it
             glitch_box_width = 60
-            glitch_box_x = (self.term.width - glitch_box_width) // 2
-            glitch_box_y = y + 11
-            
-            # Determine glitch level based on temperature extremes
-            temp = weather_data['temperature_c']
-            glitch_level = "STABLE"
-            glitch_color = self.text_color
-            
-            if temp > 35 or temp < -10:
-                glitch_level = "SEVERE"
-                glitch_color = self.error
-            elif temp > 30 or temp < 0:
-                glitch_level = "MODERATE"
-                glitch_color = self.warning
-            elif temp > 25 or temp < 5:
-                glitch_level = "MINOR"
-                glitch_color = self.highlight
-            
-            # Draw glitch status box
-            self.draw_box(glitch_box_x, glitch_box_y, glitch_box_width, 6, glitch_title)
-            
-            # Display glitch status
-            print(self.term.move_xy(glitch_box_x + 2, glitch_box_y + 2) + 
-                  self.highlight + f"Status: " + glitch_color + glitch_level + self.term.normal)
-            
-            # Display condition
-            condition_text = weather_glitches["condition"].upper()
-            print(self.term.move_xy(glitch_box_x + 2, glitch_box_y + 3) + 
-                  self.highlight + f"Condition: " + glitch_color + condition_text + self.term.normal)
-            
-            # Display random weather descriptor if available
-            if weather_glitches["descriptors"]:
-                descriptor = random.choice(weather_glitches["descriptors"])
-                print(self.term.move_xy(glitch_box_x + 2, glitch_box_y + 4) + 
-                      self.highlight + f"Effect: " + glitch_color + descriptor.capitalize() + self.term.normal)
+            glitch_box_height = len(status_rows) + 3
+            glitch_box_x = (self._tw - glitch_box_width) // 2
+            glitch_box_y = y + box_height + 2
+            buf.append(self.ui_renderer.draw_box(glitch_box_x, glitch_box_y, glitch_box_width, glitch_box_height, "REALITY GLITCH STATUS"))
+            for i, (label, text) in enumerate(status_rows):
+                if text:
+                    buf.append(move_xy(glitch_box_x + 2, glitch_box_y + 2 + i) + highlight + label + glitch_color + text + normal)
             
             # Add a cosmic message
-            if weather_glitches["events"]:
-                cosmic_msg = random.choice(weather_glitches["events"])
-            else:
-                cosmic_msg = "The weather patterns shift like cosmic tides..."
-            
-            msg_x = (self.term.width - len(cosmic_msg)) // 2
-            print(self.term.move_xy(msg_x, glitch_box_y + 8) + self.text_color + cosmic_msg + self.term.normal)
+            cosmic_y = glitch_box_y + glitch_box_height + 2
+            cosmic_msg = _pick(glitches.events, spec.fallback_event)
+            buf.append(self._center(cosmic_msg, cosmic_y) + self.text_color + cosmic_msg + normal)
             
             # Show story impact note
             impact_msg = "This data will influence your story experience..."
-            impact_x = (self.term.width - len(impact_msg)) // 2
-            print(self.term.move_xy(impact_x, glitch_box_y + 10) + self.dim + impact_msg + self.term.normal)
+            buf.append(self._center(impact_msg, cosmic_y + 2) + self.dim + impact_msg + normal)
         else:
             # Error message
-            error_msg = "ERROR: Unable to fetch weather data. Reality might be glitching..."
-            error_x = (self.term.width - len(error_msg)) // 2
-            print(self.term.move_xy(error_x, 5) + self.error + error_msg + self.term.normal)
+            if self.game_state.sync_ready.is_set():
+                error_msg = spec.error_msg
+            else:
+                error_msg = SYNCING_MSG
+            buf.append(self._center(error_msg, 5) + self.error + error_msg + normal)
         
         # Footer
-        footer = "Press any key to continue..."
-        footer_x = (self.term.width - len(footer)) // 2
-        print(self.term.move_xy(footer_x, self.term.height - 2) + self.dim + footer + self.term.normal)
+        buf.append(self._footer())
+        sys.stdout.write("".join(buf))
+        sys.stdout.flush()
         
         # Wait for key press
         self.term.inkey()
@@ -476,6 +302,154 @@ class RealityGlitchGame:
         # Redraw the main menu
         self.display_welcome()
     
+    def _change_style(self, value):
+        """Get the color for a signed change: green when up, red when down."""
+        return self.term.green if value >= 0 else self.term.red
+    
+    def _bitcoin_layout(self, btc_data, bitcoin_glitches):
+        """Lay out the Bitcoin screen.
+        
+        Args:
+            btc_data: Latest Bitcoin data from the database
+            bitcoin_glitches: Bitcoin reality glitches
+            
+        Returns:
+            Tuple of (data rows as (label, value, style), glitch level index,
+            extra glitch status rows as (label, text or None))
+        """
+        price = btc_data["price_usd"]
+        change_1h = btc_data["percent_change_1h"]
+        change_24h = btc_data["percent_change_24h"]
+        
+        # Changes are formatted with their + or - sign
+        rows = [
+            ("BTC Price: ", f"${price:,.2f}", ""),
+            ("1h Change: ", f"{change_1h:+.2f}%", self._change_style(change_1h)),
+            ("24h Change: ", f"{change_24h:+.2f}%", self._change_style(change_24h)),
+            ("Last Updated: ", _format_ts(btc_data["last_updated"]), self.dim),
+        ]
+        
+        # Determine glitch intensity based on price change
+        level = bisect.bisect_left(BTC_THRESHOLDS, abs(change_1h))
+        
+        # Display a random glitch descriptor if available
+        descriptor = _pick(bitcoin_glitches.descriptors)
+        status_rows = [("Effect: ", descriptor.capitalize() if descriptor else None)]
+        return rows, level, status_rows
+    
+    def _stocks_layout(self, indices_data, stock_glitches):
+        """Lay out the stock market screen.
+        
+        Args:
+            indices_data: Latest market index data from the database
+            stock_glitches: Stock market reality glitches
+            
+        Returns:
+            Tuple of (data rows as (label, value, style), glitch level index,
+            extra glitch status rows as (label, text or None))
+        """
+        rows = [("Last Updated: ", _format_ts(indices_data[0]["timestamp"]), self.dim)]
+        
+        # Track avg market change for glitch intensity
+        total_change_pct = 0
+        
+        # Display each index
+        for index in indices_data:
+            price = index["price"]
+            
+            # Calculate percentage of change relative to price
+            percentage = (index["change"] / price) * 100 if price else 0
+            total_change_pct += percentage
+            
+            rows.append((f"{index['symbol']}: ", f"${price:,.2f}", ""))
+            rows.append(("Change: ", f"{percentage:+.2f}%", self._change_style(percentage)))
+        
+        # Determine glitch level based on average market change
+        avg_change = total_change_pct / len(indices_data)
+        level = bisect.bisect_left(STOCK_THRESHOLDS, abs(avg_change))
+        
+        status_rows = [
+            ("Market Direction: ", stock_glitches.market_direction.replace("_", " ").upper()),
+            ("Volatility: ", stock_glitches.volatility.upper()),
+        ]
+        return rows, level, status_rows
+    
+    def _weather_layout(self, weather_data, weather_glitches):
+        """Lay out the weather screen.
+        
+        Args:
+            weather_data: Latest weather data from the database
+            weather_glitches: Weather reality glitches
+            
+        Returns:
+            Tuple of (data rows as (label, value, style), glitch level index,
+            extra glitch status rows as (label, text or None))
+        """
+        rows = [
+            ("Location: ", f"{weather_data['location_name']}, {weather_data['region']}, {weather_data['country']}", ""),
+            ("Temperature: ", f"{weather_data['temperature_c']}°C (feels like {weather_data['feels_like_c']}°C)", ""),
+            ("Wind: ", f"{weather_data['wind_kph']} km/h {weather_data['wind_direction']}", ""),
+            ("Humidity: ", f"{weather_data['humidity']}%", ""),
+            ("UV Index: ", f"{weather_data['uv_index']}", ""),
+            ("Last Updated: ", _format_ts(weather_data['last_updated']), self.dim),
+        ]
+        
+        # Determine glitch level based on temperature extremes
+        temp = weather_data['temperature_c']
+        level = max(bisect.bisect_left(HOT_THRESHOLDS, temp),
+                    len(COLD_THRESHOLDS) - bisect.bisect_right(COLD_THRESHOLDS, temp))
+        
+        # Display random weather descriptor if available
+        descriptor = _pick(weather_glitches.descriptors)
+        status_rows = [
+            ("Condition: ", weather_glitches.condition.upper()),
+            ("Effect: ", descriptor.capitalize() if descriptor else None),
+        ]
+        return rows, level, status_rows
+    
+    def _cached(self, key, ttl, loader):
+        """Return a cached value, calling loader when it is older than ttl.
+        
+        Args:
+            key: Name of the cached value
+            ttl: Maximum age of the cached value in seconds
+            loader: Callable that loads a fresh value
+            
+        Returns:
+            The cached or freshly loaded value
+        """
+        loaded_at, value = self._cache.get(key, (None, None))
+        now = time.monotonic()
+        if loaded_at is not None and now - loaded_at < ttl:
+            return value
+        value = loader()
+        self._cache[key] = (now, value)
+        return value
+    
+    def invalidate(self, key=None):
+        """Drop one cached value, or all of them when key is None."""
+        if key is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(key, None)
+    
+    def _glitch_status(self, level):
+        """Get the glitch level name and color for a severity index (0-3)."""
+        return GLITCH_LEVELS[level], getattr(self, GLITCH_COLOR_ATTRS[level])
+    
+    def _center(self, text, y):
+        """Get the cursor move that centers text on row y of the current frame."""
+        return self._move_xy((self._tw - len(text)) // 2, y)
+    
+    def _footer(self):
+        """Get the footer prompt, rebuilt only when the terminal is resized."""
+        term_size = (self.term.width, self.term.height)
+        if term_size != self._footer_size:
+            self._footer_size = term_size
+            footer_x = (term_size[0] - len(FOOTER)) // 2
+            self._footer_seq = self.term.move_xy(footer_x, term_size[1] - 2) + self.dim + FOOTER + self.term.normal
+        return self._footer_seq
+    
     def draw_box(self, x, y, width, height, title=""):
         """Draw a box with optional title."""
         print(self.ui_renderer.draw_box(x, y, width, height, title))
@@ -504,8 +478,9 @@ class RealityGlitchGame:
             # Get existing saves
             self.current_saves = self.save_manager.get_save_files()
             
-            # Display save menu
-            os.system('cls' if os.name == 'nt' else 'clear')
+            # Display save menu on a cleared screen
+            sys.stdout.write(self.term.home + self.term.clear)
+            sys.stdout.flush()
             self.display_save_menu()
             
             # Wait for user selection handled by key handler
@@ -516,6 +491,10 @@ class RealityGlitchGame:
         """Display the save game menu with a split screen layout"""
         self.menu_renderer.display_save_menu(self.current_saves, self.menu_selection, self.story_engine)
     
+    def update_save_menu(self):
+        """Redraw only the save menu rows affected by a selection change"""
+        self.menu_renderer.update_save_menu(self.current_saves, self.menu_selection, self.story_engine)
+    
     def load_story(self):
         """Load a saved story with menu for selecting save slot"""
         # Check if there are any saves
@@ -530,8 +509,9 @@ class RealityGlitchGame:
         # Get existing saves
         self.current_saves = self.save_manager.get_save_files()
         
-        # Display load menu
-        os.system('cls' if os.name == 'nt' else 'clear')
+        # Display load menu on a cleared screen
+        sys.stdout.write(self.term.home + self.term.clear)
+        sys.stdout.flush()
         self.display_load_menu()
         
         # Wait for user selection handled by key handler
@@ -540,6 +520,10 @@ class RealityGlitchGame:
         """Display the load game menu with a split screen layout"""
         self.menu_renderer.display_load_menu(self.current_saves, self.menu_selection)
     
+    def update_load_menu(self):
+        """Redraw only the load menu rows affected by a selection change"""
+        self.menu_renderer.update_load_menu(self.current_saves, self.menu_selection)
+    
     def show_save_location(self):
         """Show the location where save files are stored."""
         save_path = os.path.abspath(self.story_engine.SAVE_DIR)
@@ -563,6 +547,53 @@ class RealityGlitchGame:
             self.display_story()
         else:
             self.display_welcome()
+    
+    async def display_sci_fi_animation_async(self, duration=5):
+        """Display the sci-fi animation on the event loop; any key skips it."""
+        loop = asyncio.get_running_loop()
+        stop = asyncio.Event()
+        
+        def on_key():
+            if self.term.inkey(timeout=0):
+                stop.set()
+        
+        with self.term.cbreak():
+            # Watch stdin for keys while the animation runs (not every platform supports this)
+            try:
+                loop.add_reader(sys.stdin.fileno(), on_key)
+                watching = True
+            except (NotImplementedError, OSError, ValueError):
+                watching = False
+            
+            try:
+                await self.animation_manager.display_sci_fi_animation_async(duration, stop)
+            finally:
+                if watching:
+                    loop.remove_reader(sys.stdin.fileno())
+        
+        # Show the appropriate screen
+        if self.story_mode:
+            self.display_story()
+        else:
+            self.display_welcome()
+
+    def _drain_input(self):
+        """Discard any keys waiting in the terminal input buffer."""
+        if termios is not None:
+            try:
+                fd = sys.stdin.fileno()
+            except (OSError, ValueError):
+                return
+            try:
+                termios.tcflush(fd, termios.TCIFLUSH)
+            except (termios.error, OSError):
+                # Not a tty (e.g. a pipe): read and discard whatever is available
+                while select.select([fd], [], [], 0)[0]:
+                    if not os.read(fd, 4096):
+                        break
+        else:
+            while msvcrt.kbhit():
+                msvcrt.getwch()
 
     def run(self):
         """Run the main game loop."""
@@ -577,15 +608,14 @@ class RealityGlitchGame:
                 # Check if typewriter just started (transition from inactive to active)
                 if self.story_engine.typewriter_active and not last_typewriter_active:
                     # Clear any pending input when typewriter starts
-                    while self.term.inkey(timeout=0):
-                        pass
+                    self._drain_input()
                 
                 # Update the last typewriter state
                 last_typewriter_active = self.story_engine.typewriter_active
                 
-                # Wait for a keypress with a short timeout
-                # Use shorter timeout if typewriter is active to check more frequently
-                timeout = 0.001 if self.story_engine.typewriter_active else 0.01
+                # Wait for a keypress; poll at the typewriter's own pace while it runs
+                # and otherwise block until a key arrives instead of waking up to poll
+                timeout = self.story_engine.typewriter_tick if self.story_engine.typewriter_active else None
                 key = self.term.inkey(timeout=timeout)
                 
                 # Skip processing if no key was pressed
@@ -600,11 +630,12 @@ def start_game_cli(debug=False):
     try:
         game = RealityGlitchGame(debug=debug)
         
-        # Show the sci-fi animation at the start
-        game.display_sci_fi_animation(duration=4)
+        # Show the sci-fi animation at the start; a keypress skips it.
+        # Skip it entirely when output is redirected to a file or pipe
+        if sys.stdout.isatty():
+            asyncio.run(game.display_sci_fi_animation_async(duration=4))
         
         # Run the game loop - this will display the welcome screen
-        # since the animation now clears and calls display_welcome()
         game.run()
         
     except KeyboardInterrupt:
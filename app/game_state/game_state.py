@@ -1,19 +1,37 @@
+import os
+import json
+import threading
 from datetime import datetime, timedelta
 from integration.reality_data import RealityData
 from db.db_operations import DatabaseOperations
 from integration.sync_apis import SyncApis
 
+# Startup sync timing: data is refreshed every SYNC_INTERVAL, backing off up to
+# MAX_SYNC_INTERVAL while syncs keep returning the same data. Relaunching within
+# RELAUNCH_GRACE of the previous launch skips the check entirely.
+SYNC_INTERVAL = timedelta(minutes=10)
+MAX_SYNC_INTERVAL = timedelta(minutes=60)
+RELAUNCH_GRACE = timedelta(minutes=1)
+
+# Small state file remembering the last launch and sync results between sessions
+SYNC_STATE_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'sync_state.json')
+
 class GameState:
     """Manages the state of the Reality Glitch game."""
     
-    def __init__(self, story_engine=None, debug=False):
+    def __init__(self, story_engine=None, debug=False, sync=True):
         """Initialize the game state.
         
         Args:
             story_engine: Reference to the StoryEngine
             debug: Enable debug mode
+            sync: Start the startup API sync in the background; pass False to start it later
         """
         self.db_ops = DatabaseOperations()
+        # The sync thread gets its own connection; psycopg2 connections are not shared across threads
+        self._sync_db_ops = DatabaseOperations()
+        self.sync_ready = threading.Event()
+        
         self.running = True
         self.story_mode = False
         self.story_engine = story_engine
@@ -24,25 +42,116 @@ class GameState:
         self.menu_selection = 0
         self.debug = debug
         
-        # Reality data handler for reality glitches
-        self.reality_data = RealityData(debug=self.debug)
+        # Reality data handler for reality glitches, shared with the story engine when there is one
+        if story_engine is not None:
+            self.reality_data = story_engine.reality_data
+        else:
+            self.reality_data = RealityData(debug=self.debug)
+        
+        if sync:
+            self.start_background_sync()
+    
+    def start_background_sync(self, on_done=None):
+        """Run startup_sync on a daemon thread so network I/O never blocks the UI.
         
+        Args:
+            on_done: Optional callable run when the sync finishes, even if it failed
+            
+        Returns:
+            The started thread
+        """
+        def _bg_sync():
+            try:
+                self.startup_sync()
+            except Exception:
+                # Sync runs silently; readers fall back to the data already stored
+                pass
+            finally:
+                if on_done:
+                    on_done()
+                self.sync_ready.set()
+        
+        thread = threading.Thread(target=_bg_sync, daemon=True)
+        thread.start()
+        return thread
+    
+    def startup_sync(self):
+        """Sync with the APIs on first run, or if the last sync is out of date."""
         # Check if this is the first run and sync with APIs if needed
-        if self.db_ops.is_first_run():
+        if self._sync_db_ops.is_first_run():
             # Silently sync with APIs on first run (no messages to terminal)
-            sync = SyncApis()
-            sync.sync_all()
+            state = self._load_sync_state()
+            state['last_launch'] = datetime.now().isoformat()
+            self._run_sync(state)
+            self._save_sync_state(state)
         else:
             # Check if we need to sync on startup (silent)
             self.check_and_sync()
     
     def check_and_sync(self):
-        """Check if 10 minutes have passed since last sync and sync if needed - silently."""
-        last_sync = self.db_ops.get_last_sync_time()           
-        if not last_sync or (datetime.now() - last_sync) > timedelta(minutes=10):        
-            # No console output - run sync silently
-            sync = SyncApis()
-            sync.sync_all()
+        """Sync silently if the sync interval has passed since the last sync.
+        
+        The interval starts at SYNC_INTERVAL and doubles, up to MAX_SYNC_INTERVAL,
+        each time a sync returns the same data as the one before it. Relaunching
+        the game within RELAUNCH_GRACE of the previous launch skips the check.
+        """
+        state = self._load_sync_state()
+        now = datetime.now()
+        last_launch = state.get('last_launch')
+        state['last_launch'] = now.isoformat()
+        
+        if not last_launch or now - datetime.fromisoformat(last_launch) > RELAUNCH_GRACE:
+            interval = timedelta(seconds=state.get('interval', SYNC_INTERVAL.total_seconds()))
+            last_sync = self._sync_db_ops.get_last_sync_time()
+            if not last_sync or (now - last_sync) > interval:
+                # No console output - run sync silently
+                self._run_sync(state)
+        
+        self._save_sync_state(state)
+    
+    def _run_sync(self, state):
+        """Sync all APIs and adjust the sync interval stored in state.
+        
+        Args:
+            state: Sync state dictionary, updated in place
+        """
+        with SyncApis() as sync_apis:
+            fingerprint = sync_apis.sync_all()
+        if fingerprint is None:
+            return
+        
+        interval = SYNC_INTERVAL
+        if fingerprint == state.get('fingerprint'):
+            # Nothing new since the last sync - back off
+            previous = timedelta(seconds=state.get('interval', SYNC_INTERVAL.total_seconds()))
+            interval = min(MAX_SYNC_INTERVAL, previous * 2)
+        state['fingerprint'] = fingerprint
+        state['interval'] = interval.total_seconds()
+    
+    def _load_sync_state(self):
+        """Load the sync state saved by the previous session.
+        
+        Returns:
+            Dictionary with the sync state, empty if there is none
+        """
+        try:
+            with open(SYNC_STATE_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_sync_state(self, state):
+        """Save the sync state for the next session.
+        
+        Args:
+            state: Sync state dictionary
+        """
+        try:
+            with open(SYNC_STATE_FILE, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+        except OSError as e:
+            if self.debug:
+                print(f"Error saving sync state: {e}")
     
     def toggle_story_mode(self):
         """Toggle between story mode and reality mode."""
@@ -100,8 +209,8 @@ class GameState:
         Returns:
             Dictionary containing reality glitch data
         """
-        self.reality_data.refresh_data()
-        return self.reality_data.get_reality_glitches()
+        # Shared with the fragment screens; only rebuilt after a new sync
+        return self.reality_data.get_snapshot()
     
     def update_menu_selection(self, direction):
         """Update the menu selection index.
@@ -115,8 +224,8 @@ class GameState:
         max_selection = len(self.current_saves)
         
         if direction == 'up':
-            self.menu_selection = (self.menu_selection - 1) % (max_selection + 1)
+            self.menu_selection = self.menu_selection - 1 if self.menu_selection > 0 else max_selection
         elif direction == 'down':
-            self.menu_selection = (self.menu_selection + 1) % (max_selection + 1)
+            self.menu_selection = self.menu_selection + 1 if self.menu_selection < max_selection else 0
             
         return self.menu_selection 
\ No newline at end of file
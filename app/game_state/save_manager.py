@@ -1,7 +1,9 @@
 import os
-import json
+import time
 import uuid
+from operator import itemgetter
 from datetime import datetime
+from save_format import find_save_path, is_save_file, read_save, read_save_header, save_epoch, write_save
 
 class SaveManager:
     """Manages save game operations for the Reality Glitch game."""
@@ -15,6 +17,10 @@ class SaveManager:
         """
         self.SAVE_DIR = save_dir or os.path.join(os.path.dirname(os.path.dirname(__file__)), 'saved_games')
         self.story_engine = story_engine
+        # Preview metadata per save file, keyed by filename: (mtime_ns, size, meta)
+        self._meta_cache = {}
+        # Set once a save has been seen; cleared when a corrupt save is moved aside
+        self._has_saves = False
         
         # Create save directory if it doesn't exist
         os.makedirs(self.SAVE_DIR, exist_ok=True)
@@ -27,28 +33,60 @@ class SaveManager:
         """
         saves = []
         if not os.path.exists(self.SAVE_DIR):
+            self._meta_cache.clear()
             return saves
-            
-        for filename in os.listdir(self.SAVE_DIR):
-            if filename.endswith('.json'):
+        
+        seen = set()
+        with os.scandir(self.SAVE_DIR) as it:
+            for entry in it:
+                filename = entry.name
+                if not is_save_file(filename) or not entry.is_file():
+                    continue
+                seen.add(filename)
                 try:
-                    with open(os.path.join(self.SAVE_DIR, filename), 'r', encoding='utf-8') as f:
-                        save_data = json.load(f)
-                        # Extract metadata for preview
-                        save_meta = {
-                            'id': save_data.get('id', filename[:-5]),  # Remove .json
-                            'title': save_data.get('title', 'Untitled Save'),
-                            'timestamp': save_data.get('timestamp', 'Unknown'),
-                            'summary': save_data.get('summary', 'No summary available'),
-                            'choices_preview': save_data.get('choices_preview', '')
-                        }
-                        saves.append(save_meta)
-                except (json.JSONDecodeError, IOError) as e:
+                    st = entry.stat()
+                    cached = self._meta_cache.get(filename)
+                    # Only re-read saves that changed since the last listing
+                    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                        saves.append(cached[2])
+                        continue
+                    save_data = read_save_header(entry.path)
+                    # Extract metadata for preview
+                    save_meta = {
+                        'id': save_data.get('id', os.path.splitext(filename)[0]),  # Remove extension
+                        'title': save_data.get('title', 'Untitled Save'),
+                        'timestamp': save_data.get('timestamp', 'Unknown'),
+                        'ts_epoch': save_epoch(save_data),
+                        'summary': save_data.get('summary', 'No summary available'),
+                        'choices_preview': save_data.get('choices_preview', '')
+                    }
+                    self._meta_cache[filename] = (st.st_mtime_ns, st.st_size, save_meta)
+                    saves.append(save_meta)
+                except ValueError as e:
+                    # Corrupt save: move it aside so later listings don't parse it again
+                    self._meta_cache.pop(filename, None)
                     print(f"Error loading save file {filename}: {e}")
+                    try:
+                        os.replace(entry.path, entry.path + '.bad')
+                    except OSError:
+                        pass
+                    else:
+                        # It may have been the only save, so look again next time
+                        self._has_saves = False
+                        if self.story_engine:
+                            self.story_engine._has_saves = False
                     continue
+                except IOError as e:
+                    self._meta_cache.pop(filename, None)
+                    print(f"Error loading save file {filename}: {e}")
+                    continue
+        
+        # Forget saves that were deleted since the last listing
+        for filename in self._meta_cache.keys() - seen:
+            del self._meta_cache[filename]
         
         # Sort by timestamp (newest first)
-        saves.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
+        saves.sort(key=itemgetter('ts_epoch'), reverse=True)
         return saves
     
     def has_saved_story(self):
@@ -57,13 +95,15 @@ class SaveManager:
         Returns:
             True if at least one save file exists
         """
-        if not os.path.exists(self.SAVE_DIR):
+        if self._has_saves:
+            return True
+        
+        try:
+            with os.scandir(self.SAVE_DIR) as it:
+                self._has_saves = any(is_save_file(entry.name) and entry.is_file() for entry in it)
+        except FileNotFoundError:
             return False
-            
-        for filename in os.listdir(self.SAVE_DIR):
-            if filename.endswith('.json'):
-                return True
-        return False
+        return self._has_saves
     
     def generate_save_id(self):
         """Generate a unique ID for a new save file.
@@ -106,7 +146,8 @@ class SaveManager:
             'id': save_id,
             'title': title,
             'timestamp': datetime.now().isoformat(),
-            'summary': self.story_engine.current_story[-500:] if len(self.story_engine.current_story) > 500 else self.story_engine.current_story,
+            'ts_epoch': time.time(),
+            'summary': self.story_engine.current_story[-500:],  # Slicing a shorter story returns it unchanged
             'choices_preview': choices_preview,
             'full_story': self.story_engine.current_story,
             'current_choices': self.story_engine.current_choices,
@@ -115,10 +156,10 @@ class SaveManager:
         }
         
         # Save to file
-        save_path = os.path.join(self.SAVE_DIR, f"{save_id}.json")
+        save_path = find_save_path(self.SAVE_DIR, save_id)
         try:
-            with open(save_path, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, ensure_ascii=False, indent=2)
+            write_save(save_path, save_data)
+            self._has_saves = True
             return True
         except IOError as e:
             print(f"Error saving story: {e}")
@@ -137,22 +178,21 @@ class SaveManager:
             print("Error: No story engine reference available for loading")
             return False
             
-        save_path = os.path.join(self.SAVE_DIR, f"{save_id}.json")
+        save_path = find_save_path(self.SAVE_DIR, save_id)
         
         if not os.path.exists(save_path):
             print(f"Save file not found: {save_path}")
             return False
             
         try:
-            with open(save_path, 'r', encoding='utf-8') as f:
-                save_data = json.load(f)
-                
+            save_data = read_save(save_path)
+            
             # Load the save data into the story engine
             self.story_engine.current_story = save_data.get('full_story', '')
             self.story_engine.current_choices = save_data.get('current_choices', [])
             self.story_engine.story_state = save_data.get('story_state', {})
             
             return True
-        except (json.JSONDecodeError, IOError) as e:
+        except (ValueError, IOError) as e:
             print(f"Error loading save file: {e}")
             return False 
\ No newline at end of file
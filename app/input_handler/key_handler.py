@@ -1,3 +1,9 @@
+import time
+from datetime import datetime
+
+# Map curses function key names (KEY_F1) to the format used below (KEY_F(1))
+_FKEY_NORMALIZE = {f'KEY_F{n}': f'KEY_F({n})' for n in range(64)}
+
 class KeyHandler:
     """Handles keyboard input processing for the Reality Glitch game."""
     
@@ -9,6 +15,28 @@ class KeyHandler:
         """
         self.game = game_instance
         self.term = self.game.term
+        self._debug = self.game.story_engine.debug
+        
+        # Key actions, looked up by normalized key name
+        g = self.game
+        self._story_keys = {
+            'KEY_F(1)': g.display_help,
+            'KEY_F(7)': g.display_sci_fi_animation,
+            'KEY_F(9)': g.save_story,
+            'KEY_F(10)': g.load_story,
+        }
+        self._main_keys = {
+            'KEY_F(1)': g.display_help,
+            'KEY_F(2)': g.bitcoin,
+            'KEY_F(3)': g.stocks,
+            'KEY_F(4)': g.weather,
+            'KEY_F(5)': g.trigger_panic,
+            'KEY_F(6)': g.toggle_story_mode,
+            'KEY_F(7)': g.display_sci_fi_animation,
+            'KEY_F(9)': self._save_if_saves,
+            'KEY_F(10)': self._load_if_saves,
+            'KEY_ESCAPE': self._quit,
+        }
     
     def normalize_key(self, key):
         """Normalize function key names to consistent format.
@@ -17,20 +45,17 @@ class KeyHandler:
             key: The key object from blessed.Terminal.inkey()
             
         Returns:
-            The same key object with normalized_name added
+            The same key object, with normalized_name added if its name changed
         """
-        key_name = key.name
-        if key_name and key_name.startswith('KEY_F') and not key_name.startswith('KEY_F('):
-            # Convert KEY_F1 to KEY_F(1)
-            num = key_name[5:]
-            key_name = f'KEY_F({num})'
-            
+        # Convert KEY_F1 to KEY_F(1); other names are already canonical
+        key_name = _FKEY_NORMALIZE.get(key.name)
+        if key_name is not None:
             # Show debug info about normalization if debug mode is on
-            if self.game.story_engine.debug:
+            if self._debug:
                 print(f"Normalized key name from {key.name} to {key_name}")
-        
-        # Keep a reference to the original key but use normalized name
-        key.normalized_name = key_name
+            
+            # Keep a reference to the original key but use normalized name
+            key.normalized_name = key_name
         return key
     
     def handle_key(self, key):
@@ -54,42 +79,34 @@ class KeyHandler:
             return
         
         # Get the normalized key name
-        key_name = key.normalized_name
+        key_name = getattr(key, 'normalized_name', key.name)
         
         if self.game.story_mode:
             # F-keys still work in story mode
-            if key_name == 'KEY_F(1)':
-                self.game.display_help()
-            elif key_name == 'KEY_F(7)':
-                self.game.display_sci_fi_animation()
-            elif key_name == 'KEY_F(9)':
-                self.game.save_story()
-            elif key_name == 'KEY_F(10)':
-                self.game.load_story()
+            action = self._story_keys.get(key_name)
+            if action:
+                action()
             else:
                 self.handle_story_choice(key)
         else:
             # Handle main menu keys
-            if key_name == 'KEY_F(1)':
-                self.game.display_help()
-            elif key_name == 'KEY_F(2)':
-                self.game.bitcoin()
-            elif key_name == 'KEY_F(3)':
-                self.game.stocks()
-            elif key_name == 'KEY_F(4)':
-                self.game.weather()
-            elif key_name == 'KEY_F(5)':
-                self.game.trigger_panic()
-            elif key_name == 'KEY_F(6)':
-                self.game.toggle_story_mode()
-            elif key_name == 'KEY_F(7)':
-                self.game.display_sci_fi_animation()
-            elif key_name == 'KEY_F(9)' and self.game.story_engine.has_saved_story():
-                self.game.save_story()
-            elif key_name == 'KEY_F(10)' and self.game.story_engine.has_saved_story():
-                self.game.load_story()
-            elif key_name == 'KEY_ESCAPE':
-                self.game.running = False
+            action = self._main_keys.get(key_name)
+            if action:
+                action()
+    
+    def _save_if_saves(self):
+        """Open the save menu from the main menu when saves exist."""
+        if self.game.story_engine.has_saved_story():
+            self.game.save_story()
+    
+    def _load_if_saves(self):
+        """Open the load menu from the main menu when saves exist."""
+        if self.game.story_engine.has_saved_story():
+            self.game.load_story()
+    
+    def _quit(self):
+        """Stop the game loop."""
+        self.game.running = False
     
     def handle_story_choice(self, key):
         """Handle player choice in story mode.
@@ -127,7 +144,6 @@ class KeyHandler:
             # Validate choice index
             if choice_index < 0 or choice_index >= len(self.game.story_engine.current_choices):
                 print("\n" + self.game.error + "Invalid choice number. Please try again." + self.term.normal)
-                import time
                 time.sleep(1)
                 self.game.display_story()
                 return
@@ -142,7 +158,6 @@ class KeyHandler:
             # Show the choice being made
             chosen_action = self.game.story_engine.current_choices[choice_index]
             self.game.story_engine.typewriter_effect(f"You chose: {chosen_action}", style=self.game.text_color)
-            import time
             time.sleep(0.5)
             
             # Show loading status
@@ -162,7 +177,6 @@ class KeyHandler:
                 self.game.display_story()
         except Exception as e:
             print(f"\n{self.game.error}Error processing choice: {str(e)}{self.term.normal}")
-            import time
             time.sleep(2)
             self.game.display_story()
     
@@ -179,10 +193,10 @@ class KeyHandler:
         key_name = getattr(key, 'normalized_name', key.name)
         
         if key_name == 'KEY_UP':
-            self.game.menu_selection = (self.game.menu_selection - 1) % (max_selection + 1)
+            self.game.menu_selection = self.game.menu_selection - 1 if self.game.menu_selection > 0 else max_selection
             redraw = True
         elif key_name == 'KEY_DOWN':
-            self.game.menu_selection = (self.game.menu_selection + 1) % (max_selection + 1)
+            self.game.menu_selection = self.game.menu_selection + 1 if self.game.menu_selection < max_selection else 0
             redraw = True
         elif key_name == 'KEY_ESCAPE':
             # Exit the save menu
@@ -195,7 +209,6 @@ class KeyHandler:
                 # Generate a new save ID
                 save_id = self.game.story_engine.generate_save_id()
                 # Generate a default title based on timestamp
-                from datetime import datetime
                 title = f"Reality Glitch - {datetime.now().strftime('%Y-%m-%d %H:%M')}"
                 # Save the game
                 if self.game.story_engine.save_story(save_id=save_id, title=title):
@@ -204,7 +217,6 @@ class KeyHandler:
                     # Show success message
                     print(self.term.clear)
                     print("\n" + self.game.text_color + "Successfully saved reality fragment." + self.term.normal)
-                    import time
                     time.sleep(1)
                     # Redisplay the story
                     self.game.display_story()
@@ -226,7 +238,6 @@ class KeyHandler:
                     # Show success message
                     print(self.term.clear)
                     print("\n" + self.game.text_color + "Successfully updated reality fragment." + self.term.normal)
-                    import time
                     time.sleep(1)
                     # Redisplay the story
                     self.game.display_story()
@@ -238,9 +249,9 @@ class KeyHandler:
                     # Redisplay the save menu
                     self.game.display_save_menu()
         
-        # Only redraw if needed
+        # Only redraw the rows that changed
         if redraw:
-            self.game.display_save_menu()
+            self.game.update_save_menu()
     
     def handle_load_menu_key(self, key):
         """Handle key presses in the load menu.
@@ -270,10 +281,10 @@ class KeyHandler:
         key_name = getattr(key, 'normalized_name', key.name)
         
         if key_name == 'KEY_UP':
-            self.game.menu_selection = (self.game.menu_selection - 1) % (max_selection + 1)
+            self.game.menu_selection = self.game.menu_selection - 1 if self.game.menu_selection > 0 else max_selection
             redraw = True
         elif key_name == 'KEY_DOWN':
-            self.game.menu_selection = (self.game.menu_selection + 1) % (max_selection + 1)
+            self.game.menu_selection = self.game.menu_selection + 1 if self.game.menu_selection < max_selection else 0
             redraw = True
         elif key_name == 'KEY_ESCAPE':
             # Exit the load menu
@@ -313,7 +324,6 @@ class KeyHandler:
                     self.game.story_mode = True
                 
                 # Display the story with a short delay to ensure UI is properly rendered
-                import time
                 time.sleep(0.5)
                 # Force a redraw of the story screen
                 print(self.term.clear)
@@ -331,6 +341,6 @@ class KeyHandler:
                 else:
                     self.game.display_welcome()
         
-        # Only redraw if needed
+        # Only redraw the rows that changed
         if redraw:
-            self.game.display_load_menu() 
\ No newline at end of file
+            self.game.update_load_menu() 
\ No newline at end of file
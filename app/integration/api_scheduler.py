@@ -1,8 +1,9 @@
 import time
 import logging
+import signal
 import sys
+import threading
 from pathlib import Path
-from apscheduler.schedulers.blocking import BlockingScheduler
 
 # Add the parent directory to sys.path
 sys.path.append(str(Path(__file__).parent.parent))
@@ -20,16 +21,38 @@ logging.basicConfig(
     ]
 )
 
-if __name__ == '__main__':
-    scheduler = BlockingScheduler()
-    # Schedule the perform_sync function to run every 10 minutes
-    sync_apis = SyncApis()
-    scheduler.add_job(sync_apis.sync_all, 'interval', minutes=10, id='data_sync_job', replace_existing=True)
+# Seconds between syncs
+SYNC_INTERVAL = 10 * 60
+
+def run_scheduler(sync_apis, stop, interval=SYNC_INTERVAL):
+    """Call sync_all every interval seconds until stop is set.
+    
+    Like the interval job it replaces, the first sync runs one interval after
+    start; the game syncs on its own at launch.
+    
+    Args:
+        sync_apis: SyncApis instance to run
+        stop: threading.Event that ends the loop when set
+        interval: Seconds between syncs
+    """
+    while not stop.wait(interval):
+        try:
+            sync_apis.sync_all()
+        except Exception:
+            # Keep the schedule going; the next run retries
+            logging.exception("Scheduled sync failed")
 
-    # No logging here, should be silent
-    try:
-        # Start the scheduler (this blocks execution)
-        scheduler.start()
-    except (KeyboardInterrupt, SystemExit):
+if __name__ == '__main__':
+    stop = threading.Event()
+    
+    def _shutdown(signum, frame):
         # Silent shutdown
-        scheduler.shutdown()
\ No newline at end of file
+        stop.set()
+    
+    signal.signal(signal.SIGINT, _shutdown)
+    signal.signal(signal.SIGTERM, _shutdown)
+    
+    # Run the sync every 10 minutes (this blocks execution); one SyncApis
+    # keeps its HTTP connections open between runs
+    with SyncApis() as sync_apis:
+        run_scheduler(sync_apis, stop)
\ No newline at end of file
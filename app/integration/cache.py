@@ -0,0 +1,105 @@
+import os
+import json
+import time
+import hashlib
+from typing import Any, Dict, Optional
+
+try:
+    import redis
+except ImportError:  # redis is optional; the file cache needs nothing extra
+    redis = None
+
+# Directory for the file cache, shared by every process running the game
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.cache')
+
+class TTLCache:
+    """
+    Cache for API responses that expire after a time-to-live.
+    
+    Values are stored in Redis when REDIS_URL is set and the redis package is
+    installed, otherwise as JSON files in CACHE_DIR. Either way the cache is
+    shared between the game and the API scheduler.
+    """
+    
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Initialize the cache.
+        
+        Args:
+            cache_dir: Directory for the file cache (defaults to CACHE_DIR)
+        """
+        self.cache_dir = cache_dir or CACHE_DIR
+        redis_url = os.getenv("REDIS_URL")
+        self.redis = redis.Redis.from_url(redis_url) if redis is not None and redis_url else None
+    
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Build a cache key for a request.
+        
+        Args:
+            url: Request URL
+            params: Query parameters of the request
+        
+        Returns:
+            str: MD5 hex digest of the URL and sorted parameters
+        """
+        raw = json.dumps([url, sorted((params or {}).items())], default=str)
+        return hashlib.md5(raw.encode('utf-8')).hexdigest()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached value.
+        
+        Args:
+            key: Cache key from make_key
+        
+        Returns:
+            The cached value, or None if it is missing or expired
+        """
+        if self.redis is not None:
+            try:
+                raw = self.redis.get(key)
+            except redis.RedisError:
+                return None
+            return json.loads(raw) if raw is not None else None
+        
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get('expires', 0) < time.time():
+            return None
+        return entry.get('value')
+    
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """
+        Store a value for ttl seconds.
+        
+        Args:
+            key: Cache key from make_key
+            value: JSON-serializable value
+            ttl: Seconds until the value expires
+        """
+        if self.redis is not None:
+            try:
+                self.redis.setex(key, int(ttl), json.dumps(value))
+            except redis.RedisError:
+                pass
+            return
+        
+        path = self._path(key)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'expires': time.time() + ttl, 'value': value}, f)
+            # Readers in other processes never see a partly written entry
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+    
+    def _path(self, key: str) -> str:
+        """Get the file path of a cache entry."""
+        return os.path.join(self.cache_dir, key + '.json')
@@ -0,0 +1,38 @@
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+
+# Seconds to wait for an API to connect or respond, so a stalled upstream
+# can't hang a sync
+REQUEST_TIMEOUT = 10
+
+# One session for every API wrapper in the process, created on first use
+_session = None
+_session_lock = threading.Lock()
+
+def get_session() -> requests.Session:
+    """
+    Get the HTTP session shared by the API wrappers.
+    
+    The session keeps a connection pool per API host, so every wrapper and
+    every sync reuses the same open connections.
+    
+    Returns:
+        requests.Session: The shared session
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+        return _session
+
+def close_session() -> None:
+    """Close the shared session; the next get_session call opens a new one."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
@@ -1,18 +1,455 @@
 import sys
-import os
 import random
-from pathlib import Path
-from typing import Dict, Any, Optional, List, Tuple
+import time
+import threading
+from bisect import bisect_right
+from math import expm1, floor, log
+from collections import Counter
+from dataclasses import dataclass, replace
+from functools import cached_property
+from types import MappingProxyType
+from typing import Dict, Any, FrozenSet, Mapping, Optional, List, Sequence, Tuple
 from datetime import datetime
 
-# Add the parent directory to sys.path
-parent_dir = str(Path(__file__).parent.parent)
-if parent_dir not in sys.path:
-    sys.path.append(parent_dir)
-
-# Import database operations
+# Import database operations; app/ is already on sys.path for every importer
 from db.db_operations import DatabaseOperations
 
+# Seconds before cached data is refreshed, and the retry delay range after a
+# failed refresh (doubling from the first value up to the second)
+REFRESH_INTERVAL = 600
+RETRY_BACKOFF = (30, 600)
+# Seconds between checks for a sync newer than the cached data
+SYNC_CHECK_INTERVAL = 30
+
+# Condition buckets: a value gets the condition after the last threshold it
+# reaches, so each threshold is the lowest value of the next condition
+_TEMP_THRESHOLDS = (0, 10, 20, 30)
+_TEMP_CONDS = ("freezing", "cold", "mild", "warm", "hot")
+# 1h % change: below -5 is a crash, below -2 a decline, 5 and above a surge
+_BTC_THRESHOLDS = (-5, -2, 2, 5)
+_BTC_CONDS = ("crashing", "declining", "stable", "growing", "surging")
+# Average index % change; exactly +0.5 still counts as neutral, so that bucket
+# ends at the next float after 0.5 (math.nextafter needs Python 3.9)
+_STOCK_THRESHOLDS = (-1.5, -0.5, 0.5 + 2 ** -53, 1.5)
+_STOCK_CONDS = ("bearish", "slightly_bearish", "neutral", "slightly_bullish", "bullish")
+# Standard deviation of the index % changes
+_VOL_THRESHOLDS = (0.5, 1.5)
+_VOL_CONDS = ("low", "moderate", "high")
+
+# Descriptors and events per condition, as (descriptors, events). Glitch
+# dictionaries hand these out directly instead of rebuilding them; descriptors
+# are frozensets so the combined glitches can take their union.
+_WEATHER_TABLE = {
+    "freezing": (
+        frozenset(("frost-covered", "ice-cold", "frigid", "frozen", 
+                   "glacial", "wintry", "crystalline")),
+        ("ice forming on surfaces", "breath visible in the air",
+         "objects becoming brittle from cold", "sounds becoming muffled")
+    ),
+    "cold": (
+        frozenset(("chilly", "brisk", "cold", "cool", "nippy")),
+        ("shivering slightly", "seeking warmth", 
+         "cold metal surfaces", "goosebumps forming")
+    ),
+    "mild": (
+        frozenset(("pleasant", "mild", "comfortable", "temperate")),
+        ("comfortable atmospheric conditions", "unremarkable temperature")
+    ),
+    "warm": (
+        frozenset(("warm", "balmy", "summery", "pleasant")),
+        ("slight perspiration", "seeking shade", 
+         "surfaces warm to the touch")
+    ),
+    "hot": (
+        frozenset(("scorching", "searing", "sweltering", "blistering", 
+                   "blazing", "sultry", "torrid")),
+        ("heat mirages", "oppressive heat", "air distortion from heat",
+         "surfaces too hot to touch", "seeking any available cooling")
+    ),
+}
+
+_HUMIDITY_TABLE = {
+    "humid": (frozenset(("humid", "muggy", "sticky", "damp")), ("air feels thick and heavy",)),
+    "dry": (frozenset(("dry", "arid", "parched")), ("static electricity crackling",)),
+}
+
+_WIND_TABLE = {
+    "windy": (
+        frozenset(("windy", "gusty", "blustery")),
+        ("objects swaying in the wind",
+         "papers flying around",
+         "hair being tussled by wind")
+    ),
+    "breezy": (frozenset(("breezy",)), ("gentle breeze moving light objects",)),
+}
+
+_BITCOIN_TABLE = {
+    "crashing": (
+        frozenset(("unstable", "chaotic", "deteriorating", "collapsing", 
+                   "shattering", "fragmenting")),
+        ("digital displays flickering with red numbers", 
+         "sounds of distant alarms", 
+         "technology glitching more severely",
+         "object surfaces appearing to fracture momentarily")
+    ),
+    "declining": (
+        frozenset(("uncertain", "wavering", "faltering", "fading")),
+        ("subtle downward movements in the corner of vision",
+         "digital displays showing decreasing values",
+         "sounds occasionally distorting to lower pitches")
+    ),
+    "stable": (
+        frozenset(("steady", "consistent", "regular", "balanced")),
+        ("digital systems functioning normally",
+         "predictable patterns in background noise")
+    ),
+    "growing": (
+        frozenset(("energetic", "vibrant", "expanding", "brightening")),
+        ("subtle upward movements in peripheral vision",
+         "lights seeming slightly brighter",
+         "technology functioning with extra efficiency")
+    ),
+    "surging": (
+        frozenset(("electric", "charged", "intense", "luminous", 
+                   "brilliant", "pulsating")),
+        ("digital displays showing rapidly increasing numbers",
+         "faint green glow around electronic objects",
+         "air seeming to vibrate with energy",
+         "sounds occasionally distorting to higher pitches")
+    ),
+}
+
+_MARKET_DIRECTION_TABLE = {
+    "bearish": (
+        frozenset(("descending", "sinking", "diminishing", "contracting")),
+        ("shadows appearing longer than they should be",
+         "room temperature feeling slightly colder",
+         "colors seeming less vibrant")
+    ),
+    "slightly_bearish": (
+        frozenset(("cautious", "restrained", "subdued", "muted")),
+        ("subtle feeling of heaviness in the air",
+         "colors slightly desaturated",
+         "sounds slightly dampened")
+    ),
+    "neutral": (
+        frozenset(("balanced", "steady", "unchanging", "consistent")),
+        ("environment maintaining consistent properties",
+         "regular, predictable physical laws")
+    ),
+    "slightly_bullish": (
+        frozenset(("improving", "rising", "ascending", "elevating")),
+        ("objects seeming slightly lighter than expected",
+         "colors appearing somewhat brighter",
+         "subtle feeling of buoyancy")
+    ),
+    "bullish": (
+        frozenset(("soaring", "climbing", "accelerating", "amplifying")),
+        ("gravity feeling subtly reduced",
+         "colors appearing more vibrant than normal",
+         "sounds resonating with extra clarity")
+    ),
+}
+
+_VOLATILITY_TABLE = {
+    "low": (frozenset(("stable", "predictable", "reliable", "constant")), ()),
+    "moderate": (
+        frozenset(("fluctuating", "shifting", "variable", "uneven")),
+        ("subtle fluctuations in lighting",
+         "occasional slight disorientation")
+    ),
+    "high": (
+        frozenset(("erratic", "turbulent", "unstable", "unpredictable", 
+                   "chaotic", "fractured")),
+        ("reality shimmering at the edges",
+         "sounds occasionally distorting",
+         "momentary visual glitches",
+         "brief sensations of vertigo")
+    ),
+}
+
+# Mood each source condition adds to the combined glitches; conditions not
+# listed add no mood
+_BTC_MOOD = {
+    "crashing": "anxious",
+    "declining": "uneasy",
+    "stable": "balanced",
+    "growing": "optimistic",
+    "surging": "euphoric",
+}
+_WEATHER_MOOD = {
+    "freezing": "stark",
+    "cold": "somber",
+    "mild": "neutral",
+    "warm": "pleasant",
+    "hot": "intense",
+}
+_STOCK_MOOD = {
+    "bearish": "pessimistic",
+    "slightly_bearish": "concerned",
+    "neutral": "steady",
+    "slightly_bullish": "hopeful",
+    "bullish": "enthusiastic",
+}
+_VOL_MOOD = {
+    "high": "unstable",
+    "moderate": "dynamic",
+}
+
+# System message additions per glitch intensity, filled in by get_story_modifiers
+_MSG_NONE = "Keep the story realistic and grounded."
+_MSG_SLIGHT = """
+Subtly incorporate the following reality glitch elements into your storytelling:
+- Overall mood: {mood}
+- Use these descriptive elements occasionally: {descriptors}
+- Minor anomalies that could happen: {anomalies}
+"""
+_MSG_MODERATE = """
+Distinctly incorporate these reality glitch elements into your narrative:
+- Overall atmosphere: {mood}
+- Frequently use these descriptive elements: {descriptors}
+- Anomalies to include: {anomalies}
+"""
+_MSG_STRONG = """
+Prominently feature these major reality glitch elements throughout your narrative:
+- Dominant atmosphere: {mood}
+- Heavily emphasize these descriptive elements: {descriptors}
+- Major anomalies to weave into the story: {anomalies}
+"""
+
+# Anomalies added by the severe triggers in _get_combined_glitches
+_BTC_CRASH_ANOMALIES = (
+    "Digital displays momentarily show cascading numbers",
+    "Electronics briefly malfunction, showing error codes",
+    "The air feels charged with a sense of digital panic",
+    "Shadows seem to darken and stretch in impossible ways",
+    "Lights flicker in patterns that somehow feel mathematical",
+)
+
+_BTC_SURGE_ANOMALIES = (
+    "Electronic devices emit a subtle green glow",
+    "The air crackles with unexpected static electricity",
+    "Digital displays briefly show rapidly increasing numbers",
+    "Light sources seem unusually bright and oversaturated",
+    "Objects appear to vibrate with a strange energy",
+)
+
+_CRASH_ANOMALIES = (
+    "Objects appear slightly heavier, as if gravity increased",
+    "Colors drain from the environment in pulses",
+    "A distant sound of breaking glass occasionally echoes",
+    "Vertical lines in the environment appear to bend downward",
+    "Reflective surfaces momentarily show distorted versions of reality",
+)
+
+_BOOM_ANOMALIES = (
+    "Objects seem lighter, almost buoyant",
+    "Colors appear unnaturally vibrant in waves",
+    "A subtle upward motion appears in peripheral vision",
+    "Light sources create halos that weren't there before",
+    "Reflective surfaces briefly show idealized versions of reality",
+)
+
+_HEAT_ANOMALIES = (
+    "The air wavers with visible heat distortion",
+    "Surfaces appear to shimmer at the edges",
+    "Colors become unnaturally vivid and intense",
+    "A sense of time dilation makes movements seem slower",
+    "Objects cast multiple overlapping shadows",
+)
+
+_COLD_ANOMALIES = (
+    "Breath freezes in mid-air, hanging like crystalline sculptures",
+    "Sounds become muffled and distant",
+    "Colors desaturate to near monochrome",
+    "Surfaces develop intricate frost patterns that form and reform",
+    "Time seems to slow as the cold intensifies",
+)
+
+# Random anomalies sampled for moderate and strong intensities
+_POTENTIAL_ANOMALIES = (
+    "Objects briefly cast shadows in impossible directions",
+    "Sounds occasionally play in reverse",
+    "Peripheral vision reveals movement that disappears when looked at directly",
+    "Reflective surfaces show a slight delay in movements",
+    "Time briefly dilates, making moments stretch or compress",
+    "Colors shift subtly toward unusual spectrums",
+    "The taste of metal briefly appears in the mouth",
+    "Static electricity affects objects in unusual ways",
+    "Words spoken seem to have a subtle echo that wasn't there before",
+    "Familiar objects momentarily appear foreign or wrong",
+)
+
+# Glitch structures. They are frozen because built glitches are cached and
+# shared between callers. __slots__ is written out because dataclass(slots=True)
+# needs Python 3.10; fields therefore have no defaults.
+@dataclass(frozen=True)
+class WeatherGlitch:
+    """Weather-based reality glitches."""
+    __slots__ = ("active", "temperature", "condition", "descriptors", "events")
+    active: bool  # Whether there is weather data
+    temperature: Optional[float]  # Temperature in °C
+    condition: str  # Temperature condition, e.g. "freezing" or "hot"
+    descriptors: FrozenSet[str]
+    events: Tuple[str, ...]
+
+@dataclass(frozen=True)
+class BitcoinGlitch:
+    """Bitcoin-based reality glitches."""
+    __slots__ = ("active", "price", "change_1h", "change_24h", "condition", "descriptors", "events")
+    active: bool  # Whether there is bitcoin data
+    price: Optional[float]  # Price in USD
+    change_1h: Optional[float]  # 1h change, in percent
+    change_24h: Optional[float]  # 24h change, in percent
+    condition: str  # Price trend, e.g. "crashing" or "surging"
+    descriptors: FrozenSet[str]
+    events: Tuple[str, ...]
+
+@dataclass(frozen=True)
+class StockGlitch:
+    """Stock market-based reality glitches."""
+    __slots__ = ("active", "market_direction", "volatility", "descriptors", "events")
+    active: bool  # Whether there is stock data
+    market_direction: str  # e.g. "bearish" or "bullish"
+    volatility: str  # "low", "moderate" or "high"
+    descriptors: FrozenSet[str]
+    events: Tuple[str, ...]
+
+@dataclass(frozen=True)
+class CombinedGlitch:
+    """Reality glitch effects combined from all data sources."""
+    __slots__ = ("intensity", "descriptors", "mood", "anomalies")
+    intensity: str  # "none", "slight", "moderate" or "strong"
+    descriptors: Sequence[str]
+    mood: str
+    anomalies: Sequence[str]
+
+@dataclass
+class StoryModifiers:
+    """Story generation modifiers built from the reality glitches."""
+    __slots__ = ("intensity", "mood", "descriptors", "anomalies", "system_message", "story_prefix")
+    intensity: str
+    mood: str
+    descriptors: List[str]  # Descriptors picked for this story turn
+    anomalies: List[str]  # Anomalies picked for this story turn
+    system_message: str  # Addition to the LLM system prompt
+    story_prefix: str
+
+class GlitchesView:
+    """
+    Reality glitches for one snapshot of the cached data, with each category
+    built the first time it is read.
+    
+    Categories are read by attribute or by key ("weather", "bitcoin",
+    "stocks", "combined"), like the dictionary get_reality_glitches used to
+    return. The combined glitches build the three source categories.
+    """
+    
+    _KEYS = frozenset(("weather", "bitcoin", "stocks", "combined"))
+    
+    def __init__(self, reality_data, cache):
+        """
+        Args:
+            reality_data: RealityData instance whose builders are used
+            cache: Snapshot of RealityData.cache to build from
+        """
+        self._reality_data = reality_data
+        self._cache = cache
+    
+    def __getitem__(self, key):
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    @cached_property
+    def weather(self) -> WeatherGlitch:
+        return self._reality_data._get_weather_glitches(self._cache["weather"])
+    
+    @cached_property
+    def bitcoin(self) -> BitcoinGlitch:
+        return self._reality_data._get_bitcoin_glitches(self._cache["bitcoin"])
+    
+    @cached_property
+    def _stocks_and_stats(self):
+        return self._reality_data._get_stock_glitches(self._cache["stocks"])
+    
+    @property
+    def stocks(self) -> StockGlitch:
+        return self._stocks_and_stats[0]
+    
+    @cached_property
+    def combined(self) -> CombinedGlitch:
+        stock_glitches, stock_stats = self._stocks_and_stats
+        return self._reality_data._get_combined_glitches(
+            self._cache, self.bitcoin, self.weather, stock_glitches, stock_stats
+        )
+
+# Glitches returned when none of the sources has data, also the defaults for a
+# single source without data
+_EMPTY_GLITCHES = MappingProxyType({
+    "weather": WeatherGlitch(
+        active=False,
+        temperature=None,
+        condition="neutral",
+        descriptors=frozenset(),
+        events=()
+    ),
+    "bitcoin": BitcoinGlitch(
+        active=False,
+        price=None,
+        change_1h=None,
+        change_24h=None,
+        condition="neutral",
+        descriptors=frozenset(),
+        events=()
+    ),
+    "stocks": StockGlitch(
+        active=False,
+        market_direction="neutral",
+        volatility="low",
+        descriptors=frozenset(),
+        events=()
+    ),
+    "combined": CombinedGlitch(
+        intensity="none",
+        descriptors=("normal", "ordinary", "standard", "usual"),
+        mood="neutral",
+        anomalies=()
+    )
+})
+
+def _sample_k(seq, k, rng):
+    """
+    Pick up to k random items from a sequence.
+    
+    Large pools use Algorithm L reservoir sampling, which jumps between the
+    items it keeps instead of indexing the whole pool like random.sample.
+    
+    Args:
+        seq: Sequence to sample from
+        k: Number of items to pick
+        rng: random.Random instance supplying the randomness
+        
+    Returns:
+        List of up to k items from seq
+    """
+    n = len(seq)
+    if n <= 4 * k:
+        return rng.sample(seq, min(k, n))
+    
+    # random() can return 0.0, which has no logarithm
+    tiny = sys.float_info.min
+    reservoir = list(seq[:k])
+    log_w = log(rng.random() or tiny) / k
+    i = k - 1
+    while True:
+        # log(-expm1(log_w)) is log(1 - w) without rounding w up to 1
+        i += floor(log(rng.random() or tiny) / log(-expm1(log_w))) + 1
+        if i >= n:
+            return reservoir
+        reservoir[rng.randrange(k)] = seq[i]
+        log_w += log(rng.random() or tiny) / k
+
 class RealityData:
     """
     Class to integrate real-time data into the story generation.
@@ -30,370 +467,292 @@ class RealityData:
             "bitcoin": None,
             "weather": None,
             "stocks": None,
-            "last_update": None
+            "last_update": None,
+            "last_sync": None
         }
+        # Monotonic time of the last successful refresh, for the freshness check
+        self._last_update_mono = None
+        
+        # Story modifiers built for the current glitches, as (glitches, modifiers)
+        self._modifiers_cache = None
+        
+        # Random choices get their own generator instead of the shared module state
+        self._rng = random.Random()
+        
+        # Glitches built from the cached data, keyed by cache["last_update"]
+        self._glitches_cache = None
+        self._glitches_cache_key = None
+        
+        # Monotonic time get_snapshot last looked for a newer sync
+        self._sync_checked = None
+        
+        # Background refreshes: only one runs at a time, and failures push the
+        # next attempt back (monotonic time)
+        self._refresh_lock = threading.Lock()
+        self._retry_delay = 0
+        self._retry_at = 0.0
         
         # Refresh data on initialization
         self.refresh_data()
     
     def refresh_data(self) -> None:
         """Refresh all cached data from the database."""
-        if self.debug:
-            print("Refreshing reality data from database...")
-            
-        try:
-            self.cache["bitcoin"] = self.db_ops.get_latest_bitcoin_data()
-            self.cache["weather"] = self.db_ops.get_latest_weather_data()
-            self.cache["stocks"] = self.db_ops.get_latest_stock_data()
-            self.cache["last_update"] = datetime.now()
-            
+        with self._refresh_lock:
             if self.debug:
-                print("Data refresh complete")
-        except Exception as e:
-            if self.debug:
-                print(f"Error refreshing data: {e}")
+                print("Refreshing reality data from database...")
+            
+            try:
+                # One round-trip for all three sources
+                latest = self.db_ops.get_latest_all()
+                if latest is None:
+                    raise RuntimeError("Could not read the latest data")
+                bitcoin, weather, stocks, last_sync = latest
+                # Swap in a new cache so readers never see a half-updated one
+                self.cache = {
+                    "bitcoin": bitcoin,
+                    "weather": weather,
+                    "stocks": stocks,
+                    "last_update": datetime.now(),
+                    "last_sync": last_sync
+                }
+                self._last_update_mono = time.monotonic()
+                self._retry_delay = 0
+                
+                # Fresh data makes the previous glitches stale
+                self._glitches_cache = None
+                self._glitches_cache_key = None
+                
+                if self.debug:
+                    print("Data refresh complete")
+            except Exception as e:
+                # Keep serving the previous data and back off before retrying
+                self._retry_delay = min(RETRY_BACKOFF[1], self._retry_delay * 2 or RETRY_BACKOFF[0])
+                self._retry_at = time.monotonic() + self._retry_delay
+                if self.debug:
+                    print(f"Error refreshing data: {e}")
     
-    def get_reality_glitches(self) -> Dict[str, Any]:
+    def refresh_in_background(self) -> bool:
         """
-        Get reality glitches based on real-time data.
+        Start refresh_data on a daemon thread unless a refresh is already running.
         
         Returns:
-            Dict[str, Any]: A dictionary containing data-driven reality glitches
+            bool: True if a refresh was started
         """
-        # Check if data is stale (older than 10 minutes)
-        if (self.cache["last_update"] is None or 
-            (datetime.now() - self.cache["last_update"]).total_seconds() > 600):
-            self.refresh_data()
-        
-        # Build the reality glitches dictionary
-        glitches = {
-            "weather": self._get_weather_glitches(),
-            "bitcoin": self._get_bitcoin_glitches(),
-            "stocks": self._get_stock_glitches(),
-            "combined": self._get_combined_glitches()
-        }
+        if self._refresh_lock.locked() or time.monotonic() < self._retry_at:
+            return False
+        threading.Thread(target=self.refresh_data, daemon=True).start()
+        return True
+    
+    def get_reality_glitches(self) -> Mapping[str, Any]:
+        """
+        Get reality glitches based on real-time data.
         
+        The glitches are built once per data refresh and shared between calls,
+        so callers must not modify them.
+        
+        Returns:
+            Mapping[str, Any]: The data-driven reality glitches by category, as a
+            GlitchesView or _EMPTY_GLITCHES when there is no data
+        """
+        # Load the data on first use; after that stale data is served while a
+        # background refresh replaces it
+        if self._last_update_mono is None:
+            if time.monotonic() >= self._retry_at:
+                self.refresh_data()
+        elif time.monotonic() - self._last_update_mono > REFRESH_INTERVAL:
+            self.refresh_in_background()
+        
+        # Nothing to build from when every source is empty
+        cache = self.cache
+        if not (cache["bitcoin"] or cache["weather"] or cache["stocks"]):
+            return _EMPTY_GLITCHES
+        
+        # The glitches only change when the data does
+        key = cache["last_update"]
+        if self._glitches_cache is not None and self._glitches_cache_key == key:
+            return self._glitches_cache
+        
+        # Each category is only built once something reads it
+        glitches = GlitchesView(self, cache)
+        
+        self._glitches_cache = glitches
+        self._glitches_cache_key = key
         return glitches
     
-    def _get_weather_glitches(self) -> Dict[str, Any]:
-        """Extract weather-based reality glitches."""
-        weather_data = self.cache["weather"]
-        glitches = {
-            "active": False,
-            "temperature": None,
-            "condition": "neutral",
-            "descriptors": [],
-            "events": []
-        }
+    def get_snapshot(self) -> Mapping[str, Any]:
+        """
+        Get reality glitches shared between callers.
         
-        if not weather_data:
-            return glitches
+        The glitches are only rebuilt when a refresh brings new data; stale data
+        is served while get_reality_glitches refreshes it in the background.
+        At most every SYNC_CHECK_INTERVAL seconds the last sync time is checked,
+        and data a newer sync wrote is loaded in the background.
         
-        # Mark glitch as active
-        glitches["active"] = True
+        Returns:
+            Mapping[str, Any]: The reality glitches; callers must not modify them
+        """
+        now = time.monotonic()
+        if self._last_update_mono is not None and (
+                self._sync_checked is None or now - self._sync_checked >= SYNC_CHECK_INTERVAL):
+            self._sync_checked = now
+            if self.db_ops.get_last_sync_time() != self.cache["last_sync"]:
+                self.refresh_in_background()
+        return self.get_reality_glitches()
+    
+    def _get_weather_glitches(self, weather_data: Optional[Dict[str, Any]]) -> WeatherGlitch:
+        """Extract weather-based reality glitches from the cached weather data."""
+        if not weather_data:
+            return _EMPTY_GLITCHES["weather"]
         
-        # Extract temperature
-        glitches["temperature"] = weather_data.get("temperature_c")
+        # Read the fields once
+        get = weather_data.get
+        temperature, humidity, wind_kph = get("temperature_c"), get("humidity"), get("wind_kph")
+        condition = "neutral"
+        descriptors = frozenset()
+        events = ()
         
         # Set condition based on temperature
-        if glitches["temperature"] is not None:
-            temp = glitches["temperature"]
-            if temp < 0:
-                glitches["condition"] = "freezing"
-                glitches["descriptors"] = [
-                    "frost-covered", "ice-cold", "frigid", "frozen", 
-                    "glacial", "wintry", "crystalline"
-                ]
-                glitches["events"] = [
-                    "ice forming on surfaces", "breath visible in the air",
-                    "objects becoming brittle from cold", "sounds becoming muffled"
-                ]
-            elif temp < 10:
-                glitches["condition"] = "cold"
-                glitches["descriptors"] = [
-                    "chilly", "brisk", "cold", "cool", "nippy"
-                ]
-                glitches["events"] = [
-                    "shivering slightly", "seeking warmth", 
-                    "cold metal surfaces", "goosebumps forming"
-                ]
-            elif temp < 20:
-                glitches["condition"] = "mild"
-                glitches["descriptors"] = [
-                    "pleasant", "mild", "comfortable", "temperate"
-                ]
-                glitches["events"] = [
-                    "comfortable atmospheric conditions", "unremarkable temperature"
-                ]
-            elif temp < 30:
-                glitches["condition"] = "warm"
-                glitches["descriptors"] = [
-                    "warm", "balmy", "summery", "pleasant"
-                ]
-                glitches["events"] = [
-                    "slight perspiration", "seeking shade", 
-                    "surfaces warm to the touch"
-                ]
-            else:
-                glitches["condition"] = "hot"
-                glitches["descriptors"] = [
-                    "scorching", "searing", "sweltering", "blistering", 
-                    "blazing", "sultry", "torrid"
-                ]
-                glitches["events"] = [
-                    "heat mirages", "oppressive heat", "air distortion from heat",
-                    "surfaces too hot to touch", "seeking any available cooling"
-                ]
+        if temperature is not None:
+            condition = _TEMP_CONDS[bisect_right(_TEMP_THRESHOLDS, temperature)]
+            descriptors, events = _WEATHER_TABLE[condition]
         
         # Add humidity effects if available
-        humidity = weather_data.get("humidity")
         if humidity is not None:
-            if humidity > 80:
-                glitches["descriptors"].extend(["humid", "muggy", "sticky", "damp"])
-                glitches["events"].append("air feels thick and heavy")
-            elif humidity < 30:
-                glitches["descriptors"].extend(["dry", "arid", "parched"])
-                glitches["events"].append("static electricity crackling")
+            effect = "humid" if humidity > 80 else "dry" if humidity < 30 else None
+            if effect:
+                extra_descriptors, extra_events = _HUMIDITY_TABLE[effect]
+                descriptors |= extra_descriptors
+                events += extra_events
         
         # Add wind effects if available
-        wind_kph = weather_data.get("wind_kph")
         if wind_kph is not None:
-            if wind_kph > 30:
-                glitches["descriptors"].extend(["windy", "gusty", "blustery"])
-                glitches["events"].extend([
-                    "objects swaying in the wind",
-                    "papers flying around",
-                    "hair being tussled by wind"
-                ])
-            elif wind_kph > 10:
-                glitches["descriptors"].append("breezy")
-                glitches["events"].append("gentle breeze moving light objects")
-        
-        return glitches
+            effect = "windy" if wind_kph > 30 else "breezy" if wind_kph > 10 else None
+            if effect:
+                extra_descriptors, extra_events = _WIND_TABLE[effect]
+                descriptors |= extra_descriptors
+                events += extra_events
+        
+        return WeatherGlitch(
+            active=True,
+            temperature=temperature,
+            condition=condition,
+            descriptors=descriptors,
+            events=events
+        )
     
-    def _get_bitcoin_glitches(self) -> Dict[str, Any]:
-        """Extract bitcoin-based reality glitches."""
-        bitcoin_data = self.cache["bitcoin"]
-        glitches = {
-            "active": False,
-            "price": None,
-            "change_1h": None,
-            "change_24h": None,
-            "condition": "neutral",
-            "descriptors": [],
-            "events": []
-        }
-        
+    def _get_bitcoin_glitches(self, bitcoin_data: Optional[Dict[str, Any]]) -> BitcoinGlitch:
+        """Extract bitcoin-based reality glitches from the cached bitcoin data."""
         if not bitcoin_data:
-            return glitches
+            return _EMPTY_GLITCHES["bitcoin"]
         
-        # Mark glitch as active
-        glitches["active"] = True
-        
-        # Extract price and changes
-        glitches["price"] = bitcoin_data.get("price_usd")
-        glitches["change_1h"] = bitcoin_data.get("percent_change_1h")
-        glitches["change_24h"] = bitcoin_data.get("percent_change_24h")
+        # Read the price and changes once
+        get = bitcoin_data.get
+        change_1h = get("percent_change_1h")
+        condition = "neutral"
+        descriptors = frozenset()
+        events = ()
         
         # Base condition on recent price changes
-        if glitches["change_1h"] is not None:
-            change = glitches["change_1h"]
-            
-            if change < -5:  # Significant crash
-                glitches["condition"] = "crashing"
-                glitches["descriptors"] = [
-                    "unstable", "chaotic", "deteriorating", "collapsing", 
-                    "shattering", "fragmenting"
-                ]
-                glitches["events"] = [
-                    "digital displays flickering with red numbers", 
-                    "sounds of distant alarms", 
-                    "technology glitching more severely",
-                    "object surfaces appearing to fracture momentarily"
-                ]
-            elif change < -2:  # Moderate decline
-                glitches["condition"] = "declining"
-                glitches["descriptors"] = [
-                    "uncertain", "wavering", "faltering", "fading"
-                ]
-                glitches["events"] = [
-                    "subtle downward movements in the corner of vision",
-                    "digital displays showing decreasing values",
-                    "sounds occasionally distorting to lower pitches"
-                ]
-            elif change < 2:  # Stable
-                glitches["condition"] = "stable"
-                glitches["descriptors"] = [
-                    "steady", "consistent", "regular", "balanced"
-                ]
-                glitches["events"] = [
-                    "digital systems functioning normally",
-                    "predictable patterns in background noise"
-                ]
-            elif change < 5:  # Moderate growth
-                glitches["condition"] = "growing"
-                glitches["descriptors"] = [
-                    "energetic", "vibrant", "expanding", "brightening"
-                ]
-                glitches["events"] = [
-                    "subtle upward movements in peripheral vision",
-                    "lights seeming slightly brighter",
-                    "technology functioning with extra efficiency"
-                ]
-            else:  # Significant growth
-                glitches["condition"] = "surging"
-                glitches["descriptors"] = [
-                    "electric", "charged", "intense", "luminous", 
-                    "brilliant", "pulsating"
-                ]
-                glitches["events"] = [
-                    "digital displays showing rapidly increasing numbers",
-                    "faint green glow around electronic objects",
-                    "air seeming to vibrate with energy",
-                    "sounds occasionally distorting to higher pitches"
-                ]
-        
-        return glitches
+        if change_1h is not None:
+            condition = _BTC_CONDS[bisect_right(_BTC_THRESHOLDS, change_1h)]
+            descriptors, events = _BITCOIN_TABLE[condition]
+        
+        return BitcoinGlitch(
+            active=True,
+            price=get("price_usd"),
+            change_1h=change_1h,
+            change_24h=get("percent_change_24h"),
+            condition=condition,
+            descriptors=descriptors,
+            events=events
+        )
     
-    def _get_stock_glitches(self) -> Dict[str, Any]:
-        """Extract stock market-based reality glitches."""
-        stock_data = self.cache["stocks"]
-        glitches = {
-            "active": False,
-            "market_direction": "neutral",
-            "volatility": "low",
-            "descriptors": [],
-            "events": []
-        }
-        
-        if not stock_data or len(stock_data) == 0:
-            return glitches
+    def _get_stock_glitches(self, stock_data: Optional[List[Dict[str, Any]]]) -> Tuple[StockGlitch, Tuple[float, int]]:
+        """
+        Extract stock market-based reality glitches from the cached stock data.
         
-        # Mark glitch as active
-        glitches["active"] = True
+        Returns:
+            Tuple: The glitches and (average % change, number of indices), which
+            _get_combined_glitches uses so it doesn't walk the stocks again
+        """
+        if not stock_data:
+            return _EMPTY_GLITCHES["stocks"], (0.0, 0)
         
-        # Calculate average change across indices
-        total_change_percent = 0
+        # Calculate average change and its spread across indices in one pass
+        total_change_percent = 0.0
+        total_squares = 0.0
         count = 0
-        changes = []
         
         for stock in stock_data:
-            if stock.get("price") and stock.get("change"):
-                change_percent = (stock["change"] / stock["price"]) * 100
+            get = stock.get
+            price = get("price")
+            change = get("change")
+            if price and change:
+                change_percent = (change / price) * 100
                 total_change_percent += change_percent
+                total_squares += change_percent * change_percent
                 count += 1
-                changes.append(change_percent)
+        
+        avg_change = total_change_percent / count if count else 0.0
+        
+        direction = "neutral"
+        volatility = "low"
+        descriptors = frozenset()
+        events = ()
         
         if count > 0:
-            avg_change = total_change_percent / count
-            
             # Determine market direction
-            if avg_change < -1.5:
-                glitches["market_direction"] = "bearish"
-                glitches["descriptors"] = [
-                    "descending", "sinking", "diminishing", "contracting"
-                ]
-                glitches["events"] = [
-                    "shadows appearing longer than they should be",
-                    "room temperature feeling slightly colder",
-                    "colors seeming less vibrant"
-                ]
-            elif avg_change < -0.5:
-                glitches["market_direction"] = "slightly_bearish"
-                glitches["descriptors"] = [
-                    "cautious", "restrained", "subdued", "muted"
-                ]
-                glitches["events"] = [
-                    "subtle feeling of heaviness in the air",
-                    "colors slightly desaturated",
-                    "sounds slightly dampened"
-                ]
-            elif avg_change <= 0.5:
-                glitches["market_direction"] = "neutral"
-                glitches["descriptors"] = [
-                    "balanced", "steady", "unchanging", "consistent" 
-                ]
-                glitches["events"] = [
-                    "environment maintaining consistent properties",
-                    "regular, predictable physical laws"
-                ]
-            elif avg_change < 1.5:
-                glitches["market_direction"] = "slightly_bullish"
-                glitches["descriptors"] = [
-                    "improving", "rising", "ascending", "elevating"
-                ]
-                glitches["events"] = [
-                    "objects seeming slightly lighter than expected",
-                    "colors appearing somewhat brighter",
-                    "subtle feeling of buoyancy"
-                ]
-            else:
-                glitches["market_direction"] = "bullish"
-                glitches["descriptors"] = [
-                    "soaring", "climbing", "accelerating", "amplifying"
-                ]
-                glitches["events"] = [
-                    "gravity feeling subtly reduced",
-                    "colors appearing more vibrant than normal",
-                    "sounds resonating with extra clarity"
-                ]
+            direction = _STOCK_CONDS[bisect_right(_STOCK_THRESHOLDS, avg_change)]
+            descriptors, events = _MARKET_DIRECTION_TABLE[direction]
         
             # Calculate volatility (standard deviation of changes)
-            if len(changes) > 1:
-                mean = sum(changes) / len(changes)
-                variance = sum((x - mean) ** 2 for x in changes) / len(changes)
-                std_dev = float(variance) ** 0.5
+            if count > 1:
+                variance = max(0.0, total_squares / count - avg_change * avg_change)
+                std_dev = variance ** 0.5
                 
                 # Set volatility descriptor
-                if std_dev < 0.5:
-                    glitches["volatility"] = "low"
-                    glitches["descriptors"].extend([
-                        "stable", "predictable", "reliable", "constant"
-                    ])
-                elif std_dev < 1.5:
-                    glitches["volatility"] = "moderate"
-                    glitches["descriptors"].extend([
-                        "fluctuating", "shifting", "variable", "uneven"
-                    ])
-                    glitches["events"].extend([
-                        "subtle fluctuations in lighting",
-                        "occasional slight disorientation"
-                    ])
-                else:
-                    glitches["volatility"] = "high"
-                    glitches["descriptors"].extend([
-                        "erratic", "turbulent", "unstable", "unpredictable", 
-                        "chaotic", "fractured"
-                    ])
-                    glitches["events"].extend([
-                        "reality shimmering at the edges",
-                        "sounds occasionally distorting",
-                        "momentary visual glitches",
-                        "brief sensations of vertigo"
-                    ])
-        
-        return glitches
+                volatility = _VOL_CONDS[bisect_right(_VOL_THRESHOLDS, std_dev)]
+                extra_descriptors, extra_events = _VOLATILITY_TABLE[volatility]
+                descriptors |= extra_descriptors
+                events += extra_events
+        
+        return StockGlitch(
+            active=True,
+            market_direction=direction,
+            volatility=volatility,
+            descriptors=descriptors,
+            events=events
+        ), (avg_change, count)
     
-    def _get_combined_glitches(self) -> Dict[str, Any]:
-        """Generate combined effects from all data sources."""
+    def _get_combined_glitches(self, cache: Dict[str, Any], bitcoin_glitches: BitcoinGlitch,
+                               weather_glitches: WeatherGlitch, stock_glitches: StockGlitch,
+                               stock_stats: Tuple[float, int]) -> CombinedGlitch:
+        """
+        Generate combined effects from all data sources.
+        
+        Args:
+            cache: Snapshot of the cached data the glitches are built from
+            bitcoin_glitches: Result of _get_bitcoin_glitches for the data
+            weather_glitches: Result of _get_weather_glitches for the data
+            stock_glitches: Glitches returned by _get_stock_glitches for the data
+            stock_stats: Stock statistics returned by _get_stock_glitches for the data
+            
+        Returns:
+            CombinedGlitch: The combined reality glitch effects
+        """
         # Check if we have valid data for at least one source
-        if (not self.cache["bitcoin"] and 
-            not self.cache["weather"] and 
-            not self.cache["stocks"]):
-            return {
-                "intensity": "none",
-                "descriptors": ["normal", "ordinary", "standard", "usual"],
-                "mood": "neutral",
-                "anomalies": []
-            }
+        if (not cache["bitcoin"] and 
+            not cache["weather"] and 
+            not cache["stocks"]):
+            return _EMPTY_GLITCHES["combined"]
         
         # Count active data sources for intensity calculation
         active_sources = 0
-        if self.cache["bitcoin"]:
+        if cache["bitcoin"]:
             active_sources += 1
-        if self.cache["weather"]:
+        if cache["weather"]:
             active_sources += 1
-        if self.cache["stocks"] and len(self.cache["stocks"]) > 0:
+        if cache["stocks"] and len(cache["stocks"]) > 0:
             active_sources += 1
         
         # Calculate overall reality glitch intensity
@@ -405,261 +764,155 @@ class RealityData:
         elif active_sources == 3:
             intensity = "strong"
         
-        # Generate combined glitch effects
-        combined = {
-            "intensity": intensity,
-            "descriptors": [],
-            "mood": "neutral",
-            "anomalies": []
-        }
-        
         # Define severe anomaly triggers
         anomaly_triggers = {
-            "bitcoin_crash": self.cache["bitcoin"] and self.cache["bitcoin"].get("percent_change_1h", 0) < -7,
-            "bitcoin_surge": self.cache["bitcoin"] and self.cache["bitcoin"].get("percent_change_1h", 0) > 7,
-            "extreme_temp": self.cache["weather"] and (
-                self.cache["weather"].get("temperature_c", 20) > 35 or 
-                self.cache["weather"].get("temperature_c", 20) < -10
+            "bitcoin_crash": cache["bitcoin"] and cache["bitcoin"].get("percent_change_1h", 0) < -7,
+            "bitcoin_surge": cache["bitcoin"] and cache["bitcoin"].get("percent_change_1h", 0) > 7,
+            "extreme_temp": cache["weather"] and (
+                cache["weather"].get("temperature_c", 20) > 35 or 
+                cache["weather"].get("temperature_c", 20) < -10
             ),
             "market_crash": False,
             "market_boom": False
         }
         
         # Check for market extremes
-        if self.cache["stocks"] and len(self.cache["stocks"]) > 0:
-            total_change_percent = 0
-            count = 0
-            
-            for stock in self.cache["stocks"]:
-                if stock.get("price") and stock.get("change"):
-                    change_percent = (stock["change"] / stock["price"]) * 100
-                    total_change_percent += change_percent
-                    count += 1
-            
+        if cache["stocks"] and len(cache["stocks"]) > 0:
+            avg_change, count = stock_stats
             if count > 0:
-                avg_change = total_change_percent / count
                 anomaly_triggers["market_crash"] = avg_change < -3
                 anomaly_triggers["market_boom"] = avg_change > 3
         
-        # Combine descriptors and generate overall mood
+        # Generate overall mood from the source conditions
         moods = []
         
         # Bitcoin influence
-        if self.cache["bitcoin"]:
-            bitcoin_glitches = self._get_bitcoin_glitches()
-            combined["descriptors"].extend(bitcoin_glitches["descriptors"])
-            
+        if cache["bitcoin"]:
             # Set mood based on bitcoin condition
-            if bitcoin_glitches["condition"] == "crashing":
-                moods.append("anxious")
-            elif bitcoin_glitches["condition"] == "declining":
-                moods.append("uneasy")
-            elif bitcoin_glitches["condition"] == "stable":
-                moods.append("balanced")
-            elif bitcoin_glitches["condition"] == "growing":
-                moods.append("optimistic")
-            elif bitcoin_glitches["condition"] == "surging":
-                moods.append("euphoric")
+            mood = _BTC_MOOD.get(bitcoin_glitches.condition)
+            if mood:
+                moods.append(mood)
         
         # Weather influence
-        if self.cache["weather"]:
-            weather_glitches = self._get_weather_glitches()
-            combined["descriptors"].extend(weather_glitches["descriptors"])
-            
+        if cache["weather"]:
             # Set mood based on weather condition
-            if weather_glitches["condition"] == "freezing":
-                moods.append("stark")
-            elif weather_glitches["condition"] == "cold":
-                moods.append("somber")
-            elif weather_glitches["condition"] == "mild":
-                moods.append("neutral")
-            elif weather_glitches["condition"] == "warm":
-                moods.append("pleasant")
-            elif weather_glitches["condition"] == "hot":
-                moods.append("intense")
+            mood = _WEATHER_MOOD.get(weather_glitches.condition)
+            if mood:
+                moods.append(mood)
         
         # Stock market influence
-        if self.cache["stocks"] and len(self.cache["stocks"]) > 0:
-            stock_glitches = self._get_stock_glitches()
-            combined["descriptors"].extend(stock_glitches["descriptors"])
-            
+        if cache["stocks"] and len(cache["stocks"]) > 0:
             # Set mood based on market direction and volatility
-            if stock_glitches["market_direction"] == "bearish":
-                moods.append("pessimistic")
-            elif stock_glitches["market_direction"] == "slightly_bearish":
-                moods.append("concerned")
-            elif stock_glitches["market_direction"] == "neutral":
-                moods.append("steady")
-            elif stock_glitches["market_direction"] == "slightly_bullish":
-                moods.append("hopeful")
-            elif stock_glitches["market_direction"] == "bullish":
-                moods.append("enthusiastic")
+            mood = _STOCK_MOOD.get(stock_glitches.market_direction)
+            if mood:
+                moods.append(mood)
             
             # Add volatility influence
-            if stock_glitches["volatility"] == "high":
-                moods.append("unstable")
-            elif stock_glitches["volatility"] == "moderate":
-                moods.append("dynamic")
+            mood = _VOL_MOOD.get(stock_glitches.volatility)
+            if mood:
+                moods.append(mood)
         
         # Get the most frequent mood, or random selection if tied
+        mood = "neutral"
         if moods:
-            mood_counts = {}
-            for mood in moods:
-                mood_counts[mood] = mood_counts.get(mood, 0) + 1
-            
-            max_count = max(mood_counts.values())
-            most_common_moods = [mood for mood, count in mood_counts.items() if count == max_count]
-            combined["mood"] = random.choice(most_common_moods)
+            # most_common keeps first-seen order among ties
+            mood_counts = Counter(moods).most_common()
+            max_count = mood_counts[0][1]
+            most_common_moods = [mood for mood, count in mood_counts if count == max_count]
+            mood = self._rng.choice(most_common_moods)
         
         # Generate anomalies based on triggers
         anomalies = []
         
         if anomaly_triggers["bitcoin_crash"]:
-            anomalies.extend([
-                "Digital displays momentarily show cascading numbers",
-                "Electronics briefly malfunction, showing error codes",
-                "The air feels charged with a sense of digital panic",
-                "Shadows seem to darken and stretch in impossible ways",
-                "Lights flicker in patterns that somehow feel mathematical"
-            ])
+            anomalies.extend(_BTC_CRASH_ANOMALIES)
         
         if anomaly_triggers["bitcoin_surge"]:
-            anomalies.extend([
-                "Electronic devices emit a subtle green glow",
-                "The air crackles with unexpected static electricity",
-                "Digital displays briefly show rapidly increasing numbers",
-                "Light sources seem unusually bright and oversaturated",
-                "Objects appear to vibrate with a strange energy"
-            ])
+            anomalies.extend(_BTC_SURGE_ANOMALIES)
         
         if anomaly_triggers["extreme_temp"]:
-            if self.cache["weather"].get("temperature_c", 20) > 35:
-                anomalies.extend([
-                    "The air wavers with visible heat distortion",
-                    "Surfaces appear to shimmer at the edges",
-                    "Colors become unnaturally vivid and intense",
-                    "A sense of time dilation makes movements seem slower",
-                    "Objects cast multiple overlapping shadows"
-                ])
+            if cache["weather"].get("temperature_c", 20) > 35:
+                anomalies.extend(_HEAT_ANOMALIES)
             else:  # Cold extreme
-                anomalies.extend([
-                    "Breath freezes in mid-air, hanging like crystalline sculptures",
-                    "Sounds become muffled and distant",
-                    "Colors desaturate to near monochrome",
-                    "Surfaces develop intricate frost patterns that form and reform",
-                    "Time seems to slow as the cold intensifies"
-                ])
+                anomalies.extend(_COLD_ANOMALIES)
         
         if anomaly_triggers["market_crash"]:
-            anomalies.extend([
-                "Objects appear slightly heavier, as if gravity increased",
-                "Colors drain from the environment in pulses",
-                "A distant sound of breaking glass occasionally echoes",
-                "Vertical lines in the environment appear to bend downward",
-                "Reflective surfaces momentarily show distorted versions of reality"
-            ])
+            anomalies.extend(_CRASH_ANOMALIES)
         
         if anomaly_triggers["market_boom"]:
-            anomalies.extend([
-                "Objects seem lighter, almost buoyant",
-                "Colors appear unnaturally vibrant in waves",
-                "A subtle upward motion appears in peripheral vision",
-                "Light sources create halos that weren't there before",
-                "Reflective surfaces briefly show idealized versions of reality"
-            ])
+            anomalies.extend(_BOOM_ANOMALIES)
         
         # Add random anomalies based on intensity
         if intensity == "moderate" or intensity == "strong":
-            potential_anomalies = [
-                "Objects briefly cast shadows in impossible directions",
-                "Sounds occasionally play in reverse",
-                "Peripheral vision reveals movement that disappears when looked at directly",
-                "Reflective surfaces show a slight delay in movements",
-                "Time briefly dilates, making moments stretch or compress",
-                "Colors shift subtly toward unusual spectrums",
-                "The taste of metal briefly appears in the mouth",
-                "Static electricity affects objects in unusual ways",
-                "Words spoken seem to have a subtle echo that wasn't there before",
-                "Familiar objects momentarily appear foreign or wrong"
-            ]
-            
             # Add 1-2 for moderate, 2-4 for strong
-            num_to_add = random.randint(1, 2) if intensity == "moderate" else random.randint(2, 4)
-            random_anomalies = random.sample(potential_anomalies, min(num_to_add, len(potential_anomalies)))
+            num_to_add = self._rng.randint(1, 2) if intensity == "moderate" else self._rng.randint(2, 4)
+            random_anomalies = self._rng.sample(_POTENTIAL_ANOMALIES, min(num_to_add, len(_POTENTIAL_ANOMALIES)))
             anomalies.extend(random_anomalies)
         
-        # Add final anomalies to the combined glitches
-        combined["anomalies"] = anomalies
+        # Sources without data have no descriptors, so the union covers the active ones
+        descriptors = list(bitcoin_glitches.descriptors | weather_glitches.descriptors | stock_glitches.descriptors)
         
-        # Ensure descriptors are unique
-        combined["descriptors"] = list(set(combined["descriptors"]))
-        
-        return combined
+        return CombinedGlitch(
+            intensity=intensity,
+            descriptors=descriptors,
+            mood=mood,
+            anomalies=anomalies
+        )
     
-    def get_story_modifiers(self) -> Dict[str, Any]:
+    def get_story_modifiers(self) -> StoryModifiers:
         """
         Generate story modifiers based on reality data.
         
+        The modifiers, including the descriptors and anomalies picked for the
+        system message, are reused until the glitches are rebuilt.
+        
         Returns:
-            Dict[str, Any]: A dictionary of modifiers for story generation
+            StoryModifiers: The modifiers for story generation
         """
         glitches = self.get_reality_glitches()
+        cached = self._modifiers_cache
+        if cached is not None and cached[0] is glitches:
+            return replace(cached[1])
         combined = glitches["combined"]
         
         # Generate system message additions based on glitches
-        modifiers = {
-            "intensity": combined["intensity"],
-            "mood": combined["mood"],
-            "descriptors": random.sample(combined["descriptors"], min(5, len(combined["descriptors"]))),
-            "anomalies": random.sample(combined["anomalies"], min(3, len(combined["anomalies"]))),
-            "system_message": "",
-            "story_prefix": "",
-        }
-        
-        # Specific reality data that might be relevant to the story
-        specific_data = {}
-        
-        if glitches["bitcoin"]["active"]:
-            specific_data["bitcoin_price"] = glitches["bitcoin"]["price"]
-            specific_data["bitcoin_trend"] = glitches["bitcoin"]["condition"]
-        
-        if glitches["weather"]["active"]:
-            specific_data["temperature"] = glitches["weather"]["temperature"]
-            specific_data["weather_condition"] = glitches["weather"]["condition"]
-        
-        if glitches["stocks"]["active"]:
-            specific_data["market_direction"] = glitches["stocks"]["market_direction"]
-            specific_data["market_volatility"] = glitches["stocks"]["volatility"]
+        modifiers = StoryModifiers(
+            intensity=combined.intensity,
+            mood=combined.mood,
+            descriptors=_sample_k(combined.descriptors, 5, self._rng),
+            anomalies=_sample_k(combined.anomalies, 3, self._rng),
+            system_message="",
+            story_prefix=""
+        )
         
         # Create system message addition based on intensity
-        if combined["intensity"] == "none":
-            modifiers["system_message"] = "Keep the story realistic and grounded."
-        elif combined["intensity"] == "slight":
-            modifiers["system_message"] = f"""
-Subtly incorporate the following reality glitch elements into your storytelling:
-- Overall mood: {combined["mood"]}
-- Use these descriptive elements occasionally: {', '.join(modifiers["descriptors"])}
-- Minor anomalies that could happen: {random.choice(combined["anomalies"]) if combined["anomalies"] else "slight déjà vu"}
-"""
-        elif combined["intensity"] == "moderate":
-            modifiers["system_message"] = f"""
-Distinctly incorporate these reality glitch elements into your narrative:
-- Overall atmosphere: {combined["mood"]}
-- Frequently use these descriptive elements: {', '.join(modifiers["descriptors"])}
-- Anomalies to include: {'. '.join(modifiers["anomalies"][:2])}
-"""
-        elif combined["intensity"] == "strong":
-            modifiers["system_message"] = f"""
-Prominently feature these major reality glitch elements throughout your narrative:
-- Dominant atmosphere: {combined["mood"]}
-- Heavily emphasize these descriptive elements: {', '.join(modifiers["descriptors"])}
-- Major anomalies to weave into the story: {'. '.join(modifiers["anomalies"])}
-"""
+        intensity = combined.intensity
+        if intensity == "none":
+            modifiers.system_message = _MSG_NONE
+        elif intensity == "slight":
+            modifiers.system_message = _MSG_SLIGHT.format(
+                mood=combined.mood,
+                descriptors=', '.join(modifiers.descriptors),
+                anomalies=self._rng.choice(combined.anomalies) if combined.anomalies else "slight déjà vu"
+            )
+        elif intensity == "moderate":
+            modifiers.system_message = _MSG_MODERATE.format(
+                mood=combined.mood,
+                descriptors=', '.join(modifiers.descriptors),
+                anomalies='. '.join(modifiers.anomalies[:2])
+            )
+        elif intensity == "strong":
+            modifiers.system_message = _MSG_STRONG.format(
+                mood=combined.mood,
+                descriptors=', '.join(modifiers.descriptors),
+                anomalies='. '.join(modifiers.anomalies)
+            )
         
         # Simply set story_prefix to empty string to avoid transition phrases
-        modifiers["story_prefix"] = ""
+        modifiers.story_prefix = ""
         
-        return modifiers
+        self._modifiers_cache = (glitches, modifiers)
+        return replace(modifiers)
     
     def enhance_prompt(self, system_prompt: str) -> str:
         """
@@ -673,27 +926,14 @@ Prominently feature these major reality glitch elements throughout your narrativ
         """
         modifiers = self.get_story_modifiers()
         
-        if modifiers["intensity"] == "none":
+        if modifiers.intensity == "none":
             return system_prompt
         
         # Add the reality glitch modifiers to the system prompt
-        enhanced_prompt = system_prompt + "\n\n" + modifiers["system_message"]
+        enhanced_prompt = system_prompt + "\n\n" + modifiers.system_message
         
         if self.debug:
             print("\nEnhanced prompt with reality glitches:")
-            print(modifiers["system_message"])
+            print(modifiers.system_message)
         
         return enhanced_prompt
-    
-    def enhance_story(self, story: str) -> str:
-        """
-        Enhance a story by adding reality glitch elements.
-        
-        Args:
-            story: The original story text
-            
-        Returns:
-            str: Enhanced story with reality glitch elements
-        """
-        # Simply return the original story without adding transition phrases
-        return story 
\ No newline at end of file
@@ -1,6 +1,9 @@
 import os
 import time
 import sys
+import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -11,6 +14,7 @@ sys.path.append(str(Path(__file__).parent.parent))
 from integration.wrapper_fmp import FmpAPI
 from integration.wrapper_weather import WeatherAPI
 from integration.wrapper_coinmarket import CoinMarketCapAPI
+from integration.http_client import get_session, close_session
 
 # Import database utilities
 from db.db_utils import save_fmp_index_data, save_weather_data, save_bitcoin_data
@@ -24,61 +28,67 @@ class SyncApis:
     
     def __init__(self):
         """Initialize the SyncApis class."""
-        # Initialize API clients
-        self.fmp_api = FmpAPI()
-        self.weather_api = WeatherAPI()
-        self.coinmarket_api = CoinMarketCapAPI()
+        # Initialize API clients on one shared HTTP session
+        session = get_session()
+        self.fmp_api = FmpAPI(session)
+        self.weather_api = WeatherAPI(session)
+        self.coinmarket_api = CoinMarketCapAPI(session)
         self.db_ops = DatabaseOperations()
     
+    def close(self):
+        """Close the shared HTTP session used by the API clients."""
+        close_session()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _fetch_and_save(self, fetch, save):
+        """Fetch data from one API and save it to the database.
+        
+        Args:
+            fetch: API wrapper method returning the data
+            save: Database function storing that data
+            
+        Returns:
+            The fetched data, or None if the API returned nothing
+        """
+        data = fetch()
+        if data:
+            save(data)
+        return data
+    
     def sync_all(self):
-        """Sync data from all APIs to the database."""        
+        """Sync data from all APIs to the database.
+        
+        Returns:
+            Fingerprint of the fetched API data, or None if the sync failed
+        """        
         
         # Collect and save data from each API
         try:
-            # FMP API - Get index quotes            
-            index_quotes = self.fmp_api.get_index_quotes()
-            if index_quotes:                
-                if save_fmp_index_data(index_quotes):
-                    pass
-                    #print("Successfully saved FMP index data to database")
-                else:
-                    pass
-                    #print("Failed to save FMP index data to database")
-            else:
-                pass
-                #print("Failed to retrieve FMP index quotes")
+            # The three APIs are independent and each save opens its own
+            # database connection, so every worker fetches and then saves
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                index_future = executor.submit(self._fetch_and_save, self.fmp_api.get_index_quotes, save_fmp_index_data)
+                weather_future = executor.submit(self._fetch_and_save, self.weather_api.get_weather_data, save_weather_data)
+                bitcoin_future = executor.submit(self._fetch_and_save, self.coinmarket_api.get_bitcoin_data, save_bitcoin_data)
             
-            # Weather API - Get weather data            
-            weather_data = self.weather_api.get_weather_data()
-            if weather_data:                
-                if save_weather_data(weather_data):
-                    pass
-                    #print("Successfully saved weather data to database")
-                else:
-                    pass
-                    #print("Failed to save weather data to database")
-            else:
-                pass
-                #print("Failed to retrieve weather data")
-            
-            # CoinMarket API - Get Bitcoin data            
-            bitcoin_data = self.coinmarket_api.get_bitcoin_data()
-            if bitcoin_data:                
-                if save_bitcoin_data(bitcoin_data):
-                    pass
-                    #print("Successfully saved Bitcoin data to database")
-                else:
-                    pass
-                    #print("Failed to save Bitcoin data to database")
-            else:
-                pass
-                #print("Failed to retrieve Bitcoin data")
+            index_quotes = index_future.result()
+            weather_data = weather_future.result()
+            bitcoin_data = bitcoin_future.result()
             
             # Update the last sync time after successful completion
             self.db_ops.update_last_sync_time()            
+            
+            # Let callers tell whether this sync brought in anything new
+            payload = json.dumps([index_quotes, weather_data, bitcoin_data], sort_keys=True, default=str)
+            return hashlib.sha1(payload.encode('utf-8')).hexdigest()
         
         except Exception as e:
-            pass
+            return None
            # print(f"Error in sync_all function: {e}")
 
 if __name__ == "__main__":
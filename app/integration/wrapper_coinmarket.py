@@ -1,18 +1,31 @@
 import os
 import requests
+from integration.http_client import get_session, REQUEST_TIMEOUT
 from dotenv import load_dotenv
 from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
 
 class CoinMarketCapAPI:    
-    def __init__(self):
-        """Initialize the API with credentials from environment variables."""
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Initialize the API with credentials from environment variables.
+        
+        Args:
+            session: HTTP session to send requests with (defaults to the shared session)
+        """
         load_dotenv()
         self.api_key = os.getenv("COINMARKETCAP_API_KEY")
         self.base_url = os.getenv("COINMARKETCAP_ENDPOINT")
         
         if not self.api_key or not self.base_url:
             raise ValueError("Missing required environment variables for CoinMarketCap API")
+        
+        # Reuse pooled connections across requests instead of reconnecting every sync
+        self.session = session or get_session()
+        self.headers = {
+            "X-CMC_PRO_API_KEY": self.api_key,
+            "Accept": "application/json"
+        }
     
     def get_bitcoin_data(self) -> Optional[Dict[str, Any]]:
         """
@@ -26,16 +39,12 @@ class CoinMarketCapAPI:
             "convert": "USD"
         }
         
-        headers = {
-            "X-CMC_PRO_API_KEY": self.api_key,
-            "Accept": "application/json"
-        }
-        
         try:
-            response = requests.get(
+            response = self.session.get(
                 self.base_url,
                 params=params,
-                headers=headers
+                headers=self.headers,
+                timeout=REQUEST_TIMEOUT
             )
             response.raise_for_status()
             
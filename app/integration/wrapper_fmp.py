@@ -1,16 +1,38 @@
 import os
 import requests
+from integration.cache import TTLCache
+from integration.http_client import get_session, REQUEST_TIMEOUT
 from dotenv import load_dotenv
 from typing import Dict, Any, Optional, List
 
+# Seconds index quotes stay cached; quotes move on a minutes cadence
+CACHE_TTL = 60
+
+# Indices we're interested in
+TARGET_SYMBOLS = frozenset(("^SPX", "^DJI", "^IXIC", "^RUT", "^NYA"))
+
+def _num(value: Any, cast: type) -> Any:
+    """Convert a field with cast, keeping missing values as None."""
+    return cast(value) if value is not None else None
+
 class FmpAPI:    
-    def __init__(self):
-        """Initialize the API with credentials from environment variables."""
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Initialize the API with credentials from environment variables.
+        
+        Args:
+            session: HTTP session to send requests with (defaults to the shared session)
+        """
         load_dotenv()
         self.api_key = os.getenv("FMP_API_KEY")
         self.base_url = os.getenv("FMP_ENDPOINT")        
         if not self.api_key or not self.base_url:
             raise ValueError("Missing required environment variables for FMP API")
+        
+        # Reuse pooled connections across requests instead of reconnecting every sync
+        self.session = session or get_session()
+        self.headers = {"Accept": "application/json"}
+        self.cache = TTLCache()
     
     def get_index_quotes(self) -> Optional[List[Dict[str, Any]]]:
         """
@@ -23,19 +45,23 @@ class FmpAPI:
             "apikey": self.api_key
         }
         
-        headers = {
-            "Accept": "application/json"
-        }
+        # Serve a recent response without another request
+        cache_key = self.cache.make_key(self.base_url, params)
+        data = self.cache.get(cache_key)
+        if data is not None:
+            return self._extract_index_data(data)
         
         try:
-            response = requests.get(
+            response = self.session.get(
                 self.base_url,
                 params=params,
-                headers=headers
+                headers=self.headers,
+                timeout=REQUEST_TIMEOUT
             )
             response.raise_for_status()
             
             data = response.json()
+            self.cache.set(cache_key, data, CACHE_TTL)
             return self._extract_index_data(data)
         except requests.exceptions.RequestException as e:
             print(f"Error fetching index quotes: {e}")
@@ -52,36 +78,17 @@ class FmpAPI:
             List[Dict]: A list of dictionaries containing index data or None if not found
         """
         try:
-            # List of indices we're interested in
-            target_symbols = ["^SPX", "^DJI", "^IXIC", "^RUT", "^NYA"]
-            
-            # Filter the data to only include our target symbols
-            indices = [index for index in data if index.get("symbol") in target_symbols]
-            
-            # Extract the required fields for each index
-            result = []
-            for index in indices:
-                index_data = {
-                    "symbol": index.get("symbol"),
-                    "price": index.get("price"),
-                    "change": index.get("change"),
-                    "volume": index.get("volume")
+            # Keep only our target symbols; price and change as float, volume as int
+            return [
+                {
+                    "symbol": symbol,
+                    "price": _num(index.get("price"), float),
+                    "change": _num(index.get("change"), float),
+                    "volume": _num(index.get("volume"), int)
                 }
-                
-                # Convert price and change to float if they exist
-                if index_data["price"] is not None:
-                    index_data["price"] = float(index_data["price"])
-                
-                if index_data["change"] is not None:
-                    index_data["change"] = float(index_data["change"])
-                
-                # Convert volume to int if it exists
-                if index_data["volume"] is not None:
-                    index_data["volume"] = int(index_data["volume"])
-                
-                result.append(index_data)
-            
-            return result
+                for index in data
+                if (symbol := index.get("symbol")) in TARGET_SYMBOLS
+            ]
         except (KeyError, ValueError, TypeError) as e:
             print(f"Error parsing index data: {e}")
             return None
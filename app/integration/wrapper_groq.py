@@ -1,30 +1,39 @@
 import os
 import json
+import hashlib
 from groq import Groq
 from typing import Dict, List, Optional, Union, Any
 from dotenv import load_dotenv
+from integration.cache import TTLCache
 
 # Load the environment variables
 load_dotenv()
 
+# Seconds a deterministic (temperature 0) completion stays cached
+DETERMINISTIC_CACHE_TTL = 24 * 60 * 60
+
 class GroqClient:
     """
     A client for interacting with the Groq API, specifically using the Llama 70B model.
     Designed for the RealityGlitch project - a chaotic text adventure powered by real-time data.
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, cache_enabled: bool = True, cache_ttl: int = 300):
         """
         Initialize the Groq client.
         
         Args:
             api_key: Your Groq API key. If not provided, it will be read from the GROQ_API_KEY environment variable.
+            cache_enabled: Reuse responses to identical chat completion requests.
+            cache_ttl: Seconds a cached response is reused; temperature 0 requests are kept for a day.
         """
         self.api_key = api_key or os.environ.get("GROQ_API_KEY")
         if not self.api_key:
             raise ValueError("API key is required. Provide it directly or set the GROQ_API_KEY environment variable.")
         
         self.client = Groq(api_key=self.api_key)
+        self.cache_ttl = cache_ttl
+        self.cache = TTLCache() if cache_enabled else None
     
     def generate_completion(
         self,
@@ -94,8 +103,25 @@ class GroqClient:
             **kwargs: Additional parameters to pass to the API.
             
         Returns:
-            The API response as a dictionary.
+            The API response as a dictionary. Identical requests within the
+            cache TTL return the cached response; streamed requests are never cached.
         """
+        use_cache = self.cache is not None and not stream
+        if use_cache:
+            request = {
+                "model": model,
+                "messages": messages,
+                "max_tokens": max_tokens,
+                "temperature": temperature,
+                "top_p": top_p,
+                "stop": stop,
+                "kwargs": kwargs
+            }
+            cache_key = hashlib.sha256(json.dumps(request, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         completion = self.client.chat.completions.create(
             model=model,
             messages=messages,
@@ -108,7 +134,11 @@ class GroqClient:
         )
         
         # Convert the completion to a dictionary format
-        return self._completion_to_dict(completion)
+        result = self._completion_to_dict(completion)
+        if use_cache:
+            ttl = DETERMINISTIC_CACHE_TTL if temperature == 0 else self.cache_ttl
+            self.cache.set(cache_key, result, ttl)
+        return result
     
     def generate_reality_glitch_content(
         self,
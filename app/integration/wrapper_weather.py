@@ -1,18 +1,32 @@
 import os
 import requests
+from integration.cache import TTLCache
+from integration.http_client import get_session, REQUEST_TIMEOUT
 from dotenv import load_dotenv
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+# Seconds weather data stays cached; the upstream updates every few minutes
+CACHE_TTL = 300
+
 class WeatherAPI:    
-    def __init__(self):
-        """Initialize the API with credentials from environment variables."""
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Initialize the API with credentials from environment variables.
+        
+        Args:
+            session: HTTP session to send requests with (defaults to the shared session)
+        """
         load_dotenv()
         self.api_key = os.getenv("WEATHER_API_KEY")
         self.base_url = os.getenv("WEATHER_ENDPOINT")
         
         if not self.api_key or not self.base_url:
             raise ValueError("Missing required environment variables for Weather API")
+        
+        # Reuse pooled connections across requests instead of reconnecting every sync
+        self.session = session or get_session()
+        self.cache = TTLCache()
     
     def get_weather_data(self) -> Optional[Dict[str, Any]]:
         """
@@ -25,14 +39,22 @@ class WeatherAPI:
             "key": self.api_key
         }
         
+        # Serve a recent response without another request
+        cache_key = self.cache.make_key(self.base_url, params)
+        data = self.cache.get(cache_key)
+        if data is not None:
+            return self._extract_weather_data(data)
+        
         try:
-            response = requests.get(
+            response = self.session.get(
                 self.base_url,
-                params=params
+                params=params,
+                timeout=REQUEST_TIMEOUT
             )
             response.raise_for_status()
             
             data = response.json()
+            self.cache.set(cache_key, data, CACHE_TTL)
             return self._extract_weather_data(data)
         except requests.exceptions.RequestException as e:
             print(f"Error fetching weather data: {e}")
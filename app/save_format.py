@@ -0,0 +1,179 @@
+import os
+import gzip
+import json
+import zlib
+from datetime import datetime
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib json module produces the same documents
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # Without msgpack saves are written as JSON
+    msgpack = None
+
+# Save files start with a one-line JSON header holding the fields the save
+# and load menus preview, followed by this separator and the full story body.
+# Listing saves only has to parse the header line.
+SAVE_SEPARATOR = '---'
+
+# Fields written to the header line
+HEADER_FIELDS = ('id', 'save_id', 'title', 'timestamp', 'ts_epoch', 'summary', 'choices_preview', 'game_version')
+
+_SEPARATOR = SAVE_SEPARATOR.encode('utf-8')
+
+# Save file extensions that can be read, preferred format first. New saves
+# use the first one: gzip-compressed msgpack when available, JSON otherwise.
+SAVE_EXTENSIONS = ('.mpz', '.json') if msgpack is not None else ('.json',)
+
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    _loads = json.loads
+
+
+def is_save_file(filename):
+    """Check whether a file name looks like a readable save file.
+
+    Args:
+        filename: Name of the file
+
+    Returns:
+        True if the file has a save extension
+    """
+    return filename.endswith(SAVE_EXTENSIONS)
+
+
+def save_epoch(header):
+    """Get the save time of a save as seconds since the epoch, for sorting.
+    
+    Saves written before ts_epoch was stored fall back to their ISO timestamp.
+    
+    Args:
+        header: Header dictionary of the save
+        
+    Returns:
+        Save time as a float, 0.0 if unknown
+    """
+    epoch = header.get('ts_epoch')
+    if epoch is None:
+        try:
+            epoch = datetime.fromisoformat(header.get('timestamp', '')).timestamp()
+        except (TypeError, ValueError):
+            epoch = 0.0
+    return epoch
+
+
+def find_save_path(save_dir, save_id):
+    """Get the path of a save, preferring whichever file already exists.
+
+    Args:
+        save_dir: Directory where save files are stored
+        save_id: ID of the save
+
+    Returns:
+        Path of the existing save file, or the path a new save should use
+    """
+    for ext in SAVE_EXTENSIONS:
+        path = os.path.join(save_dir, save_id + ext)
+        if os.path.exists(path):
+            return path
+    return os.path.join(save_dir, save_id + SAVE_EXTENSIONS[0])
+
+
+def write_save(path, data):
+    """Write a save file as a header followed by the story body.
+
+    The format is picked from the file extension. The whole file is
+    serialized in memory and written to a temporary file with a single
+    write, which then replaces the save so a failed write never leaves a
+    truncated save behind.
+
+    Args:
+        path: Path of the save file
+        data: Complete save dictionary
+    """
+    header = {key: data[key] for key in HEADER_FIELDS if key in data}
+    body = {key: value for key, value in data.items() if key not in header}
+    if path.endswith('.mpz'):
+        payload = gzip.compress(
+            msgpack.packb(header, use_bin_type=True) + msgpack.packb(body, use_bin_type=True),
+            compresslevel=1
+        )
+    else:
+        payload = b''.join((_dumps(header), b'\n', _SEPARATOR, b'\n', _dumps(body)))
+    
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _unpack(path, count):
+    """Read the first msgpack objects from a compressed save file.
+
+    Corrupt files raise ValueError, like corrupt JSON saves do.
+    """
+    try:
+        with gzip.open(path, 'rb') as f:
+            unpacker = msgpack.Unpacker(f, raw=False)
+            objects = [next(unpacker, None) for _ in range(count)]
+    except (EOFError, gzip.BadGzipFile, zlib.error, msgpack.UnpackException) as e:
+        raise ValueError(f"Corrupt save file: {e}") from e
+    if objects[-1] is None:
+        raise ValueError("Truncated save file")
+    return objects
+
+
+def read_save_header(path):
+    """Read only the preview metadata of a save file.
+
+    Saves written before the header format existed are parsed in full.
+
+    Args:
+        path: Path of the save file
+
+    Returns:
+        Dictionary with the header fields of the save
+    """
+    if path.endswith('.mpz'):
+        # Only the start of the stream is decompressed
+        return _unpack(path, 1)[0]
+    with open(path, 'rb') as f:
+        first = f.readline()
+        if f.readline().rstrip(b'\r\n') == _SEPARATOR:
+            return _loads(first)
+        # Legacy save: a single JSON document
+        f.seek(0)
+        return _loads(f.read())
+
+
+def read_save(path):
+    """Read a complete save file.
+
+    Args:
+        path: Path of the save file
+
+    Returns:
+        Dictionary with the header and body fields of the save merged
+    """
+    if path.endswith('.mpz'):
+        header, data = _unpack(path, 2)
+        data.update(header)
+        return data
+    with open(path, 'rb') as f:
+        first = f.readline()
+        if f.readline().rstrip(b'\r\n') == _SEPARATOR:
+            data = _loads(f.read())
+            data.update(_loads(first))
+            return data
+        # Legacy save: a single JSON document
+        f.seek(0)
+        return _loads(f.read())
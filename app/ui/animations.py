@@ -1,7 +1,34 @@
+import os
+import sys
 import time
+import asyncio
 import random
+import functools
+import unicodedata
 from .ui_renderer import UIRenderer
 
+# Matrix effect elements - specifically the Japanese characters shown in the image
+_MATRIX_CHARS = tuple("デテトドナニヌネノハバパヒビピフブプヘベペホボポマミムメモヤユヨラリルレロワヲンゴザジズゼゾタダチヂッツヅテデト")
+_GLITCH_CHARS = tuple("█▓▒░█▓▒░")
+
+# Title art of the welcome screen
+_TITLE_ART = """
+██████╗ ███████╗ █████╗ ██╗     ██╗████████╗██╗   ██╗     ██████╗ ██╗     ██║████████╗ ██████╗██╗  ██╗
+██╔══██╗██╔════╝██╔══██╗██║     ██║╚══██╔══╝╚██╗ ██╔╝    ██╔════╝ ██║     ██║╚══██╔══╝██╔════╝██║  ██║
+██████╔╝█████╗  ███████║██║     ██║   ██║    ╚████╔╝     ██║  ███╗██║     ██║   ██║   ██║     ███████║
+██╔══██╗██╔══╝  ██╔══██║██║     ██║   ██║     ╚██╔╝      ██║   ██║██║     ██║   ██║   ██║     ██╔══██║
+██║  ██║███████╗██║  ██║███████╗██║   ██║      ██║       ╚██████╔╝███████╗██║   ██║   ╚██████╗██║  ██║
+╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚══════╝╚═╝   ╚═╝      ╚═╝        ╚═════╝ ╚══════╝╚═╝   ╚═╝    ╚═════╝╚═╝  ╚═╝"""
+
+# Columns the cursor advances after printing each animation character
+_CHAR_WIDTH = {
+    char: 2 if unicodedata.east_asian_width(char) in ('W', 'F') else 1
+    for char in _MATRIX_CHARS + _GLITCH_CHARS
+}
+
+# Framebuffer cell hidden under the right half of a wide character
+_COVERED = (None, None)
+
 class AnimationManager:
     """Manages animations and special effects for the Reality Glitch game."""
     
@@ -9,6 +36,16 @@ class AnimationManager:
         """Initialize the animation manager."""
         self.ui = UIRenderer(terminal)
         self.term = self.ui.term
+        # Cursor moves repeat across frames and calls, so cache the strings
+        self._move_xy = functools.lru_cache(maxsize=4096)(self.term.move_xy)
+        # Off-screen copy of the animation box, as (char, style) per cell
+        self._fb = []
+        # Whether the terminal supports the REP (repeat character) sequence
+        self._has_rep = bool(self.term.rep)
+        # Terminal size of the screen being drawn, read once per screen
+        self._read_size()
+        # Rendered welcome screens keyed by terminal size
+        self._welcome_cache = {}
     
     def display_sci_fi_animation(self, duration=5):
         """Display an immersive sci-fi loading animation.
@@ -16,8 +53,67 @@ class AnimationManager:
         Args:
             duration: Duration of the animation in seconds
         """
-        # Clear screen and hide cursor
-        print(self.term.clear)
+        try:
+            for delay in self._sci_fi_frames(duration):
+                time.sleep(delay)
+        finally:
+            self._end_sci_fi_animation()
+    
+    async def display_sci_fi_animation_async(self, duration=5, stop=None):
+        """Display the sci-fi loading animation without blocking the event loop.
+        
+        Args:
+            duration: Duration of the animation in seconds
+            stop: Optional asyncio.Event that ends the animation early when set
+        """
+        frames = self._sci_fi_frames(duration)
+        try:
+            for delay in frames:
+                if stop is None:
+                    await asyncio.sleep(delay)
+                    continue
+                try:
+                    await asyncio.wait_for(stop.wait(), delay)
+                    break
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            frames.close()
+            self._end_sci_fi_animation()
+    
+    def _repeat_char(self, char, count):
+        """Return char repeated count times, using REP when the terminal has it.
+        
+        Args:
+            char: Single character to repeat
+            count: Number of times to repeat it
+            
+        Returns:
+            str: The repeated character
+        """
+        if count <= 0:
+            return ""
+        if count > 1 and self._has_rep:
+            return char + f"\x1b[{count - 1}b"
+        return char * count
+    
+    def _end_sci_fi_animation(self):
+        """Restore the cursor and leave the alternate screen after the sci-fi animation."""
+        # The main screen is left as it was; callers redraw right after
+        print(self.term.normal_cursor + self.term.exit_fullscreen, end='', flush=True)
+    
+    def _sci_fi_frames(self, duration):
+        """Draw the sci-fi loading animation one frame at a time.
+        
+        Args:
+            duration: Duration of the animation in seconds
+        
+        Yields:
+            Seconds to wait before the next frame is drawn
+        """
+        # Draw on the alternate screen from home and hide cursor; the screen
+        # underneath is left untouched instead of being cleared into scrollback
+        print(self.term.enter_fullscreen + self.term.home + self.term.clear_eos)
         print(self.term.hide_cursor)
         
         # Define animation variables
@@ -27,20 +123,16 @@ class AnimationManager:
         # Set the only message to match the image
         message = "Calibrating quantum entanglement matrix..."
         
-        # Matrix effect elements - specifically the Japanese characters shown in the image
-        matrix_chars = "デテトドナニヌネノハバパヒビピフブプヘベペホボポマミムメモヤユヨラリルレロワヲンゴザジズゼゾタダチヂッツヅテデト"
-        glitch_chars = "█▓▒░█▓▒░"
-        
         # Display header
         print("\n\n")
+        self._read_size()
         title = "REALITY SYNCHRONIZATION PROTOCOL"
-        title_x = (self.term.width - len(title)) // 2
-        print(self.term.move_xy(title_x, 2) + self.ui.highlight + self.term.bold + title + self.term.normal)
+        print(self._center(title, 2) + self.ui.highlight + self.term.bold + title + self.term.normal)
         
         # Box dimensions
         width = 70
         height = 15
-        start_x = (self.term.width - width) // 2
+        start_x = (self._tw - width) // 2
         start_y = 4
         
         # Draw box
@@ -52,115 +144,195 @@ class AnimationManager:
         
         # Animation variables
         i = 0
+        frame_dt = 1 / 10
+        prev_filled = -1
+        
+        # Glitch blocks as (x offset, y offset, length) inside the box
+        glitch_blocks = [(10, 8, 6), (35, 12, 8), (55, 7, 6)]
+        
+        # Cache styles and cursor moves for every cell of the box
+        normal = self.term.normal
+        dim = self.ui.dim
+        magenta = self.term.magenta
+        move = [[self._move_xy(start_x + x, start_y + y) for x in range(width)]
+                for y in range(height)]
+        
+        # Matrix grid size; about 5% of its cells update each frame
+        grid_width = width - 8
+        n_cells = 5 * grid_width
+        n_hits = int(n_cells * 0.05)
+        
+        # Bake each cell's box position and style in once, so the frame loop only
+        # looks them up: grid cells by sample index, glitch cells per block
+        grid_cells = [(5 + row, 4 + col, normal if row < 2 else dim)
+                      for row in range(5) for col in range(grid_width)]
+        glitch_cells = [[(glitch_y, glitch_x + offset) for offset in range(length)]
+                        for glitch_x, glitch_y, length in glitch_blocks]
+        
+        # Reset the framebuffer so only changed cells get written
+        self._fb = [[(" ", normal)] * width for _ in range(height)]
+        fb = self._fb
+        
+        # Sequence that switches the terminal into each cell style from any other;
+        # attributes like dim survive a color change, so reset before applying
+        set_style = {normal: normal, dim: normal + dim, magenta: normal + magenta}
+        
+        # Hoist everything that does not change between frames
+        _time = time.time
+        # Frames go straight to the stdout file descriptor; flush what print() buffered first
+        sys.stdout.flush()
+        fd = sys.stdout.fileno()
+        write = os.write
+        n_frames = len(frames)
+        n_colors = len(colors)
+        text_color = self.ui.text_color
+        msg_move = move[3][4]
+        clear_msg = msg_move + " " * grid_width
+        msg_prefix = msg_move + self.term.yellow
+        msg_suffix = " " + message + normal
+        bar_width = grid_width
+        bar_x = start_x + 4
+        bar_y = start_y + height - 3
         
         # Run the animation until duration is reached
-        while time.time() < end_time:
+        while _time() < end_time:
+            # Collect the whole frame and write it to the terminal at once
+            parts = []
+            
             # Update frame 
-            frame = frames[i % len(frames)]
-            color = colors[i % len(colors)]
+            frame = frames[i % n_frames]
+            color = colors[i % n_colors]
             
             # Display the message - only "Calibrating quantum entanglement matrix..."
-            msg_x = start_x + 4
-            msg_y = start_y + 3
-            print(self.term.move_xy(msg_x, msg_y) + " " * (width - 8))  # Clear the line
-            print(self.term.move_xy(msg_x, msg_y) + self.term.yellow + frame + " " + message + self.term.normal)
+            parts.append(clear_msg)  # Clear the line
+            parts.append(msg_prefix + frame + msg_suffix)
+            
+            # Cells that may change this frame, (y offset, x offset) -> (char, style)
+            cells = {}
             
             # Create a grid of Japanese characters similar to the image
             # This arranges them in a specific pattern rather than random falling characters
-            for row in range(5):
-                for col in range(width - 8):
-                    if random.random() < 0.05:  # Occasionally update characters
-                        char_x = start_x + 4 + col
-                        char_y = start_y + 5 + row
-                        char = random.choice(matrix_chars)
-                        
-                        # Style based on position - matching image pattern
-                        if row < 2:
-                            style = self.term.normal
-                        else:
-                            style = self.ui.dim
-                        
-                        print(self.term.move_xy(char_x, char_y) + style + char + self.term.normal)
+            hits = random.sample(range(n_cells), n_hits)
+            chars = random.choices(_MATRIX_CHARS, k=n_hits)
+            for hit, char in zip(hits, chars):
+                # Style based on position - matching image pattern
+                y, x, style = grid_cells[hit]
+                cells[(y, x)] = (char, style)
             
             # Add specific glitch effects at locations similar to the image
             if i % 5 == 0:  # Control the rate of glitch updates
-                # First glitch block (left side)
-                glitch_x1 = start_x + 10
-                glitch_y1 = start_y + 8
-                glitch_text1 = ''.join(random.choice(glitch_chars) for _ in range(6))
-                print(self.term.move_xy(glitch_x1, glitch_y1) + self.term.magenta + glitch_text1 + self.term.normal)
-                
-                # Second glitch block (middle bottom)
-                glitch_x2 = start_x + 35
-                glitch_y2 = start_y + 12
-                glitch_text2 = ''.join(random.choice(glitch_chars) for _ in range(8))
-                print(self.term.move_xy(glitch_x2, glitch_y2) + self.term.magenta + glitch_text2 + self.term.normal)
-                
-                # Third glitch block (right side)
-                glitch_x3 = start_x + 55
-                glitch_y3 = start_y + 7
-                glitch_text3 = ''.join(random.choice(glitch_chars) for _ in range(6))
-                print(self.term.move_xy(glitch_x3, glitch_y3) + self.term.magenta + glitch_text3 + self.term.normal)
+                for block in glitch_cells:
+                    for (y, x), char in zip(block, random.choices(_GLITCH_CHARS, k=len(block))):
+                        cells[(y, x)] = (char, magenta)
+            
+            # Only write the cells that differ from what is already on screen
+            changed = [pos for pos, cell in cells.items() if fb[pos[0]][pos[1]] != cell]
+            
+            # Write them in screen order so adjacent cells share one cursor move,
+            # emitting style changes only when the style actually changes
+            changed.sort()
+            cur_style = normal
+            cursor = None
+            for y, x in changed:
+                char, style = cell = cells[(y, x)]
+                fb[y][x] = cell
+                if _CHAR_WIDTH[char] == 2:
+                    # A wide char also covers the next column, so never skip its next write
+                    fb[y][x + 1] = _COVERED
+                if (y, x) != cursor:
+                    parts.append(move[y][x])
+                if style != cur_style:
+                    parts.append(set_style[style])
+                    cur_style = style
+                parts.append(char)
+                cursor = (y, x + _CHAR_WIDTH[char])
+            if cur_style != normal:
+                parts.append(normal)
             
             # Show progress bar at bottom of box
-            progress = (time.time() - start_time) / duration
-            bar_width = width - 8
+            progress = (_time() - start_time) / duration
             filled = int(bar_width * progress)
-            bar_x = start_x + 4
-            bar_y = start_y + height - 3
-            print(self.term.move_xy(bar_x, bar_y) + 
-                  self.ui.text_color + "[" + 
-                  "=" * filled + 
-                  " " * (bar_width - filled) + 
-                  "]" +
-                  self.term.normal)
+            if filled != prev_filled:
+                if prev_filled >= 0 and filled > prev_filled:
+                    # Only extend the bar by the newly filled cells
+                    parts.append(self._move_xy(bar_x + 1 + prev_filled, bar_y) + 
+                          text_color + 
+                          self._repeat_char("=", filled - prev_filled) + 
+                          normal)
+                else:
+                    parts.append(self._move_xy(bar_x, bar_y) + 
+                          text_color + "[" + 
+                          self._repeat_char("=", filled) + 
+                          self._repeat_char(" ", bar_width - filled) + 
+                          "]" +
+                          normal)
+                prev_filled = filled
+            
+            data = ''.join(parts).encode('utf-8')
+            while data:
+                data = data[write(fd, data):]
+            
+            # Sleep until the next frame is due, dropping frames if we fell behind
+            next_t = start_time + (i + 1) * frame_dt
+            delay = next_t - _time()
+            if delay > 0:
+                yield delay
+            else:
+                i += int(-delay / frame_dt)
             
             # Increment counters
             i += 1
-            
-            # Sleep for a frame
-            time.sleep(0.1)
-        
-        # Restore cursor and clear screen
-        print(self.term.normal_cursor)
-        print(self.term.clear)
+    
+    def _read_size(self):
+        """Read the terminal size once for the screen about to be drawn."""
+        self._tw = self.term.width
+        self._th = self.term.height
+    
+    def _center(self, text, y):
+        """Get the cursor move that centers text on row y of the current screen."""
+        return self._move_xy((self._tw - len(text)) // 2, y)
     
     def display_welcome_screen(self):
         """Display the welcome message with clean terminal aesthetics."""
+        # The layout only depends on the terminal size, so build it once per size
+        self._read_size()
+        key = (self._tw, self._th)
+        screen = self._welcome_cache.get(key)
+        if screen is None:
+            screen = self._build_welcome_screen()
+            self._welcome_cache[key] = screen
+        
+        sys.stdout.write(screen)
+        sys.stdout.flush()
+    
+    def _build_welcome_screen(self):
+        """Build the welcome screen for the current terminal size as one string."""
         # Clear screen
-        print(self.term.clear)
-                
-        title_art = """
-██████╗ ███████╗ █████╗ ██╗     ██╗████████╗██╗   ██╗     ██████╗ ██╗     ██║████████╗ ██████╗██╗  ██╗
-██╔══██╗██╔════╝██╔══██╗██║     ██║╚══██╔══╝╚██╗ ██╔╝    ██╔════╝ ██║     ██║╚══██╔══╝██╔════╝██║  ██║
-██████╔╝█████╗  ███████║██║     ██║   ██║    ╚████╔╝     ██║  ███╗██║     ██║   ██║   ██║     ███████║
-██╔══██╗██╔══╝  ██╔══██║██║     ██║   ██║     ╚██╔╝      ██║   ██║██║     ██║   ██║   ██║     ██╔══██║
-██║  ██║███████╗██║  ██║███████╗██║   ██║      ██║       ╚██████╔╝███████╗██║   ██║   ╚██████╗██║  ██║
-╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚══════╝╚═╝   ╚═╝      ╚═╝        ╚═════╝ ╚══════╝╚═╝   ╚═╝    ╚═════╝╚═╝  ╚═╝"""
+        parts = [self.term.clear]
         
         # Center the ASCII art
-        lines = title_art.split('\n')
+        lines = _TITLE_ART.split('\n')
         max_width = max(len(line) for line in lines)
-        x = (self.term.width - max_width) // 2
+        x = (self._tw - max_width) // 2
         y = 2
         
-        # Print title with teal color
+        # Title with teal color
         for line in lines:
-            if line.strip():  # Only print non-empty lines
+            if line.strip():  # Only draw non-empty lines
                 padding = (max_width - len(line)) // 2
-                print(self.term.move_xy(x + padding, y) + self.ui.text_color + line + self.term.normal)
+                parts.append(self._move_xy(x + padding, y) + self.ui.text_color + line + self.term.normal)
             y += 1
         
         # Subtitle
         subtitle = "A Cosmic Horror Adventure"
-        subtitle_x = (self.term.width - len(subtitle)) // 2
-        print(self.term.move_xy(subtitle_x, y+1) + self.ui.highlight + subtitle + self.term.normal)
+        parts.append(self._center(subtitle, y+1) + self.ui.highlight + subtitle + self.term.normal)
         
         # Instructions
         instructions = ["Press F1 for help. Press Esc to exit.", "Press F10 to load a saved story."]
         for i, line in enumerate(instructions):
-            instr_x = (self.term.width - len(line)) // 2
-            print(self.term.move_xy(instr_x, y+3+i) + self.ui.dim + line + self.term.normal)
+            parts.append(self._center(line, y+3+i) + self.ui.dim + line + self.term.normal)
+        
+        return "".join(parts)
     
     def display_help_screen(self):
         """Display help information."""
@@ -207,13 +379,13 @@ class AnimationManager:
     
     def trigger_panic_animation(self):
         """Trigger a panic event that causes multiple reality glitches."""
-        # Clear screen
+        # Clear screen and read the terminal size for this screen
         print(self.term.clear)
+        self._read_size()
         
         # Title
         title = "REALITY PANIC EVENT"
-        title_x = (self.term.width - len(title)) // 2
-        print(self.term.move_xy(title_x, 2) + self.ui.error + title + self.term.normal)
+        print(self._center(title, 2) + self.ui.error + title + self.term.normal)
         
         # Generate some example anomalies
         intense_anomalies = [
@@ -236,20 +408,20 @@ class AnimationManager:
         )
         
         # Display the anomalies with visual effects
-        print(self.term.move_xy((self.term.width - 50) // 2, 4) + 
+        print(self._move_xy((self._tw - 50) // 2, 4) + 
               self.ui.warning + "MULTIPLE REALITY GLITCHES DETECTED" + self.term.normal)
         
         y = 6
         for anomaly in display_anomalies:
             # Random position with jitter effect
-            x = random.randint(10, self.term.width - len(anomaly) - 10)
+            x = random.randint(10, self._tw - len(anomaly) - 10)
             
             # Random style for each anomaly
             styles = [self.ui.text_color, self.ui.highlight, self.ui.warning, self.ui.error]
             style = random.choice(styles)
             
             # Display with slight delay
-            print(self.term.move_xy(x, y) + style + anomaly + self.term.normal)
+            print(self._move_xy(x, y) + style + anomaly + self.term.normal)
             y += 2
             time.sleep(0.3)
         
@@ -261,10 +433,10 @@ class AnimationManager:
             
             # Display glitch pattern
             for j in range(5):
-                x = random.randint(0, self.term.width - 10)
-                y = random.randint(0, self.term.height - 2)
+                x = random.randint(0, self._tw - 10)
+                y = random.randint(0, self._th - 2)
                 glitch_chars = random.choice(["░░░", "▒▒▒", "▓▓▓", "███", "///", "\\\\\\"])
-                print(self.term.move_xy(x, y) + self.ui.error + glitch_chars + self.term.normal)
+                print(self._move_xy(x, y) + self.ui.error + glitch_chars + self.term.normal)
             
             time.sleep(0.2)
         
@@ -273,12 +445,10 @@ class AnimationManager:
         
         # Show aftermath message
         aftermsg = "Reality stabilizing... glitches contained... for now..."
-        msg_x = (self.term.width - len(aftermsg)) // 2
-        print(self.term.move_xy(msg_x, (self.term.height - 4) // 2) + 
+        print(self._center(aftermsg, (self._th - 4) // 2) + 
               self.ui.warning + aftermsg + self.term.normal)
         
         # Footer
         footer = "Press any key to continue..."
-        footer_x = (self.term.width - len(footer)) // 2
-        print(self.term.move_xy(footer_x, self.term.height - 2) + 
+        print(self._center(footer, self._th - 2) + 
               self.ui.dim + footer + self.term.normal) 
\ No newline at end of file
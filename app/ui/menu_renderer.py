@@ -1,6 +1,20 @@
+import sys
+import functools
 from datetime import datetime
 from .ui_renderer import UIRenderer
 
+@functools.lru_cache(maxsize=256)
+def _fmt_ts(timestamp):
+    """Format an ISO timestamp for display, keeping the original if parsing fails."""
+    try:
+        return datetime.fromisoformat(timestamp).strftime("%Y-%m-%d %H:%M")
+    except (ValueError, TypeError):
+        return timestamp
+
+def _trunc(text, width):
+    """Shorten text to the given width, marking the cut with an ellipsis."""
+    return text if len(text) <= width else text[:width - 3] + "..."
+
 class MenuRenderer:
     """Handles rendering of game menus including save and load menus."""
     
@@ -8,308 +22,347 @@ class MenuRenderer:
         """Initialize the menu renderer."""
         self.ui = UIRenderer(terminal)
         self.term = self.ui.term
+        
+        # State of the last full draw, used to redraw only what changed
+        self._prev_selection = None
+        self._term_size = None
+        self._save_view = []
+        
+        # Encoded static chrome of each menu, valid for the current terminal size
+        self._chrome_cache = {}
     
-    def display_save_menu(self, saves, menu_selection, story_engine):
-        """Display the save game menu with a split screen layout.
+    def _update_layout(self):
+        """Recalculate the split screen dimensions from the current terminal size."""
+        term_size = (self.term.width, self.term.height)
+        if term_size == self._term_size:
+            return
+        
+        self._term_size = term_size
+        self.terminal_width, self.terminal_height = term_size
+        self._chrome_cache.clear()
+        
+        # Calculate split dimensions (left panel takes 1/3, right panel takes 2/3)
+        self.left_width = min(self.terminal_width // 3, 40)
+        self.right_width = self.terminal_width - self.left_width - 3  # 3 chars for separator and spacing
+        self.right_panel_x = self.left_width + 4
+        
+        # Vertical line separating the panels, built once per terminal size
+        separator_x = self.left_width + 2
+        self._separator = "".join(
+            self.term.move_xy(separator_x, y) + "│" for y in range(3, self.terminal_height - 3)
+        )
+    
+    def _needs_full_redraw(self):
+        """Check whether the menu has to be redrawn from scratch."""
+        return self._prev_selection is None or self._term_size != (self.term.width, self.term.height)
+    
+    def _draw_static_chrome(self, header, left_title, instructions=None, right_title=None):
+        """Draw the parts of a menu that don't depend on the selection.
         
         Args:
-            saves: List of save game dictionaries
-            menu_selection: Current menu selection index
-            story_engine: Reference to the story engine for current story display
+            header: Title centered at the top of the screen
+            left_title: Underlined title of the left panel
+            instructions: Optional instructions shown at the bottom
+            right_title: Optional underlined title of the right panel
         """
         # Clear the screen once
         output = self.term.clear
         
-        # Get terminal dimensions
-        terminal_width = self.term.width
-        terminal_height = self.term.height
-        
-        # Calculate split dimensions (left panel takes 1/3, right panel takes 2/3)
-        left_width = min(terminal_width // 3, 40)
-        right_width = terminal_width - left_width - 3  # 3 chars for separator and spacing
-        
-        # Prepare header
-        header = "=== SAVE REALITY FRAGMENT ==="
-        
         # Center the header
-        header_pos = (terminal_width - len(header)) // 2
+        header_pos = (self.terminal_width - len(header)) // 2
         output += self.term.move_xy(header_pos, 1) + self.term.cyan + header + self.term.normal
         
         # Instructions at the bottom
-        instructions = "Use ↑/↓ to navigate, Enter to select, Esc to cancel"
-        instructions_pos = (terminal_width - len(instructions)) // 2
-        output += self.term.move_xy(instructions_pos, terminal_height - 2) + \
-                self.term.cyan + instructions + self.term.normal
-        
-        # Left panel - save list
-        left_panel_y = 3
-        output += self.term.move_xy(2, left_panel_y) + self.term.underline + \
-                "Available Save Slots".ljust(left_width) + self.term.normal
-        
-        # Display option to create new save
-        left_panel_y += 2
-        if menu_selection == 0:
-            output += self.term.move_xy(2, left_panel_y) + self.term.green + "> Create new save" + self.term.normal
-        else:
-            output += self.term.move_xy(2, left_panel_y) + "  Create new save"
-        
-        # Display existing saves that can be overwritten
-        for i, save in enumerate(saves, 1):
-            timestamp = save.get('timestamp', 'Unknown')
-            if isinstance(timestamp, str) and timestamp != 'Unknown':
-                try:
-                    # Try to parse ISO format timestamp
-                    dt = datetime.fromisoformat(timestamp)
-                    timestamp = dt.strftime("%Y-%m-%d %H:%M")
-                except (ValueError, TypeError):
-                    # Keep original if parsing fails
-                    pass
-            
-            title = save.get('title', 'Untitled save')
-            
-            # Truncate title if too long
-            if len(title) > left_width - 5:
-                title = title[:left_width - 8] + "..."
-            
-            left_panel_y += 2
-            if i == menu_selection:
-                output += self.term.move_xy(2, left_panel_y) + self.term.green + \
-                      f"> {i}. {title}" + self.term.normal
-                output += self.term.move_xy(5, left_panel_y + 1) + self.term.green + \
-                      f"({timestamp})" + self.term.normal
-            else:
-                output += self.term.move_xy(2, left_panel_y) + \
-                      f"  {i}. {title}"
-                output += self.term.move_xy(5, left_panel_y + 1) + \
-                      f"({timestamp})"
+        if instructions:
+            instructions_pos = (self.terminal_width - len(instructions)) // 2
+            output += self.term.move_xy(instructions_pos, self.terminal_height - 2) + \
+                    self.term.cyan + instructions + self.term.normal
         
-        # Draw a vertical line to separate panels
-        for y in range(3, terminal_height - 3):
-            output += self.term.move_xy(left_width + 2, y) + "│"
+        # Left panel title
+        output += self.term.move_xy(2, 3) + self.term.underline + \
+                left_title.ljust(self.left_width) + self.term.normal
         
-        # Right panel - Preview/Summary
-        right_panel_x = left_width + 4
-        right_panel_y = 3
+        # Draw a vertical line to separate panels
+        output += self._separator
         
-        output += self.term.move_xy(right_panel_x, right_panel_y) + self.term.underline + \
-                "Story Preview".ljust(right_width) + self.term.normal
+        # Right panel title
+        if right_title:
+            output += self.term.move_xy(self.right_panel_x, 3) + self.term.underline + \
+                    right_title.ljust(self.right_width) + self.term.normal
         
-        right_panel_y += 2
+        return output
+    
+    def _static_chrome(self, header, left_title, instructions=None, right_title=None):
+        """Get the static chrome of a menu as UTF-8 bytes, encoding it once per terminal size."""
+        key = (header, left_title, instructions, right_title)
+        chrome = self._chrome_cache.get(key)
+        if chrome is None:
+            chrome = self._draw_static_chrome(header, left_title, instructions, right_title).encode('utf-8')
+            self._chrome_cache[key] = chrome
+        return chrome
+    
+    def _write(self, data):
+        """Write encoded menu output to the terminal in a single call."""
+        # Flush pending text output first so it can't land after the menu
+        sys.stdout.flush()
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
+    
+    def _build_save_view(self, saves):
+        """Precompute the left panel strings of each save for the current layout.
         
-        # Show preview of the selected save or current story
-        preview_text = ""
+        Timestamps are normalized to strings here so the row renderers only
+        ever see str arguments.
         
-        if menu_selection == 0 or not saves:
-            # For new save, show the current story
-            preview_text = "New Save - Current Story:"
-            right_panel_y += 1
-            output += self.term.move_xy(right_panel_x, right_panel_y) + self.term.bold + preview_text + self.term.normal
+        Args:
+            saves: List of save game dictionaries
+        """
+        self._save_view = []
+        for save in saves:
+            timestamp = str(save.get('timestamp', 'Unknown'))
+            if timestamp != 'Unknown':
+                timestamp = _fmt_ts(timestamp)
             
-            # Get the last few lines of the current story
-            story_preview = story_engine.current_story
-            # Limit to last 300 chars to fit in the panel
-            if len(story_preview) > 300:
-                story_preview = "..." + story_preview[-300:]
+            title = _trunc(save.get('title', 'Untitled save'), self.left_width - 5)
             
-            # Wrap text to fit the right panel and left-align
-            right_panel_y += 1
-            for line in self.ui.wrap_text(story_preview, right_width):
-                output += self.term.move_xy(right_panel_x, right_panel_y) + line
-                right_panel_y += 1
-                if right_panel_y >= terminal_height - 6:  # Leave room for choices
-                    break
+            # Extract choices from the choices_preview text, removing the "- " prefix
+            choices_preview = save.get('choices_preview', '')
+            choices = tuple(line[2:] for line in choices_preview.split('\n') if line.startswith('- '))
             
-            # Display current choices, left-aligned
-            if story_engine.current_choices:
-                right_panel_y += 1
-                output += self.term.move_xy(right_panel_x, right_panel_y) + self.term.bold + "Current Choices:" + self.term.normal
-                right_panel_y += 1
-                
-                for i, choice in enumerate(story_engine.current_choices, 1):
-                    # Truncate choice if too long
-                    if len(choice) > right_width - 5:
-                        choice = choice[:right_width - 8] + "..."
-                    
-                    output += self.term.move_xy(right_panel_x, right_panel_y) + f"{i}. {choice}"
-                    right_panel_y += 1
-                    if right_panel_y >= terminal_height - 3:
-                        break
+            self._save_view.append({'title': title, 'timestamp': timestamp, 'choices': choices})
+    
+    def _draw_left_row(self, y, label, highlighted, timestamp=""):
+        """Draw one entry of the left panel list.
+        
+        Args:
+            y: Row of the entry
+            label: Text of the entry
+            highlighted: Whether the entry is the current selection
+            timestamp: Timestamp shown on the row below the label, if not empty
+        """
+        if highlighted:
+            output = self.term.move_xy(2, y) + self.term.green + f"> {label}" + self.term.normal
+            if timestamp:
+                output += self.term.move_xy(5, y + 1) + self.term.green + \
+                        f"({timestamp})" + self.term.normal
         else:
-            # Show preview of the selected save
-            selected_save = saves[menu_selection - 1]
-            preview_text = f"Save Preview: {selected_save.get('title', 'Untitled')}"
+            output = self.term.move_xy(2, y) + f"  {label}"
+            if timestamp:
+                output += self.term.move_xy(5, y + 1) + f"({timestamp})"
+        return output
+    
+    def _draw_save_row(self, y, number, highlighted):
+        """Draw a save game entry of the left panel list.
+        
+        Args:
+            y: Row of the entry
+            number: 1-based position of the save in the list
+            highlighted: Whether the entry is the current selection
+        """
+        view = self._save_view[number - 1]
+        return self._draw_left_row(y, f"{number}. {view['title']}", highlighted, view['timestamp'])
+    
+    def _draw_save_menu_row(self, index, highlighted):
+        """Draw the save menu entry at the given selection index."""
+        if index == 0:
+            return self._draw_left_row(5, "Create new save", highlighted)
+        return self._draw_save_row(5 + index * 2, index, highlighted)
+    
+    def _draw_load_menu_row(self, index, highlighted):
+        """Draw the load menu entry at the given selection index."""
+        return self._draw_save_row(5 + index * 2, index + 1, highlighted)
+    
+    def _clear_right_panel(self):
+        """Blank the preview area of the right panel."""
+        blank = " " * self.right_width
+        output = ""
+        for y in range(5, self.terminal_height - 3):
+            output += self.term.move_xy(self.right_panel_x, y) + blank
+        return output
+    
+    def _draw_choices(self, choices, right_panel_y, header):
+        """Draw a numbered list of choices in the right panel."""
+        right_panel_y += 1
+        output = self.term.move_xy(self.right_panel_x, right_panel_y) + self.term.bold + header + self.term.normal
+        right_panel_y += 1
+        
+        max_width = self.right_width - 5
+        for i, choice in enumerate(choices, 1):
+            output += self.term.move_xy(self.right_panel_x, right_panel_y) + f"{i}. {_trunc(choice, max_width)}"
             right_panel_y += 1
-            output += self.term.move_xy(right_panel_x, right_panel_y) + self.term.bold + preview_text + self.term.normal
-            
-            # Get the story summary from the save
-            story_summary = selected_save.get('summary', 'No preview available')
-            
-            # Wrap text to fit the right panel and left-align
-            right_panel_y += 2
-            summary_lines = 0
-            for line in self.ui.wrap_text(story_summary, right_width):
-                output += self.term.move_xy(right_panel_x, right_panel_y) + line
-                right_panel_y += 1
-                summary_lines += 1
-                if right_panel_y >= terminal_height - 6:  # Leave room for choices
-                    break
-            
-            # Display choices from the save if available
-            choices_preview = selected_save.get('choices_preview', '')
-            if choices_preview and summary_lines < terminal_height - 10:
-                # Extract choices from the choices_preview text
-                choices = []
-                for line in choices_preview.split('\n'):
-                    if line.startswith('- '):
-                        choices.append(line[2:])  # Remove the "- " prefix
-                
-                if choices:
-                    right_panel_y += 1
-                    output += self.term.move_xy(right_panel_x, right_panel_y) + self.term.bold + "Choices at Save Point:" + self.term.normal
-                    right_panel_y += 1
-                    
-                    for i, choice in enumerate(choices, 1):
-                        # Truncate choice if too long
-                        if len(choice) > right_width - 5:
-                            choice = choice[:right_width - 8] + "..."
-                        
-                        output += self.term.move_xy(right_panel_x, right_panel_y) + f"{i}. {choice}"
-                        right_panel_y += 1
-                        if right_panel_y >= terminal_height - 3:
-                            break
-        
-        print(output)
+            if right_panel_y >= self.terminal_height - 3:
+                break
         return output
-
-    def display_load_menu(self, saves, menu_selection):
-        """Display the load game menu with a split screen layout.
+    
+    def _draw_story_preview(self, story_engine, right_panel_y):
+        """Draw a preview of the current story in the right panel."""
+        output = self.term.move_xy(self.right_panel_x, right_panel_y) + self.term.bold + \
+                "New Save - Current Story:" + self.term.normal
+        
+        # Get the last few lines of the current story
+        story_preview = story_engine.current_story
+        # Limit to last 300 chars to fit in the panel
+        if len(story_preview) > 300:
+            story_preview = "..." + story_preview[-300:]
+        
+        # Wrap text to fit the right panel and left-align
+        right_panel_y += 1
+        for line in self.ui.wrap_text(story_preview, self.right_width):
+            output += self.term.move_xy(self.right_panel_x, right_panel_y) + line
+            right_panel_y += 1
+            if right_panel_y >= self.terminal_height - 6:  # Leave room for choices
+                break
+        
+        # Display current choices, left-aligned
+        if story_engine.current_choices:
+            output += self._draw_choices(story_engine.current_choices, right_panel_y, "Current Choices:")
+        return output
+    
+    def _draw_save_preview(self, save, choices, preview_text, right_panel_y):
+        """Draw the summary and choices of a save in the right panel."""
+        output = self.term.move_xy(self.right_panel_x, right_panel_y) + self.term.bold + preview_text + self.term.normal
+        
+        # Get the story summary from the save
+        story_summary = save.get('summary', 'No preview available')
+        
+        # Wrap text to fit the right panel and left-align
+        right_panel_y += 2
+        summary_lines = 0
+        for line in self.ui.wrap_text(story_summary, self.right_width):
+            output += self.term.move_xy(self.right_panel_x, right_panel_y) + line
+            right_panel_y += 1
+            summary_lines += 1
+            if right_panel_y >= self.terminal_height - 6:  # Leave room for choices
+                break
+        
+        # Display choices from the save if available
+        if choices and summary_lines < self.terminal_height - 10:
+            output += self._draw_choices(choices, right_panel_y, "Choices at Save Point:")
+        return output
+    
+    def _draw_save_menu_panel(self, saves, menu_selection, story_engine):
+        """Draw the right panel preview of the save menu."""
+        if menu_selection == 0 or not saves:
+            # For new save, show the current story
+            return self._draw_story_preview(story_engine, 6)
+        
+        # Show preview of the selected save
+        selected_save = saves[menu_selection - 1]
+        preview_text = f"Save Preview: {selected_save.get('title', 'Untitled')}"
+        choices = self._save_view[menu_selection - 1]['choices']
+        return self._draw_save_preview(selected_save, choices, preview_text, 6)
+    
+    def _draw_load_menu_panel(self, saves, menu_selection):
+        """Draw the right panel preview of the load menu."""
+        selected_save = saves[menu_selection]
+        preview_text = f"Fragment: {selected_save.get('title', 'Untitled')}"
+        choices = self._save_view[menu_selection]['choices']
+        return self._draw_save_preview(selected_save, choices, preview_text, 5)
+    
+    def display_save_menu(self, saves, menu_selection, story_engine):
+        """Display the save game menu with a split screen layout.
         
         Args:
             saves: List of save game dictionaries
             menu_selection: Current menu selection index
+            story_engine: Reference to the story engine for current story display
         """
-        # Clear the screen once
-        output = self.term.clear
+        self._update_layout()
+        self._build_save_view(saves)
         
-        # Get terminal dimensions
-        terminal_width = self.term.width
-        terminal_height = self.term.height
+        chrome = self._static_chrome(
+            "=== SAVE REALITY FRAGMENT ===",
+            "Available Save Slots",
+            instructions="Use ↑/↓ to navigate, Enter to select, Esc to cancel",
+            right_title="Story Preview"
+        )
         
-        # Calculate split dimensions (left panel takes 1/3, right panel takes 2/3)
-        left_width = min(terminal_width // 3, 40)
-        right_width = terminal_width - left_width - 3  # 3 chars for separator and spacing
+        # Option to create a new save followed by existing saves that can be overwritten
+        output = ""
+        for i in range(len(saves) + 1):
+            output += self._draw_save_menu_row(i, i == menu_selection)
         
-        # Prepare header
-        header = "=== LOAD REALITY FRAGMENT ==="
+        # Right panel - Preview/Summary
+        output += self._draw_save_menu_panel(saves, menu_selection, story_engine)
         
-        # Center the header
-        header_pos = (terminal_width - len(header)) // 2
-        output += self.term.move_xy(header_pos, 1) + self.term.cyan + header + self.term.normal
+        self._prev_selection = menu_selection
+        output = chrome + output.encode('utf-8')
+        self._write(output)
+        return output
+    
+    def update_save_menu(self, saves, menu_selection, story_engine):
+        """Redraw only the parts of the save menu affected by a selection change.
         
-        # Instructions at the bottom
-        if saves:
-            instructions = "Use ↑/↓ to navigate, Enter to select, Esc to cancel"
-            instructions_pos = (terminal_width - len(instructions)) // 2
-            output += self.term.move_xy(instructions_pos, terminal_height - 2) + \
-                  self.term.cyan + instructions + self.term.normal
+        Args:
+            saves: List of save game dictionaries
+            menu_selection: Current menu selection index
+            story_engine: Reference to the story engine for current story display
+        """
+        if self._needs_full_redraw():
+            return self.display_save_menu(saves, menu_selection, story_engine)
+        
+        output = self._draw_save_menu_row(self._prev_selection, False)
+        output += self._draw_save_menu_row(menu_selection, True)
+        output += self._clear_right_panel()
+        output += self._draw_save_menu_panel(saves, menu_selection, story_engine)
+        
+        self._prev_selection = menu_selection
+        output = output.encode('utf-8')
+        self._write(output)
+        return output
+    
+    def display_load_menu(self, saves, menu_selection):
+        """Display the load game menu with a split screen layout.
         
-        # Left panel - save list
-        left_panel_y = 3
-        output += self.term.move_xy(2, left_panel_y) + self.term.underline + \
-              "Saved Reality Fragments".ljust(left_width) + self.term.normal
+        Args:
+            saves: List of save game dictionaries
+            menu_selection: Current menu selection index
+        """
+        self._update_layout()
+        self._build_save_view(saves)
+        
+        chrome = self._static_chrome(
+            "=== LOAD REALITY FRAGMENT ===",
+            "Saved Reality Fragments",
+            instructions="Use ↑/↓ to navigate, Enter to select, Esc to cancel" if saves else None,
+            right_title="Story Preview" if saves else None
+        )
         
         # Display available saves
+        output = ""
         if not saves:
-            left_panel_y += 2
-            output += self.term.move_xy(2, left_panel_y) + self.term.yellow + \
+            output += self.term.move_xy(2, 5) + self.term.yellow + \
                   "No saved games found." + self.term.normal
-            output += self.term.move_xy(2, left_panel_y + 2) + \
+            output += self.term.move_xy(2, 7) + \
                   "Press Esc to return."
         else:
-            for i, save in enumerate(saves):
-                timestamp = save.get('timestamp', 'Unknown')
-                if isinstance(timestamp, str) and timestamp != 'Unknown':
-                    try:
-                        # Try to parse ISO format timestamp
-                        dt = datetime.fromisoformat(timestamp)
-                        timestamp = dt.strftime("%Y-%m-%d %H:%M")
-                    except (ValueError, TypeError):
-                        # Keep original if parsing fails
-                        pass
-                
-                title = save.get('title', 'Untitled save')
-                
-                # Truncate title if too long
-                if len(title) > left_width - 5:
-                    title = title[:left_width - 8] + "..."
-                
-                left_panel_y += 2
-                if i == menu_selection:
-                    output += self.term.move_xy(2, left_panel_y) + self.term.green + \
-                          f"> {i+1}. {title}" + self.term.normal
-                    output += self.term.move_xy(5, left_panel_y + 1) + self.term.green + \
-                          f"({timestamp})" + self.term.normal
-                else:
-                    output += self.term.move_xy(2, left_panel_y) + \
-                          f"  {i+1}. {title}"
-                    output += self.term.move_xy(5, left_panel_y + 1) + \
-                          f"({timestamp})"
+            for i in range(len(saves)):
+                output += self._draw_load_menu_row(i, i == menu_selection)
+            
+            # Right panel - Preview/Summary
+            output += self._draw_load_menu_panel(saves, menu_selection)
         
-        # Draw a vertical line to separate panels
-        for y in range(3, terminal_height - 3):
-            output += self.term.move_xy(left_width + 2, y) + "│"
+        self._prev_selection = menu_selection
+        output = chrome + output.encode('utf-8')
+        self._write(output)
+        return output
+    
+    def update_load_menu(self, saves, menu_selection):
+        """Redraw only the parts of the load menu affected by a selection change.
         
-        # Right panel - Preview/Summary
-        if saves:
-            right_panel_x = left_width + 4
-            right_panel_y = 3
-            
-            output += self.term.move_xy(right_panel_x, right_panel_y) + self.term.underline + \
-                  "Story Preview".ljust(right_width) + self.term.normal
-            
-            right_panel_y += 2
-            
-            # Show preview of the selected save
-            selected_save = saves[menu_selection]
-            preview_text = f"Fragment: {selected_save.get('title', 'Untitled')}"
-            output += self.term.move_xy(right_panel_x, right_panel_y) + self.term.bold + preview_text + self.term.normal
-            
-            # Get the story summary from the save
-            story_summary = selected_save.get('summary', 'No preview available')
-            
-            # Wrap text to fit the right panel and left-align
-            right_panel_y += 2
-            summary_lines = 0
-            for line in self.ui.wrap_text(story_summary, right_width):
-                output += self.term.move_xy(right_panel_x, right_panel_y) + line
-                right_panel_y += 1
-                summary_lines += 1
-                if right_panel_y >= terminal_height - 6:  # Leave room for choices
-                    break
-            
-            # Display choices from the save if available
-            choices_preview = selected_save.get('choices_preview', '')
-            if choices_preview and summary_lines < terminal_height - 10:
-                # Extract choices from the choices_preview text
-                choices = []
-                for line in choices_preview.split('\n'):
-                    if line.startswith('- '):
-                        choices.append(line[2:])  # Remove the "- " prefix
-                
-                if choices:
-                    right_panel_y += 1
-                    output += self.term.move_xy(right_panel_x, right_panel_y) + self.term.bold + "Choices at Save Point:" + self.term.normal
-                    right_panel_y += 1
-                    
-                    for i, choice in enumerate(choices, 1):
-                        # Truncate choice if too long
-                        if len(choice) > right_width - 5:
-                            choice = choice[:right_width - 8] + "..."
-                        
-                        output += self.term.move_xy(right_panel_x, right_panel_y) + f"{i}. {choice}"
-                        right_panel_y += 1
-                        if right_panel_y >= terminal_height - 3:
-                            break
-        
-        print(output)
-        return output 
\ No newline at end of file
+        Args:
+            saves: List of save game dictionaries
+            menu_selection: Current menu selection index
+        """
+        if not saves or self._needs_full_redraw():
+            return self.display_load_menu(saves, menu_selection)
+        
+        output = self._draw_load_menu_row(self._prev_selection, False)
+        output += self._draw_load_menu_row(menu_selection, True)
+        output += self._clear_right_panel()
+        output += self._draw_load_menu_panel(saves, menu_selection)
+        
+        self._prev_selection = menu_selection
+        output = output.encode('utf-8')
+        self._write(output)
+        return output
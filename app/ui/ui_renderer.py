@@ -1,11 +1,33 @@
+import functools
 import blessed
 
+@functools.lru_cache(maxsize=32)
+def _box_template(width, height):
+    """Build the border lines of a box of the given size."""
+    top = "╔" + "═" * (width-2) + "╗"
+    side = "║" + " " * (width-2) + "║"
+    bottom = "╚" + "═" * (width-2) + "╝"
+    return (top,) + (side,) * (height-2) + (bottom,)
+
+@functools.lru_cache(maxsize=32)
+def _box_rows(width, height, title, title_style, normal):
+    """Build the rows of a box with its title already set into the top border."""
+    rows = _box_template(width, height)
+    if not title:
+        return rows
+    top = rows[0]
+    title_pos = (width - len(title)) // 2
+    top = top[:title_pos] + title_style + f" {title} " + normal + top[title_pos + len(title) + 2:]
+    return (top,) + rows[1:]
+
 class UIRenderer:
     """Handles common UI rendering operations for the Reality Glitch game."""
     
     def __init__(self, terminal=None):
         """Initialize the UI renderer with terminal settings."""
         self.term = terminal or blessed.Terminal()
+        # Cursor moves repeat across redraws, so cache the strings
+        self._move_xy = functools.lru_cache(maxsize=4096)(self.term.move_xy)
         
         # Simplified color scheme inspired by terminal aesthetics
         self.text_color = self.term.teal  # Main text color
@@ -16,20 +38,11 @@ class UIRenderer:
     
     def draw_box(self, x, y, width, height, title=""):
         """Draw a box with optional title."""
-        # Top border with title
-        box_output = self.term.move_xy(x, y) + "╔" + "═" * (width-2) + "╗"
-        if title:
-            title_pos = x + (width - len(title)) // 2
-            box_output += self.term.move_xy(title_pos, y) + self.term.bold + f" {title} " + self.term.normal
-            
-        # Side borders
-        for i in range(y+1, y+height-1):
-            box_output += self.term.move_xy(x, i) + "║" + " " * (width-2) + "║"
-            
-        # Bottom border
-        box_output += self.term.move_xy(x, y+height-1) + "╚" + "═" * (width-2) + "╝"
-        
-        return box_output
+        # Rows, title included, are shared by all boxes of the same size and title
+        return "".join(
+            self._move_xy(x, y + i) + line
+            for i, line in enumerate(_box_rows(width, height, title, self.term.bold, self.term.normal))
+        )
     
     def wrap_text(self, text, width):
         """Wrap text to fit within a specified width."""
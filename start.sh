@@ -62,6 +62,9 @@ scheduler_pid=$!
 # Set the Python path to include the project root
 export PYTHONPATH=$(pwd)
 
+# On CPython 3.13+ builds that include the experimental JIT, run with
+# PYTHONJIT=1 ./start.sh to try it; it stays off unless you set it
+
 # Check if debug mode was requested
 if [ "$1" = "--debug" ]; then
     echo "Starting Reality Glitch in debug mode..."